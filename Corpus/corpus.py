@@ -0,0 +1,111 @@
+import os
+import sys
+import mmap
+from collections import OrderedDict
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+from patricia import PatriciaTrie
+from hybrid_trie import HybridTrie
+
+# Lecture des corpus : le fichier est projeté en mémoire (mmap) et découpé en blocs
+# d'environ CHUNK_SIZE octets, coupés sur un blanc ASCII pour ne jamais couper un mot
+# (ni un caractère UTF-8). Chaque bloc est décodé, normalisé et découpé en une fois
+# (str.lower().split()) au lieu d'un strip()/lower() par ligne.
+# Les mots d'un fichier lu en entier sont gardés en cache : une seconde passe sur le
+# même fichier (même date et même taille) ne le relit pas. Le cache est un LRU d'au
+# plus CACHE_SIZE fichiers : le moins récemment lu est retiré au-delà.
+CHUNK_SIZE = 1 << 20
+CACHE_SIZE = 8
+ASCII_WHITESPACE = (b"\n", b" ", b"\t", b"\r", b"\x0b", b"\x0c")
+
+# (chemin absolu, lower) -> (date, taille, tuple des mots), du moins au plus récent
+_cache = OrderedDict()
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def _blocs(path, chunk_size):
+    """Les blocs d'octets du fichier, chacun terminé par un blanc (ou la fin du fichier)"""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap refuse les fichiers vides
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                cut = end
+                if end < size:
+                    # Reculer jusqu'au dernier blanc ; un mot plus long qu'un bloc l'agrandit
+                    cut = max(mm.rfind(blank, start, end) for blank in ASCII_WHITESPACE) + 1
+                    while cut <= start and end < size:
+                        end = min(end + chunk_size, size)
+                        cut = max(mm.rfind(blank, start, end) for blank in ASCII_WHITESPACE) + 1
+                    if cut <= start:
+                        cut = size
+                yield mm[start:cut]
+                start = cut
+
+def lots(path, lower=True, chunk_size=CHUNK_SIZE):
+    """
+    Les mots du fichier path (séparés par des blancs, en minuscules si lower), par
+    lots : une liste par bloc lu. Si le fichier est en cache, un seul lot est rendu.
+    Un fichier parcouru jusqu'au bout est mis en cache. Lève FileNotFoundError.
+    """
+    key = (os.path.abspath(path), lower)
+    signature = _signature(path)
+    cached = _cache.get(key)
+    if cached is not None and cached[:2] == signature:
+        _cache.move_to_end(key)
+        if cached[2]:
+            yield cached[2]
+        return
+
+    words = []
+    for block in _blocs(path, chunk_size):
+        text = block.decode("utf-8")
+        batch = (text.lower() if lower else text).split()
+        words.extend(batch)
+        yield batch
+    _cache[key] = signature + (tuple(words),)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+def mots(path, lower=True):
+    """Tous les mots du fichier path, dans l'ordre (tuple, partagé par le cache)"""
+    for _ in lots(path, lower):
+        pass
+    return _cache[(os.path.abspath(path), lower)][2]
+
+def oublier(path=None):
+    """Vider le cache (pour un seul fichier si path est donné)"""
+    if path is None:
+        _cache.clear()
+        return
+    for lower in (True, False):
+        _cache.pop((os.path.abspath(path), lower), None)
+
+
+def inserer_lot(trie, words):
+    """Insérer un lot de mots par l'insertion groupée du trie"""
+    if isinstance(trie, PatriciaTrie):
+        trie.inserer_many(words)
+    elif isinstance(trie, HybridTrie):
+        trie.insert_many(words)
+    else:
+        raise TypeError(f"unsupported trie type {type(trie).__name__}")
+
+def remplir(trie, path, lower=True, chunk_size=CHUNK_SIZE):
+    """Insérer dans trie les mots du fichier path, lot par lot ; retourne le nombre de mots lus"""
+    count = 0
+    for batch in lots(path, lower, chunk_size):
+        inserer_lot(trie, batch)
+        count += len(batch)
+    return count
@@ -0,0 +1,109 @@
+import os
+import sys
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+import corpus
+from corpus import PatriciaTrie, HybridTrie
+from patricia import liste_mots
+
+# Tests de la lecture des corpus et des insertions groupées : python test_corpus.py (ou pytest)
+
+
+def mots_aleatoires(n, seed=0, alphabet="abcd", longueur=6):
+    """n mots aléatoires (doublons et préfixes communs fréquents)"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, longueur))) for _ in range(n)]
+
+def ecrire(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_lots_blocs_coupes_sur_un_blanc():
+    # Petits blocs : mots plus longs qu'un bloc, caractères UTF-8 sur plusieurs octets
+    text = "Être ou\tne pas\nêtre, voilà\r\nla QUESTION " + "x" * 40 + "\n\n  fin"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "corpus.txt")
+        ecrire(path, text)
+        for chunk_size in (1, 3, 7, 1 << 20):
+            corpus.oublier()
+            words = [word for batch in corpus.lots(path, chunk_size=chunk_size) for word in batch]
+            assert words == text.lower().split()
+        assert list(corpus.mots(path, lower=False)) == text.split()
+
+def test_cache_invalide_si_fichier_modifie():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "corpus.txt")
+        ecrire(path, "a b c")
+        first = corpus.mots(path)
+        assert corpus.mots(path) is first
+        ecrire(path, "a b c d")
+        assert corpus.mots(path) == ("a", "b", "c", "d")
+        corpus.oublier(path)
+
+def test_cache_borne():
+    # Au plus CACHE_SIZE fichiers gardés, le moins récemment lu est retiré
+    corpus.oublier()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [os.path.join(tmp_dir, f"corpus{i}.txt") for i in range(corpus.CACHE_SIZE + 2)]
+        for i, path in enumerate(paths):
+            ecrire(path, f"mot{i}")
+        first = corpus.mots(paths[0])
+        for path in paths[1:corpus.CACHE_SIZE]:
+            corpus.mots(path)
+        # Relire le premier le rend le plus récent : c'est le deuxième qui sort
+        assert corpus.mots(paths[0]) is first
+        corpus.mots(paths[corpus.CACHE_SIZE])
+        assert len(corpus._cache) == corpus.CACHE_SIZE
+        assert corpus.mots(paths[0]) is first
+        cached = {key[0] for key in corpus._cache}
+        assert paths[1] not in cached and paths[corpus.CACHE_SIZE] in cached
+        corpus.mots(paths[corpus.CACHE_SIZE + 1])
+        assert len(corpus._cache) == corpus.CACHE_SIZE
+        assert corpus.mots(paths[1]) == ("mot1",)
+    corpus.oublier()
+
+def test_inserer_many_patricia():
+    words = mots_aleatoires(300)
+    reference = PatriciaTrie()
+    for word in words:
+        reference.inserer(word)
+    # Trie vide (from_sorted) puis trie déjà rempli (insertions triées)
+    trie = PatriciaTrie()
+    trie.inserer_many(words[:150])
+    trie.inserer_many(iter(words[150:]))
+    assert trie.to_dict() == reference.to_dict()
+
+def test_insert_many_hybrid():
+    words = mots_aleatoires(300)
+    trie = HybridTrie()
+    trie.insert_many(words[:150])
+    assert trie.liste_mots() == sorted(set(words[:150]))
+    # Trie déjà rempli : même forme que des insert un par un, dans l'ordre donné
+    reference = HybridTrie.from_dict(trie.to_dict())
+    for word in words[150:]:
+        reference.insert(word)
+    trie.insert_many(words[150:] + [""])
+    assert trie.to_dict() == reference.to_dict()
+
+def test_remplir():
+    words = mots_aleatoires(500)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "corpus.txt")
+        ecrire(path, "\n".join(words))
+        for trie in (PatriciaTrie(), HybridTrie()):
+            corpus.oublier()
+            assert corpus.remplir(trie, path, chunk_size=64) == len(words)
+            found = liste_mots(trie) if isinstance(trie, PatriciaTrie) else trie.liste_mots()
+            assert found == sorted(set(words))
+        corpus.oublier(path)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,191 @@
+class DawgNode:
+    """État de l'automate : fin de mot, transitions (caractère -> état) et nombre de mots reconnus depuis cet état"""
+    __slots__ = ("final", "edges", "count", "id")
+
+    def __init__(self, node_id):
+        self.final = False
+        self.edges = {}
+        self.count = 0
+        self.id = node_id
+
+    def signature(self):
+        """Deux états de même signature reconnaissent les mêmes suffixes"""
+        return (self.final, tuple((char, child.id) for char, child in self.edges.items()))
+
+
+class Dawg:
+    """
+    Automate acyclique minimal des mots (DAWG) : comme un trie, mais les suffixes
+    communs (« -eth », « -est », « -ing »...) ne sont stockés qu'une fois.
+    Construction incrémentale à partir des mots triés (algorithme de Daciuk) :
+    seul le chemin du dernier mot inséré reste à minimiser ; dès qu'un mot s'en
+    écarte, les états abandonnés sont remplacés par un état équivalent du registre
+    ou y sont ajoutés.
+    """
+    def __init__(self, words=()):
+        self._next_id = 0
+        self.root = self._new_node()
+        self.operation_count = {
+            "insert_comparisons": 0,
+            "search_comparisons": 0,
+            "delete_comparisons": 0
+        }
+        # Registre des états minimisés : signature -> état
+        self._register = {}
+        # Chemin du dernier mot pas encore minimisé : (parent, caractère, enfant)
+        self._unchecked = []
+        previous = ""
+        for word in sorted(set(words)):
+            self._add(previous, word)
+            previous = word
+        self._minimize(0)
+        # Le registre ne sert qu'à la construction
+        self._register = None
+        self.root.count = self.root.final + sum(child.count for child in self.root.edges.values())
+
+    @classmethod
+    def from_sorted(cls, words):
+        """Construire l'automate à partir d'un vocabulaire (trié puis dédoublonné)"""
+        return cls(words)
+
+    def _new_node(self):
+        node = DawgNode(self._next_id)
+        self._next_id += 1
+        return node
+
+    def _add(self, previous, word):
+        """Ajouter word, strictement plus grand que previous"""
+        common = 0
+        limit = min(len(word), len(previous))
+        while common < limit and word[common] == previous[common]:
+            common += 1
+        self.operation_count["insert_comparisons"] += common + (common < limit)
+
+        # La partie du chemin précédent après le préfixe commun ne changera plus
+        self._minimize(common)
+        node = self._unchecked[-1][2] if self._unchecked else self.root
+        for char in word[common:]:
+            child = self._new_node()
+            node.edges[char] = child
+            self._unchecked.append((node, char, child))
+            node = child
+        node.final = True
+
+    def _minimize(self, down_to):
+        """Remplacer ou enregistrer les états du chemin non minimisé, jusqu'à la profondeur down_to"""
+        register = self._register
+        while len(self._unchecked) > down_to:
+            parent, char, child = self._unchecked.pop()
+            signature = child.signature()
+            existing = register.get(signature)
+            if existing is not None:
+                parent.edges[char] = existing
+            else:
+                # Les enfants sont déjà minimisés : leur compte est définitif
+                child.count = child.final + sum(grandchild.count for grandchild in child.edges.values())
+                register[signature] = child
+
+
+def recherche(arbre, m):
+    """une fonction de recherche d’un mot dans un dictionnaire"""
+    node = arbre.root
+    comparisons = 0
+    for char in m:
+        comparisons += 1
+        node = node.edges.get(char)
+        if node is None:
+            break
+    arbre.operation_count["search_comparisons"] += comparisons
+    return node is not None and node.final
+
+def comptage_mots(arbre):
+    """une fonction qui compte les mots présents dans le dictionnaire"""
+    return arbre.root.count
+
+def prefixe(arbre, mot):
+    """Compter les mots qui commencent par mot (le préfixe lui-même compris), O(|mot|)"""
+    node = arbre.root
+    for char in mot:
+        node = node.edges.get(char)
+        if node is None:
+            return 0
+    return node.count
+
+def iter_words(arbre, prefix=None, limit=None):
+    """
+    Générer, dans l'ordre lexicographique, les mots qui commencent par prefix
+    (tous si prefix is None), au plus limit mots.
+    """
+    if limit is not None and limit <= 0:
+        return
+    node = arbre.root
+    buffer = []
+    for char in prefix or "":
+        node = node.edges.get(char)
+        if node is None:
+            return
+        buffer.append(char)
+
+    count = 0
+    if node.final:
+        yield "".join(buffer)
+        count += 1
+        if count == limit:
+            return
+    stack = [iter(sorted(node.edges.items()))]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            if stack:
+                buffer.pop()
+            continue
+        char, child = item
+        buffer.append(char)
+        if child.final:
+            yield "".join(buffer)
+            count += 1
+            if count == limit:
+                return
+        stack.append(iter(sorted(child.edges.items())))
+
+def liste_mots(arbre):
+    """Extraire tous les mots de l'automate et retourner une liste triée"""
+    return list(iter_words(arbre))
+
+def comptage_noeuds(arbre):
+    """Compter les états distincts de l'automate"""
+    seen = {arbre.root.id}
+    stack = [arbre.root]
+    while stack:
+        node = stack.pop()
+        for child in node.edges.values():
+            if child.id not in seen:
+                seen.add(child.id)
+                stack.append(child)
+    return len(seen)
+
+def comptage_transitions(arbre):
+    """Compter les transitions (arêtes) de l'automate"""
+    seen = {arbre.root.id}
+    count = 0
+    stack = [arbre.root]
+    while stack:
+        node = stack.pop()
+        count += len(node.edges)
+        for child in node.edges.values():
+            if child.id not in seen:
+                seen.add(child.id)
+                stack.append(child)
+    return count
+
+
+if __name__ == "__main__":
+    # test
+    dawg = Dawg(["cat", "car", "cart", "bat", "batt", "dog", "cats", "dogs"])
+    print("there is " + str(comptage_mots(dawg)) + " mots in the automate")
+    print(liste_mots(dawg))
+    print("nb etats " + str(comptage_noeuds(dawg)) + ", nb transitions " + str(comptage_transitions(dawg)))
+    print("nb prefix 'ca' = " + str(prefixe(dawg, "ca")))
+    print("Is car in the automate: " + str(recherche(dawg, "car")))
+    print("Is ca in the automate: " + str(recherche(dawg, "ca")))
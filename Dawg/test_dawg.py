@@ -0,0 +1,45 @@
+import os
+import sys
+import random
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+from dawg import Dawg, recherche, comptage_mots, prefixe, iter_words, liste_mots, comptage_noeuds
+import patricia
+
+# Tests de l'automate minimal : python test_dawg.py (ou pytest)
+# Chaque requête est comparée à celle d'un PatriciaTrie construit sur les mêmes mots.
+
+
+def mots_aleatoires(n, seed=0, alphabet="abcdé", longueur=6):
+    """n mots aléatoires (doublons, préfixes communs et caractères non ASCII)"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, longueur))) for _ in range(n)]
+
+
+def test_memes_requetes_que_patricia():
+    words = mots_aleatoires(400) + [""]
+    dawg = Dawg.from_sorted(words)
+    trie = patricia.PatriciaTrie.from_sorted(words)
+    assert comptage_mots(dawg) == patricia.comptage_mots(trie)
+    assert liste_mots(dawg) == patricia.liste_mots(trie)
+    for word in mots_aleatoires(300, seed=1) + ["", "a", "zz", "abcdéabcdé"]:
+        assert recherche(dawg, word) == patricia.recherche(trie, word)
+        assert prefixe(dawg, word) == patricia.prefixe(trie, word)
+        assert list(iter_words(dawg, word, limit=5)) == list(patricia.iter_words(trie, word, limit=5))
+    assert liste_mots(Dawg()) == []
+
+def test_suffixes_partages():
+    # tap / taps / top / tops : « a » et « o » mènent au même état, ainsi que les deux « p »
+    dawg = Dawg(["tops", "tap", "taps", "top", "tap"])
+    assert liste_mots(dawg) == ["tap", "taps", "top", "tops"]
+    # racine, t, {a, o}, p (final), s (final)
+    assert comptage_noeuds(dawg) == 5
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,39 @@
+import os
+import sys
+import json
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+sys.path.append(os.path.join(current_dir, "../Journal"))
+from frozen_trie import FrozenTrie
+import journal
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python frozen_compile.py <x> <arbre.json> [output.frz]")
+        sys.exit(1)
+
+    x = int(sys.argv[1])  # 0 = Patricia, 1 = Trie hybride
+    input_file = sys.argv[2]
+    output_file = sys.argv[3] if len(sys.argv) > 3 else os.path.splitext(input_file)[0] + ".frz"
+
+    try:
+        trie = journal.charger(x, input_file)
+    except FileNotFoundError:
+        print(f"Error: File {input_file} not found.")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error decoding JSON from {input_file}: {e}")
+        sys.exit(1)
+
+    try:
+        FrozenTrie.compile(trie, output_file)
+        print(f"Frozen trie has been saved to {output_file}")
+    except IOError as e:
+        print(f"Error saving frozen trie to {output_file}: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
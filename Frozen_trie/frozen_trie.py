@@ -0,0 +1,181 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+
+# Fichier « gelé » : trie compressé (style Patricia) sur les octets UTF-8 des mots,
+# lu directement dans un mmap, sans désérialisation.
+# En-tête : magique, version, nombre de nœuds, nombre de mots.
+# Nœud    : NODE (mots du sous-arbre, longueur du label en u32, fin de mot, nombre
+#           d'enfants), puis le label, puis le premier octet de chaque enfant (triés),
+#           puis le décalage (u32) de chaque enfant dans le fichier.
+# Version 2 : longueur du label sur 32 bits (16 bits en version 1).
+FROZEN_MAGIC = b"FRZT"
+FROZEN_VERSION = 2
+FROZEN_HEADER = struct.Struct("<4sBxxxII")
+NODE = struct.Struct("<IIBxH")
+OFFSET = struct.Struct("<I")
+
+
+class FrozenTrie:
+    """
+    Dictionnaire en lecture seule, compilé depuis un HybridTrie ou un PatriciaTrie.
+    L'ouverture ne fait qu'un mmap du fichier : le démarrage est O(1) quelle que soit
+    la taille du dictionnaire, et plusieurs processus partagent le même cache de pages.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < FROZEN_HEADER.size:
+            self.close()
+            raise ValueError(f"{file_path}: truncated header")
+        magic, version, self.node_count, self.word_count = FROZEN_HEADER.unpack_from(self._mm, 0)
+        if magic != FROZEN_MAGIC:
+            self.close()
+            raise ValueError(f"{file_path}: not a frozen trie")
+        if version != FROZEN_VERSION:
+            self.close()
+            raise ValueError(f"{file_path}: unsupported version {version}")
+        self._root = FROZEN_HEADER.size
+
+    def close(self):
+        """Libérer le mmap"""
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def is_frozen(file_path):
+        """Vérifier si un fichier est un trie gelé (d'après son nombre magique)"""
+        try:
+            with open(file_path, "rb") as f:
+                return f.read(len(FROZEN_MAGIC)) == FROZEN_MAGIC
+        except (FileNotFoundError, IsADirectoryError):
+            # Pas d'instantané (trie seulement décrit par son journal) ou instantané
+            # partagé (dossier) : pas un trie gelé
+            return False
+
+    def _find(self, key, prefix_mode):
+        """
+        Descendre selon key (octets). Retourne le décalage du nœud atteint, ou None.
+        En mode préfixe, la clé peut s'arrêter au milieu d'un label.
+        """
+        mm = self._mm
+        node = self._root
+        pos = 0
+        length = len(key)
+        while pos < length:
+            _, label_len, _, nchildren = NODE.unpack_from(mm, node)
+            table = node + NODE.size + label_len
+            i = mm.find(key[pos:pos + 1], table, table + nchildren)
+            if i < 0:
+                return None
+            child = OFFSET.unpack_from(mm, table + nchildren + OFFSET.size * (i - table))[0]
+            child_label_len = NODE.unpack_from(mm, child)[1]
+            label = child + NODE.size
+            step = min(child_label_len, length - pos)
+            if mm[label:label + step] != key[pos:pos + step]:
+                return None
+            if step < child_label_len:
+                return child if prefix_mode else None
+            pos += step
+            node = child
+        return node
+
+    def recherche(self, word):
+        """Rechercher si un mot existe"""
+        node = self._find(word.encode("utf-8"), False)
+        return node is not None and bool(NODE.unpack_from(self._mm, node)[2])
+
+    def prefixe(self, prefix):
+        """Compter les mots qui commencent par prefix (le préfixe lui-même compris)"""
+        node = self._find(prefix.encode("utf-8"), True)
+        if node is None:
+            return 0
+        return NODE.unpack_from(self._mm, node)[0]
+
+    def comptage_mots(self):
+        """Nombre de mots du dictionnaire"""
+        return self.word_count
+
+    @staticmethod
+    def compile(source, file_path):
+        """
+        Compiler source (HybridTrie, PatriciaTrie ou itérable de mots) dans file_path.
+        """
+        words = sorted(set(word.encode("utf-8") for word in _words_of(source)))
+
+        # Construction en mémoire : [label, fin de mot, mots du sous-arbre, enfants]
+        nodes = []
+        tasks = [(0, len(words), 0, None)]
+        while tasks:
+            lo, hi, start, parent = tasks.pop()
+            if parent is None:
+                lcp = 0  # la racine a un label vide (et peut n'avoir aucun mot)
+            else:
+                first, last = words[lo], words[hi - 1]
+                lcp = start
+                limit = min(len(first), len(last))
+                while lcp < limit and first[lcp] == last[lcp]:
+                    lcp += 1
+            node = [words[lo][start:lcp] if lo < hi else b"", False, hi - lo, []]
+            index = len(nodes)
+            nodes.append(node)
+            if parent is not None:
+                nodes[parent][3].append((words[lo][start], index))
+
+            if lo < hi and len(words[lo]) == lcp:
+                node[1] = True
+                lo += 1
+            while lo < hi:
+                byte = words[lo][lcp]
+                end = bisect_left(words, words[lo][:lcp] + bytes([byte + 1]), lo + 1, hi)
+                tasks.append((lo, end, lcp, index))
+                lo = end
+
+        # Décalages : les nœuds sont écrits dans l'ordre de création
+        offsets = []
+        cursor = FROZEN_HEADER.size
+        for label, _, _, children in nodes:
+            offsets.append(cursor)
+            cursor += NODE.size + len(label) + len(children) * (1 + OFFSET.size)
+
+        # Fichier temporaire puis remplacement atomique : une erreur en cours
+        # d'écriture ne laisse pas de fichier gelé tronqué
+        temp_path = file_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(FROZEN_HEADER.pack(FROZEN_MAGIC, FROZEN_VERSION, len(nodes), len(words)))
+            for label, is_end, count, children in nodes:
+                children.sort()
+                f.write(NODE.pack(count, len(label), is_end, len(children)))
+                f.write(label)
+                f.write(bytes(byte for byte, _ in children))
+                for _, child in children:
+                    f.write(OFFSET.pack(offsets[child]))
+        os.replace(temp_path, file_path)
+
+
+def _words_of(source):
+    """Mots d'un HybridTrie, d'un PatriciaTrie ou d'un itérable de mots"""
+    if hasattr(source, "iter_words"):
+        return source.iter_words()
+    if hasattr(source, "end_marker"):
+        return _patricia_words(source)
+    return source
+
+
+def _patricia_words(trie):
+    """Parcourir un PatriciaTrie sans dépendre du module patricia"""
+    stack = [(trie.root, "")]
+    while stack:
+        node, prefix = stack.pop()
+        word = prefix + node.label
+        if word.endswith(trie.end_marker):
+            yield word[:-1]
+        for child in node.child_nodes():
+            stack.append((child, word))
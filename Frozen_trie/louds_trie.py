@@ -0,0 +1,327 @@
+from array import array
+from bisect import bisect_left
+
+# Représentation succincte (LOUDS) d'un PatriciaTrie, en lecture seule.
+# Les nœuds sont numérotés dans l'ordre du parcours en largeur (racine = 0) :
+# - louds   : « 10 » puis, pour chaque nœud, un 1 par enfant suivi d'un 0
+# - first   : premier caractère du label de chaque nœud (sauf la racine)
+# - tails   : reste des labels, mis bout à bout
+# - bounds  : pour chaque nœud, un 1 suivi d'un 0 par caractère de son reste de label
+# - ends    : 1 si le label du nœud se termine par end_marker (fin de mot, toujours une feuille)
+# Les enfants d'un nœud ont des numéros consécutifs et sont triés par premier caractère.
+END_MARKER = chr(0x00)
+MASK64 = (1 << 64) - 1
+
+
+class BitVector:
+    """
+    Vecteur de bits statique avec rank (nombre de 1 avant une position) et select
+    (position du k-ième 1 ou 0). Les bits sont rangés dans des mots de 64 bits ;
+    le répertoire garde deux compteurs 32 bits (nombre de 1 et de 0 avant le bloc)
+    par bloc de 512 bits.
+    """
+    def __init__(self, bits):
+        words = array("Q")
+        current = 0
+        length = 0
+        for bit in bits:
+            if bit:
+                current |= 1 << (length & 63)
+            length += 1
+            if not length & 63:
+                words.append(current)
+                current = 0
+        if length & 63:
+            words.append(current)
+
+        # blocks[b] / zero_blocks[b] = nombre de 1 / de 0 avant le mot 8 * b
+        # (une entrée de plus pour la fin)
+        blocks = array("I")
+        zero_blocks = array("I")
+        ones = 0
+        for i, word in enumerate(words):
+            if not i & 7:
+                blocks.append(ones)
+                zero_blocks.append(i * 64 - ones)
+            ones += word.bit_count()
+        blocks.append(ones)
+        zero_blocks.append(len(words) * 64 - ones)
+
+        self.length = length
+        self.ones = ones
+        self._words = words
+        self._blocks = blocks
+        self._zero_blocks = zero_blocks
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, position):
+        return (self._words[position >> 6] >> (position & 63)) & 1
+
+    def rank1(self, position):
+        """Nombre de 1 dans [0, position)"""
+        words = self._words
+        word_index = position >> 6
+        count = self._blocks[word_index >> 3]
+        for i in range((word_index >> 3) << 3, word_index):
+            count += words[i].bit_count()
+        if position & 63:
+            count += (words[word_index] & ((1 << (position & 63)) - 1)).bit_count()
+        return count
+
+    def select1(self, k):
+        """Position du k-ième 1 (k >= 1)"""
+        blocks = self._blocks
+        # Dernier bloc qui commence avec moins de k uns
+        low = bisect_left(blocks, k) - 1
+        k -= blocks[low]
+        words = self._words
+        i = low << 3
+        while True:
+            count = words[i].bit_count()
+            if count >= k:
+                break
+            k -= count
+            i += 1
+        return (i << 6) + _select_in_word(words[i], k)
+
+    def select0(self, k):
+        """Position du k-ième 0 (k >= 1)"""
+        zero_blocks = self._zero_blocks
+        low = bisect_left(zero_blocks, k) - 1
+        k -= zero_blocks[low]
+        words = self._words
+        i = low << 3
+        while True:
+            count = 64 - words[i].bit_count()
+            if count >= k:
+                break
+            k -= count
+            i += 1
+        return (i << 6) + _select_in_word(~words[i] & MASK64, k)
+
+    def next1(self, position):
+        """Position du premier 1 à partir de position (il doit exister)"""
+        words = self._words
+        i = position >> 6
+        word = words[i] >> (position & 63)
+        if word:
+            return position + (word & -word).bit_length() - 1
+        i += 1
+        while not words[i]:
+            i += 1
+        word = words[i]
+        return (i << 6) + (word & -word).bit_length() - 1
+
+    def next0(self, position):
+        """Position du premier 0 à partir de position (il doit exister)"""
+        words = self._words
+        i = position >> 6
+        word = (~words[i] & MASK64) >> (position & 63)
+        if word:
+            return position + (word & -word).bit_length() - 1
+        i += 1
+        while words[i] == MASK64:
+            i += 1
+        word = ~words[i] & MASK64
+        return (i << 6) + (word & -word).bit_length() - 1
+
+    def nbytes(self):
+        """Mémoire occupée par les tableaux du vecteur"""
+        return (
+            self._words.itemsize * len(self._words)
+            + self._blocks.itemsize * len(self._blocks)
+            + self._zero_blocks.itemsize * len(self._zero_blocks)
+        )
+
+
+# SELECT_IN_BYTE[octet][k] = position du (k+1)-ième bit à 1 de l'octet
+SELECT_IN_BYTE = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def _select_in_word(word, k):
+    """Position du k-ième bit à 1 d'un mot (octet par octet, puis table)"""
+    shift = 0
+    while True:
+        byte = (word >> shift) & 0xFF
+        positions = SELECT_IN_BYTE[byte]
+        if len(positions) >= k:
+            return shift + positions[k - 1]
+        k -= len(positions)
+        shift += 8
+
+
+class LoudsTrie:
+    """
+    Dictionnaire succinct en lecture seule, exporté d'un PatriciaTrie terminé.
+    La structure tient dans quelques bits par nœud plus les caractères des labels ;
+    recherche, prefixe et l'énumération ordonnée travaillent directement dessus.
+    """
+    def __init__(self, louds, first, tails, bounds, ends):
+        self._louds = louds
+        self._first = first
+        self._tails = tails
+        self._bounds = bounds
+        self._ends = ends
+        self.node_count = ends.length
+        self.word_count = ends.ones
+
+    @classmethod
+    def from_patricia(cls, trie):
+        """Encoder un PatriciaTrie (parcours en largeur, enfants triés par clé)"""
+        louds_bits = [1, 0]
+        first = []
+        tails = []
+        bound_bits = []
+        end_bits = []
+
+        level = [trie.root]
+        while level:
+            next_level = []
+            for node in level:
+                children = [child for _, child in node.child_items()]
+                louds_bits.extend([1] * len(children))
+                louds_bits.append(0)
+                if node is trie.root:
+                    tail = node.label
+                else:
+                    first.append(node.label[0])
+                    tail = node.label[1:]
+                tails.append(tail)
+                bound_bits.append(1)
+                bound_bits.extend([0] * len(tail))
+                end_bits.append(1 if node.label.endswith(trie.end_marker) else 0)
+                next_level.extend(children)
+            level = next_level
+        bound_bits.append(1)
+
+        return cls(
+            BitVector(louds_bits),
+            "".join(first),
+            "".join(tails),
+            BitVector(bound_bits),
+            BitVector(end_bits),
+        )
+
+    def nbytes(self):
+        """Mémoire occupée par la représentation (vecteurs de bits et caractères)"""
+        return (
+            self._louds.nbytes()
+            + self._bounds.nbytes()
+            + self._ends.nbytes()
+            + len(self._first.encode("utf-8"))
+            + len(self._tails.encode("utf-8"))
+        )
+
+    # Navigation
+    def _children(self, node):
+        """Numéros (début, fin) des enfants de node"""
+        start = self._louds.select0(node + 1)
+        end = self._louds.next0(start + 1)
+        first_child = start - node
+        return first_child, first_child + end - start - 1
+
+    def _child(self, node, char):
+        """Enfant de node dont le label commence par char, ou None"""
+        first_child, end = self._children(node)
+        i = self._first.find(char, first_child - 1, end - 1)
+        return None if i < 0 else i + 1
+
+    def _tail(self, node):
+        """Label de node privé de son premier caractère"""
+        bounds = self._bounds
+        start = bounds.select1(node + 1)
+        return self._tails[start - node:bounds.next1(start + 1) - node - 1]
+
+    def _label(self, node):
+        if node == 0:
+            return self._tail(0)
+        return self._first[node - 1] + self._tail(node)
+
+    def _descend(self, mot):
+        """
+        Descendre selon mot ; le mot peut s'arrêter au milieu d'un label.
+        Retourne (nœud atteint, labels du chemin), ou (None, None).
+        """
+        node = 0
+        labels = [self._tail(0)]
+        pos = 0
+        while pos < len(mot):
+            child = self._child(node, mot[pos])
+            if child is None:
+                return None, None
+            tail = self._tail(child)
+            step = min(len(tail), len(mot) - pos - 1)
+            if not mot.startswith(tail[:step], pos + 1):
+                return None, None
+            labels.append(mot[pos] + tail)
+            pos += 1 + len(tail)
+            node = child
+        return node, labels
+
+    def recherche(self, word):
+        """Rechercher si un mot existe"""
+        key = word + END_MARKER
+        node, labels = self._descend(key)
+        # key se termine par le marqueur : si la descente aboutit, c'est au bout d'un label
+        return node is not None and labels[-1].endswith(END_MARKER)
+
+    def prefixe(self, prefix):
+        """Compter les mots qui commencent par prefix (le préfixe lui-même compris)"""
+        node, _ = self._descend(prefix)
+        if node is None:
+            return 0
+        # Les descendants d'un nœud forment, à chaque niveau, une suite de numéros consécutifs
+        ends = self._ends
+        louds = self._louds
+        count = 0
+        low, high = node, node + 1
+        while low < high:
+            count += ends.rank1(high) - ends.rank1(low)
+            low = louds.select0(low + 1) - low
+            high = louds.select0(high + 1) - high
+        return count
+
+    def comptage_mots(self):
+        """Nombre de mots du dictionnaire"""
+        return self.word_count
+
+    def iter_words(self, prefix=None, limit=None):
+        """
+        Générer, dans l'ordre lexicographique, les mots qui commencent par prefix
+        (tous si prefix est None), au plus limit mots.
+        """
+        if limit is not None and limit <= 0:
+            return
+        node, labels = self._descend(prefix or "")
+        if node is None:
+            return
+        buffer = [label.rstrip(END_MARKER) for label in labels]
+
+        count = 0
+        if self._ends[node]:
+            yield "".join(buffer)
+            return
+        stack = [iter(range(*self._children(node)))]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                buffer.pop()
+                continue
+            buffer.append(self._label(child).rstrip(END_MARKER))
+            if self._ends[child]:
+                yield "".join(buffer)
+                count += 1
+                if count == limit:
+                    return
+                buffer.pop()
+                continue
+            stack.append(iter(range(*self._children(child))))
+
+    def liste_mots(self):
+        """Lister tous les mots dans l'ordre lexicographique"""
+        return list(self.iter_words())
@@ -0,0 +1,121 @@
+import os
+import sys
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+from frozen_trie import FrozenTrie
+from louds_trie import LoudsTrie, BitVector
+from patricia import PatriciaTrie, recherche, prefixe, liste_mots, iter_words
+from hybrid_trie import HybridTrie
+
+# Tests des dictionnaires en lecture seule : python test_frozen_trie.py (ou pytest)
+# Chaque requête est comparée à celle du trie source.
+
+
+def mots_aleatoires(n, seed=0, alphabet="abcdé", longueur=6):
+    """n mots aléatoires (doublons, préfixes communs et caractères non ASCII)"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, longueur))) for _ in range(n)]
+
+def requetes():
+    """Mots et préfixes à comparer : présents, absents, coupés au milieu d'un label"""
+    return mots_aleatoires(300, seed=1) + ["", "a", "ab", "é", "zz", "abcdéabcdé"]
+
+
+def test_frozen_patricia():
+    trie = PatriciaTrie()
+    for word in mots_aleatoires(400) + [""]:
+        trie.inserer(word)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "pat.frz")
+        FrozenTrie.compile(trie, path)
+        assert FrozenTrie.is_frozen(path)
+        with FrozenTrie(path) as frozen:
+            assert frozen.comptage_mots() == len(set(mots_aleatoires(400) + [""]))
+            for word in requetes():
+                assert frozen.recherche(word) == recherche(trie, word)
+                assert frozen.prefixe(word) == prefixe(trie, word)
+
+def test_frozen_hybrid():
+    trie = HybridTrie()
+    for word in mots_aleatoires(400):
+        trie.insert(word)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "trie.frz")
+        FrozenTrie.compile(trie, path)
+        with FrozenTrie(path) as frozen:
+            assert frozen.comptage_mots() == len(trie.liste_mots())
+            for word in requetes():
+                if word:
+                    assert frozen.recherche(word) == trie.recherche(word)
+                    # HybridTrie.prefixe ne compte pas le préfixe lui-même (comme trie_prefixe.py)
+                    assert frozen.prefixe(word) - frozen.recherche(word) == trie.prefixe(word)
+
+def test_frozen_label_long():
+    # Label de plus de 65535 octets (UTF-8) : la longueur est stockée sur 32 bits
+    long_word = "é" * 40000
+    trie = PatriciaTrie()
+    for word in (long_word, long_word + "a", "ab", "é"):
+        trie.inserer(word)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "pat.frz")
+        FrozenTrie.compile(trie, path)
+        assert os.listdir(tmp_dir) == ["pat.frz"]
+        with FrozenTrie(path) as frozen:
+            assert frozen.recherche(long_word) and frozen.recherche(long_word + "a")
+            assert not frozen.recherche(long_word[:-1])
+            assert frozen.prefixe("é") == 3
+            assert frozen.prefixe(long_word[:-1]) == 2
+
+def test_frozen_fichier_invalide():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "pat.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        assert not FrozenTrie.is_frozen(path)
+        assert not FrozenTrie.is_frozen(os.path.join(tmp_dir, "absent.frz"))
+        assert not FrozenTrie.is_frozen(tmp_dir)
+        try:
+            FrozenTrie(path)
+        except ValueError:
+            pass
+        else:
+            assert False, "FrozenTrie doit refuser un fichier qui n'est pas gelé"
+
+def test_louds_patricia():
+    trie = PatriciaTrie()
+    for word in mots_aleatoires(400) + [""]:
+        trie.inserer(word)
+    louds = LoudsTrie.from_patricia(trie)
+    assert louds.comptage_mots() == len(liste_mots(trie))
+    assert louds.liste_mots() == liste_mots(trie)
+    for word in requetes():
+        assert louds.recherche(word) == recherche(trie, word)
+        assert louds.prefixe(word) == prefixe(trie, word)
+        assert list(louds.iter_words(word, limit=5)) == list(iter_words(trie, word, limit=5))
+    assert LoudsTrie.from_patricia(PatriciaTrie()).liste_mots() == []
+
+def test_bitvector_rank_select():
+    # Plusieurs mots de 64 bits et blocs du répertoire
+    rng = random.Random(0)
+    bits = [rng.random() < 0.3 for _ in range(5000)]
+    vector = BitVector(bits)
+    ones = [i for i, bit in enumerate(bits) if bit]
+    zeros = [i for i, bit in enumerate(bits) if not bit]
+    for position in range(0, len(bits) + 1, 37):
+        assert vector.rank1(position) == sum(bits[:position])
+    for k in range(0, len(ones), 11):
+        assert vector.select1(k + 1) == ones[k]
+    for k in range(0, len(zeros), 11):
+        assert vector.select0(k + 1) == zeros[k]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
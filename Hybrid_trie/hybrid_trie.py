@@ -1,6 +1,24 @@
 import json
+import multiprocessing
 import os
 import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+# Format binaire des instantanés (to_binary / from_binary) :
+# en-tête = magique, version, nombre de nœuds ; puis un enregistrement par nœud en
+# ordre préfixe (nœud, gauche, milieu, droite) : un octet de drapeaux suivi du
+# caractère sur 1 octet (ou 4 octets si BINARY_WIDE est levé).
+BINARY_MAGIC = b"HYTR"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBQ")
+BINARY_END, BINARY_LEFT, BINARY_MIDDLE, BINARY_RIGHT, BINARY_WIDE = 1, 2, 4, 8, 16
+BINARY_CHUNK = 1 << 16
+# Instantané partagé (to_shards / from_shards) : un dossier avec un fichier binaire
+# (format de to_binary) par nœud du premier niveau, avec son sous-arbre middle, et un
+# manifeste JSON qui les liste. Version 2 : fichiers binaires (JSON en version 1)
+SHARD_MANIFEST = "manifest.json"
+SHARD_VERSION = 2
 
 
 
@@ -12,13 +30,22 @@ class HybridTrieNode:
     - left : nœud enfant gauche
     - middle : nœud enfant central
     - right : nœud enfant droit
+    - size : nombre de nœuds de l'ABR de frères enraciné ici (lui-même, left et right,
+      sans middle) ; utilisé par insert_with_balance
+    - words : nombre de mots du sous-arbre (left, middle et right compris) ; maintenu
+      seulement quand les statistiques sont activées
+    __slots__ supprime le __dict__ de chaque nœud (moins de mémoire par nœud).
     """
+    __slots__ = ("char", "is_end_of_word", "left", "middle", "right", "size", "words")
+
     def __init__(self, char=None, is_end_of_word=False):
         self.char = char
         self.is_end_of_word = is_end_of_word
         self.left = None
         self.middle = None
         self.right = None
+        self.size = 1
+        self.words = 0
 
     def to_dict(self):
         """Convertir récursivement le nœud en format dictionnaire"""
@@ -49,95 +76,320 @@ class HybridTrie:
     """
     Trie hybride, supporte les opérations d’insertion, suppression, recherche, statistiques de profondeur, etc.
     """
-    def __init__(self):
+    def __init__(self, stats=False):
         self.root = None
         self.operation_count = {
             "insert_comparisons": 0,
             "search_comparisons": 0,
             "delete_comparisons": 0
         }
+        # Les champs size sont-ils à jour ? (insert ne les maintient pas)
+        self._sizes_valid = True
+        # Statistiques maintenues à chaque modification (None = désactivées)
+        self.stats = None
+        if stats:
+            self.enable_stats()
+
+    def enable_stats(self):
+        """
+        Activer le maintien incrémental des statistiques (un parcours complet, puis O(1)) :
+        - words : nombre de mots
+        - nodes : nombre de nœuds
+        - word_depth_sum : somme des profondeurs des fins de mots
+        - depth_counts : depth_counts[d] = nombre de nœuds à la profondeur d
+        Chaque nœud garde aussi le nombre de mots de son sous-arbre (words),
+        ce qui rend comptageMots(node) et prefixe O(1) après la descente.
+        """
+        self.stats = {"words": 0, "nodes": 0, "word_depth_sum": 0, "depth_counts": []}
+        self._count_subtree(self.root, 0, 1)
+        self._refresh_subtree_words(self.root)
+
+    def _refresh_subtree_words(self, node):
+        """Recalculer words pour tout le sous-arbre de racine node"""
+        order = []
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for child in (node.left, node.middle, node.right):
+                if child is not None:
+                    stack.append(child)
+        # Les enfants apparaissent après leur parent : parcourir à l'envers
+        for node in reversed(order):
+            self._refresh_words(node)
+
+    @staticmethod
+    def _refresh_words(node):
+        """Recalculer words à partir des enfants"""
+        node.words = (
+            node.is_end_of_word
+            + (node.left.words if node.left else 0)
+            + (node.middle.words if node.middle else 0)
+            + (node.right.words if node.right else 0)
+        )
+
+    def _add_word_count(self, word, delta):
+        """Ajouter delta au compteur words de chaque nœud du chemin de word"""
+        node = self.root
+        index = 0
+        last = len(word) - 1
+        while node is not None:
+            node.words += delta
+            char = word[index]
+            if char < node.char:
+                node = node.left
+            elif char > node.char:
+                node = node.right
+            elif index == last:
+                break
+            else:
+                index += 1
+                node = node.middle
+
+    def _count_node(self, depth, sign):
+        """Ajouter (sign = 1) ou retirer (sign = -1) un nœud de profondeur depth"""
+        stats = self.stats
+        stats["nodes"] += sign
+        depth_counts = stats["depth_counts"]
+        if depth == len(depth_counts):
+            depth_counts.append(0)
+        depth_counts[depth] += sign
+        while depth_counts and depth_counts[-1] == 0:
+            depth_counts.pop()
+
+    def _count_word(self, depth, sign):
+        """Ajouter ou retirer une fin de mot de profondeur depth"""
+        self.stats["words"] += sign
+        self.stats["word_depth_sum"] += sign * depth
+
+    def _count_subtree(self, node, depth, sign):
+        """Ajouter ou retirer des statistiques tout le sous-arbre de racine node"""
+        stack = [(node, depth)] if node is not None else []
+        while stack:
+            node, depth = stack.pop()
+            self._count_node(depth, sign)
+            if node.is_end_of_word:
+                self._count_word(depth, sign)
+            for child in (node.left, node.middle, node.right):
+                if child is not None:
+                    stack.append((child, depth + 1))
 
     
     def insert(self, word):
-        """Insérer un mot"""
-        self.root = self._insert(self.root, word, 0)
-
-    def _insert(self, node, word, index):
-        char = word[index]
+        """Insérer un mot (version itérative : une boucle au lieu d'un appel par nœud)"""
+        stats = self.stats
+        node = self.root
         if node is None:
-            node = HybridTrieNode(char)
-
-        if char < node.char:
-            self.operation_count["insert_comparisons"] += 1  # Enregistrer le nombre de comparaisons
-            node.left = self._insert(node.left, word, index)
-        elif char > node.char:
-            self.operation_count["insert_comparisons"] += 1
-            node.right = self._insert(node.right, word, index)
-        else:
-            if index + 1 == len(word):
-                node.is_end_of_word = True
+            node = self.root = HybridTrieNode(word[0])
+            if stats is not None:
+                self._count_node(0, 1)
+        index = 0
+        last = len(word) - 1
+        depth = 0
+        comparisons = 0
+
+        while True:
+            char = word[index]
+            if char < node.char:
+                comparisons += 1  # Enregistrer le nombre de comparaisons
+                depth += 1
+                if node.left is None:
+                    node.left = HybridTrieNode(char)
+                    self._sizes_valid = False
+                    if stats is not None:
+                        self._count_node(depth, 1)
+                node = node.left
+            elif char > node.char:
+                comparisons += 1
+                depth += 1
+                if node.right is None:
+                    node.right = HybridTrieNode(char)
+                    self._sizes_valid = False
+                    if stats is not None:
+                        self._count_node(depth, 1)
+                node = node.right
             else:
-                node.middle = self._insert(node.middle, word, index + 1)
-
-        return node
+                if index == last:
+                    if stats is not None and not node.is_end_of_word:
+                        self._count_word(depth, 1)
+                        self._add_word_count(word, 1)
+                    node.is_end_of_word = True
+                    break
+                index += 1
+                depth += 1
+                if node.middle is None:
+                    node.middle = HybridTrieNode(word[index])
+                    if stats is not None:
+                        self._count_node(depth, 1)
+                node = node.middle
+
+        self.operation_count["insert_comparisons"] += comparisons
+
+
+    def insert_many(self, words):
+        """
+        Insérer plusieurs mots en une fois (mots vides et doublons ignorés). Sur un
+        trie vide, l'arbre est construit équilibré par from_words ; sinon les mots
+        sont insérés dans l'ordre donné, la forme du trie dépendant de cet ordre.
+        """
+        if self.root is None:
+            self.root = self.from_words(words).root
+            self._sizes_valid = True
+            if self.stats is not None:
+                self.enable_stats()
+            return
+        for word in dict.fromkeys(words):
+            if word:
+                self.insert(word)
 
- 
     def suppression(self, word):
         """
         Supprimer un mot spécifique dans le Trie hybride.
+        La descente mémorise le chemin (nœud, parent, lien) puis l'élagage
+        remonte ce chemin, sans récursion.
         """
-        def _suppression(node, word, index):
-            if node is None:
-                return None  # Le nœud est vide, retourner directement
-
+        path = []
+        parent, link = None, None
+        node = self.root
+        index = 0
+        comparisons = 0
+
+        while node is not None:
+            comparisons += 1  # 记录比较次数
+            path.append((node, parent, link))
             char = word[index]
-            self.operation_count["delete_comparisons"] += 1  # 记录比较次数
-
-
             if char < node.char:
-                # Supprimer de manière récursive dans le sous-arbre gauche
-                node.left = _suppression(node.left, word, index)
+                parent, link, node = node, "left", node.left
             elif char > node.char:
-                # Supprimer de manière récursive dans le sous-arbre droit
-                node.right = _suppression(node.right, word, index)
+                parent, link, node = node, "right", node.right
+            elif index + 1 == len(word):
+                # À la fin du mot, retirer le marqueur de fin
+                if self.stats is not None and node.is_end_of_word:
+                    self._count_word(len(path) - 1, -1)
+                    for path_node, _, _ in path:
+                        path_node.words -= 1
+                node.is_end_of_word = False
+                break
             else:
-                # Trouver le nœud correspondant au caractère
-                if index + 1 == len(word):
-                    # À la fin du mot, retirer le marqueur de fin
-                    node.is_end_of_word = False
-                else:
-                    # Continuer à traiter le sous-arbre central
-                    node.middle = _suppression(node.middle, word, index + 1)
-
-                # Vérifier si le nœud actuel doit être supprimé
-                if (
-                    not node.is_end_of_word  # Le nœud actuel n'est plus la fin d'un mot
-                    and node.left is None  # Le sous-arbre est vide
-                    and node.middle is None  
-                    and node.right is None  
-                ):
-                    return None  # Supprimer le nœud actuel
-
-            # Élaguer le nœud parent si nécessaire
+                index += 1
+                parent, link, node = node, "middle", node.middle
+
+        self.operation_count["delete_comparisons"] += comparisons
+
+        # Élaguer, du bas vers le haut, les nœuds devenus vides (path[i] est à la profondeur i)
+        for i in range(len(path) - 1, -1, -1):
+            node, parent, link = path[i]
             if (
                 not node.is_end_of_word
                 and node.left is None
                 and node.middle is None
                 and node.right is None
             ):
-                return None  # Retourner un nœud vide pour indiquer qu'il a été supprimé
-
-
-            return node
+                if self.stats is not None:
+                    self._count_node(i, -1)
+                if parent is None:
+                    self.root = None
+                else:
+                    setattr(parent, link, None)
+                    if link != "middle":
+                        # Mettre à jour size dans l'ABR de frères qui contenait le nœud
+                        for ancestor, _, ancestor_link in reversed(path[:i]):
+                            ancestor.size -= 1
+                            if ancestor_link in (None, "middle"):
+                                break
 
-        # Mettre à jour le nœud racine
-        self.root = _suppression(self.root, word, 0)
 
-        # Nettoyer la racine si elle est vide
-        if self.root and not self.root.is_end_of_word and self.root.left is None and self.root.middle is None and self.root.right is None:
-            self.root = None
 
+    def fusion(self, other):
+        """
+        Fusionner other dans self en parcourant les deux arbres ensemble.
+        Un nœud de other dont le caractère existe déjà au même niveau est fusionné
+        avec ce nœud (marqueur de fin, puis niveau middle) ; sinon il est greffé,
+        avec tout son sous-arbre middle, sous la feuille de l'ABR de frères de self.
+        Les sous-arbres greffés ne sont pas parcourus : le coût dépend des nœuds de
+        other qui rencontrent un niveau existant, pas de la taille de self.
+        Les nœuds de other sont réutilisés, other est donc vidé.
+        """
+        if other is self:
+            return self
+        stats = self.stats
+        # Sous-arbres de other repris tels quels : (racine, profondeur)
+        grafted = []
+        # Nœuds de self dont le sous-arbre a changé, du haut vers le bas
+        touched = []
+        comparisons = 0
+        # Chaque tâche : (nœud de other, nœud de self dont le middle porte le niveau, profondeur du niveau)
+        stack = [(other.root, None, 0)] if other.root else []
+
+        while stack:
+            other_node, owner, depth = stack.pop()
+            if other_node.left is not None:
+                stack.append((other_node.left, owner, depth))
+            if other_node.right is not None:
+                stack.append((other_node.right, owner, depth))
+
+            # Chercher le caractère dans l'ABR de frères de self
+            char = other_node.char
+            parent, link = owner, "middle"
+            node = self.root if owner is None else owner.middle
+            level_path = []
+            while node is not None and node.char != char:
+                comparisons += 1
+                touched.append(node)
+                level_path.append(node)
+                parent = node
+                depth += 1
+                if char < node.char:
+                    link, node = "left", node.left
+                else:
+                    link, node = "right", node.right
 
+            if node is None:
+                # Caractère absent : greffer le nœud de other, détaché de ses frères
+                other_node.left = other_node.right = None
+                other_node.size = 1
+                if parent is None:
+                    self.root = other_node
+                else:
+                    setattr(parent, link, other_node)
+                for level_node in level_path:
+                    level_node.size += 1
+                touched.append(other_node)
+                if other_node.middle is not None:
+                    grafted.append((other_node.middle, depth + 1))
+                if stats is not None:
+                    self._count_node(depth, 1)
+                    if other_node.is_end_of_word:
+                        self._count_word(depth, 1)
+                continue
+
+            touched.append(node)
+            if other_node.is_end_of_word and not node.is_end_of_word:
+                node.is_end_of_word = True
+                if stats is not None:
+                    self._count_word(depth, 1)
+            if other_node.middle is not None:
+                if node.middle is None:
+                    node.middle = other_node.middle
+                    grafted.append((other_node.middle, depth + 1))
+                else:
+                    stack.append((other_node.middle, node, depth + 1))
+
+        if stats is not None:
+            for node, depth in grafted:
+                if other.stats is None:
+                    self._refresh_subtree_words(node)
+                self._count_subtree(node, depth, 1)
+            # Un nœud est toujours touché pour la première fois avant ses descendants
+            for node in reversed(touched):
+                self._refresh_words(node)
+
+        self._sizes_valid = self._sizes_valid and other._sizes_valid
+        self.operation_count["insert_comparisons"] += comparisons
+        other.root = None
+        if other.stats is not None:
+            other.enable_stats()
+        return self
 
     def is_empty(self):
         """
@@ -149,27 +401,91 @@ class HybridTrie:
 
 
     def recherche(self, word):
-        """Rechercher si un mot existe"""
-        return self._recherche(self.root, word, 0)
+        """Rechercher si un mot existe (version itérative)"""
+        node = self.root
+        index = 0
+        last = len(word) - 1
+        comparisons = 0
+        found = False
+
+        while node is not None:
+            char = word[index]
+            comparisons += 1
+            if char < node.char:
+                node = node.left
+            elif char > node.char:
+                node = node.right
+            elif index == last:
+                found = node.is_end_of_word
+                break
+            else:
+                index += 1
+                node = node.middle
 
-    def _recherche(self, node, word, index):
-        if node is None:
-            return False
-        char = word[index]
-        self.operation_count["search_comparisons"] += 1  
-        if char < node.char:
-            return self._recherche(node.left, word, index)
-        elif char > node.char:
-            return self._recherche(node.right, word, index)
-        else:
-            if index + 1 == len(word):
-                return node.is_end_of_word
-            return self._recherche(node.middle, word, index + 1)
+        self.operation_count["search_comparisons"] += comparisons
+        return found
+
+    def recherche_many(self, words):
+        """
+        Rechercher plusieurs mots en une passe : les requêtes sont triées, et chaque
+        requête reprend la descente au nœud du plus long préfixe commun avec la
+        précédente. Retourne la liste des résultats dans l'ordre des mots donnés.
+        words peut être un itérable quelconque (il est lu deux fois, d'où la copie).
+        """
+        words = list(words)
+        results = {}
+        # path[i] = nœud du caractère i de la requête précédente (si la descente l'a atteint)
+        path = []
+        previous = ""
+        comparisons = 0
+
+        for word in sorted(set(words)):
+            # Longueur du préfixe commun avec la requête précédente
+            common = 0
+            limit = min(len(word), len(previous), len(path))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+            # Triés et dédoublonnés : word n'est jamais préfixe de previous, donc common < len(word)
+            del path[common:]
+            previous = word
+
+            if not word:
+                results[word] = False
+                continue
+            if common > 0:
+                node = path[common - 1].middle
+                index = common
+            else:
+                node = self.root
+                index = 0
+            last = len(word) - 1
+            found = False
+
+            while node is not None:
+                char = word[index]
+                comparisons += 1
+                if char < node.char:
+                    node = node.left
+                elif char > node.char:
+                    node = node.right
+                else:
+                    path.append(node)
+                    if index == last:
+                        found = node.is_end_of_word
+                        break
+                    index += 1
+                    node = node.middle
+            results[word] = found
+
+        self.operation_count["search_comparisons"] += comparisons
+        return [results[word] for word in words]
         
     def comptageMots(self, node):
         """Compter le nombre de mots dans le Trie"""
         if node is None:
             return 0
+        if self.stats is not None:
+            return node.words
         count = 1 if node.is_end_of_word else 0
         count += self.comptageMots(node.left)
         count += self.comptageMots(node.middle)
@@ -179,24 +495,75 @@ class HybridTrie:
     # 列出所有单词
     def liste_mots(self):
         """Lister tous les mots dans le Trie"""
-        result = []
-        self._liste_mots(self.root, "", result)
-        return result
+        return list(self.iter_words())
 
-    def _liste_mots(self, node, prefix, result):
-        if node is None:
+    def iter_words(self, prefix=None, limit=None):
+        """
+        Générer paresseusement, dans l'ordre lexicographique, les mots qui commencent
+        par prefix (tous si prefix est None), au plus limit mots.
+        Les mots sont construits dans un seul tampon de caractères réutilisé, et
+        seuls les chemins menant aux mots produits sont parcourus.
+        """
+        if limit is not None and limit <= 0:
             return
-        self._liste_mots(node.left, prefix, result)
-        if node.is_end_of_word:
-            result.append(prefix + node.char)
-        self._liste_mots(node.middle, prefix + node.char, result)
-        self._liste_mots(node.right, prefix, result)
-
+        count = 0
+        buffer = list(prefix) if prefix else []
+        node = self.root
+
+        if prefix:
+            # Descendre jusqu'au nœud du dernier caractère du préfixe
+            index = 0
+            last = len(prefix) - 1
+            while node is not None:
+                char = prefix[index]
+                if char < node.char:
+                    node = node.left
+                elif char > node.char:
+                    node = node.right
+                elif index == last:
+                    break
+                else:
+                    index += 1
+                    node = node.middle
+            if node is None:
+                return
+            if node.is_end_of_word:
+                yield prefix
+                count += 1
+                if count == limit:
+                    return
+            node = node.middle
+
+        # Parcours infixe : gauche, nœud, milieu, droite ; buffer[:depth] est le préfixe commun
+        stack = [(node, len(buffer), False)] if node is not None else []
+        while stack:
+            node, depth, visited = stack.pop()
+            if visited:
+                del buffer[depth:]
+                buffer.append(node.char)
+                if node.is_end_of_word:
+                    yield "".join(buffer)
+                    count += 1
+                    if count == limit:
+                        return
+                continue
+            if node.right is not None:
+                stack.append((node.right, depth, False))
+            if node.middle is not None:
+                stack.append((node.middle, depth + 1, False))
+            stack.append((node, depth, True))
+            if node.left is not None:
+                stack.append((node.left, depth, False))
 
     def comptage_nil(self):
         """
         Compter le nombre de pointeurs NULL dans le Trie hybride
         """
+        if self.stats is not None:
+            # Chaque nœud sauf la racine est pointé une fois : 3n - (n - 1)
+            nodes = self.stats["nodes"]
+            return 2 * nodes + 1 if nodes else 0
+
         def _comptage_nil(node):
             if node is None:
                 return 0
@@ -220,8 +587,24 @@ class HybridTrie:
     # 树的高度
     def hauteur(self):
         """Calculer la hauteur de l'arbre"""
+        if self.stats is not None:
+            return len(self.stats["depth_counts"])
         return self._hauteur(self.root)
 
+    def comptage_noeuds(self):
+        """Compter le nombre de nœuds du Trie"""
+        if self.stats is not None:
+            return self.stats["nodes"]
+        count = 0
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            for child in (node.left, node.middle, node.right):
+                if child is not None:
+                    stack.append(child)
+        return count
+
     def _hauteur(self, node):
         if node is None:
             return 0
@@ -230,6 +613,10 @@ class HybridTrie:
     # 平均深度
     def profondeur_moyenne(self):
         """Calculer la profondeur moyenne des feuilles dans l'arbre"""
+        if self.stats is not None:
+            if self.stats["words"] == 0:
+                return 0
+            return self.stats["word_depth_sum"] / self.stats["words"]
         result = {"total_depth": 0, "leaf_count": 0}
         self._profondeur_moyenne(self.root, 0, result)
         if result["leaf_count"] == 0:
@@ -248,23 +635,27 @@ class HybridTrie:
 
     # 以指定前缀开头的单词数量
     def prefixe(self, prefix):
-        """Compter le nombre de mots commençant par un préfixe donné"""
-        return self._prefixe(self.root, prefix, 0)
-
-    def _prefixe(self, node, prefix, index):
-        if node is None:
-            return 0
-        if index >= len(prefix):
-            return self._count_subtree_words(node)
-        char = prefix[index]
-        if char < node.char:
-            return self._prefixe(node.left, prefix, index)
-        elif char > node.char:
-            return self._prefixe(node.right, prefix, index)
-        else:
-            if index + 1 == len(prefix):
+        """
+        Compter le nombre de mots commençant par un préfixe donné.
+        Avec les statistiques activées, le comptage final est O(1) (champ words).
+        """
+        node = self.root
+        if not prefix:
+            return self.comptageMots(node)
+        index = 0
+        last = len(prefix) - 1
+        while node is not None:
+            char = prefix[index]
+            if char < node.char:
+                node = node.left
+            elif char > node.char:
+                node = node.right
+            elif index == last:
                 return self.comptageMots(node.middle)
-            return self._prefixe(node.middle, prefix, index + 1)
+            else:
+                index += 1
+                node = node.middle
+        return 0
 
     
 
@@ -288,6 +679,7 @@ class HybridTrie:
             return cls()
         trie = cls()
         trie.root = HybridTrieNode.from_dict(data)
+        trie._sizes_valid = False
         return trie
 
 
@@ -298,8 +690,182 @@ class HybridTrie:
             data = json.load(f)
         trie = cls()
         trie.root = HybridTrieNode.from_dict(data)
+        trie._sizes_valid = False
         return trie
     
+    def to_binary(self, file_path):
+        """
+        Sauvegarder le Trie au format binaire compact (voir BINARY_HEADER), en flux :
+        parcours préfixe itératif, écrit par blocs de BINARY_CHUNK octets.
+        """
+        count = 0
+        with open(file_path, "wb") as f:
+            f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0))
+            buffer = bytearray()
+            stack = [self.root] if self.root else []
+            while stack:
+                node = stack.pop()
+                count += 1
+                flags = BINARY_END if node.is_end_of_word else 0
+                if node.left is not None:
+                    flags |= BINARY_LEFT
+                if node.middle is not None:
+                    flags |= BINARY_MIDDLE
+                if node.right is not None:
+                    flags |= BINARY_RIGHT
+                code = ord(node.char)
+                if code > 0xFF:
+                    buffer.append(flags | BINARY_WIDE)
+                    buffer += code.to_bytes(4, "little")
+                else:
+                    buffer.append(flags)
+                    buffer.append(code)
+                if len(buffer) >= BINARY_CHUNK:
+                    f.write(buffer)
+                    buffer.clear()
+                # Empiler à l'envers pour écrire gauche, milieu puis droite
+                for child in (node.right, node.middle, node.left):
+                    if child is not None:
+                        stack.append(child)
+            f.write(buffer)
+            # Compléter l'en-tête avec le nombre de nœuds
+            f.seek(0)
+            f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, count))
+
+    @classmethod
+    def from_binary(cls, file_path):
+        """Charger un Trie depuis un fichier écrit par to_binary (lecture en flux, sans récursion)"""
+        trie = cls()
+        with open(file_path, "rb") as f:
+            header = f.read(BINARY_HEADER.size)
+            if len(header) < BINARY_HEADER.size:
+                raise ValueError(f"{file_path}: truncated header")
+            magic, version, count = BINARY_HEADER.unpack(header)
+            if magic != BINARY_MAGIC:
+                raise ValueError(f"{file_path}: not a HybridTrie binary snapshot")
+            if version != BINARY_VERSION:
+                raise ValueError(f"{file_path}: unsupported version {version}")
+
+            data = b""
+            pos = 0
+            # Emplacements en attente (parent, lien), dans l'ordre préfixe
+            slots = [(None, None)] if count else []
+            for _ in range(count):
+                if len(data) - pos < 5:
+                    data = data[pos:] + f.read(BINARY_CHUNK)
+                    pos = 0
+                    if len(data) < 2 or (data[0] & BINARY_WIDE and len(data) < 5):
+                        raise ValueError(f"{file_path}: truncated node records")
+                flags = data[pos]
+                if flags & BINARY_WIDE:
+                    char = chr(int.from_bytes(data[pos + 1:pos + 5], "little"))
+                    pos += 5
+                else:
+                    char = chr(data[pos + 1])
+                    pos += 2
+                node = HybridTrieNode(char, bool(flags & BINARY_END))
+                parent, link = slots.pop()
+                if parent is None:
+                    trie.root = node
+                else:
+                    setattr(parent, link, node)
+                if flags & BINARY_RIGHT:
+                    slots.append((node, "right"))
+                if flags & BINARY_MIDDLE:
+                    slots.append((node, "middle"))
+                if flags & BINARY_LEFT:
+                    slots.append((node, "left"))
+            if slots:
+                raise ValueError(f"{file_path}: truncated node records")
+        trie._sizes_valid = False
+        return trie
+
+    def to_shards(self, directory):
+        """
+        Écrire le Trie en instantané partagé dans directory : un fichier par nœud de
+        l'ABR du premier niveau (le nœud et son sous-arbre middle, au format de
+        to_binary, écrit et relu sans récursion quelle que soit la longueur des mots)
+        et le manifeste SHARD_MANIFEST, écrit en dernier par remplacement
+        atomique. Le manifeste garde la forme de l'ABR du premier niveau (ordre
+        préfixe, drapeaux BINARY_LEFT / BINARY_RIGHT) : from_shards rend le même Trie.
+        Les fichiers portent le numéro de génération du manifeste.
+        """
+        os.makedirs(directory, exist_ok=True)
+        try:
+            generation = _read_manifest(directory, "hybrid")["generation"] + 1
+        except (OSError, ValueError, KeyError):
+            generation = 0
+        shards = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            shard = HybridTrie()
+            shard.root = HybridTrieNode(node.char, node.is_end_of_word)
+            shard.root.middle = node.middle
+            file_name = f"shard_{generation}_{len(shards)}.bin"
+            shard.to_binary(os.path.join(directory, file_name))
+            shards.append({
+                "key": node.char,
+                "file": file_name,
+                "flags": (BINARY_LEFT if node.left is not None else 0)
+                | (BINARY_RIGHT if node.right is not None else 0),
+            })
+            for child in (node.right, node.left):
+                if child is not None:
+                    stack.append(child)
+        _write_manifest(directory, {
+            "format": "hybrid", "version": SHARD_VERSION,
+            "generation": generation, "shards": shards,
+        })
+
+    @classmethod
+    def from_shards(cls, directory, prefix=None, workers=None):
+        """
+        Lire un instantané écrit par to_shards. Avec prefix, seul le fichier du nœud
+        prefix[0] est lu : le Trie obtenu ne contient que les mots commençant par ce
+        caractère (assez pour prefixe et recherche sur prefix).
+        Les fichiers sont lus en parallèle sur workers processus (os.cpu_count()
+        par défaut) et renvoyés aplatis ; l'ABR du premier niveau est ensuite relié
+        selon la forme gardée dans le manifeste.
+        Lève ValueError si directory n'est pas un instantané partagé hybride.
+        """
+        shards = _read_manifest(directory, "hybrid")["shards"]
+        if prefix:
+            shards = [
+                {**shard, "flags": 0} for shard in shards if shard["key"] == prefix[0]
+            ]
+        paths = [os.path.join(directory, shard["file"]) for shard in shards]
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+
+        if workers <= 1:
+            nodes = [cls.from_binary(path).root for path in paths]
+        else:
+            with _process_pool(workers) as executor:
+                nodes = [
+                    _decode_preorder(chars, flags)
+                    for chars, flags in executor.map(_load_shard, paths)
+                ]
+
+        # Relier le premier niveau : nœuds en ordre préfixe, comme from_binary
+        trie = cls()
+        slots = [(None, None)] if nodes else []
+        for node, shard in zip(nodes, shards):
+            if not slots:
+                raise ValueError(f"{directory}: inconsistent first level in manifest")
+            parent, link = slots.pop()
+            if parent is None:
+                trie.root = node
+            else:
+                setattr(parent, link, node)
+            if shard["flags"] & BINARY_RIGHT:
+                slots.append((node, "right"))
+            if shard["flags"] & BINARY_LEFT:
+                slots.append((node, "left"))
+        if slots:
+            raise ValueError(f"{directory}: inconsistent first level in manifest")
+        trie._sizes_valid = False
+        return trie
+
     def is_unbalanced(self, depth_threshold=3, balance_threshold=2):
         """Vérifier si l'arbre est déséquilibré"""
         max_depth = self.hauteur()
@@ -324,44 +890,405 @@ class HybridTrie:
 
     def rebalance(self):
         """Rééquilibrer l'arbre"""
-        words = self.liste_mots()
-        words = sorted(set(words))  # 确保去重并排序
-        self.root = self._build_balanced_tree(words, 0, len(words) - 1)
+        self.root = self.from_words(self.liste_mots()).root
+        self._sizes_valid = True
+        if self.stats is not None:
+            self.enable_stats()
 
-    def _build_balanced_tree(self, words, start, end):
-        """Construire un arbre équilibré"""
-        if start > end:
-            return None
+    @classmethod
+    def from_words(cls, words):
+        """
+        Construire un Trie équilibré à partir d'une collection de mots.
+        Les mots sont triés et dédoublonnés ; à chaque niveau de caractère, les
+        caractères distincts forment un ABR équilibré (médiane pondérée par le
+        nombre de mots comme racine) et les préfixes communs ne sont construits
+        qu'une seule fois.
+        """
+        words = sorted(set(word for word in words if word))
+        trie = cls()
 
-        mid = (start + end) // 2
-        root = HybridTrieNode(words[mid][0])
-        root.is_end_of_word = len(words[mid]) == 1
-        if len(words[mid]) > 1:
-            root.middle = self._build_tree_from_word(words[mid][1:])
-        root.left = self._build_balanced_tree(words, start, mid - 1)
-        root.right = self._build_balanced_tree(words, mid + 1, end)
+        # Chaque tâche : mots[lo:hi] partageant un préfixe de longueur depth,
+        # à accrocher sous (parent, lien)
+        tasks = [(0, len(words), 0, None, None)]
+        while tasks:
+            lo, hi, depth, parent, link = tasks.pop()
+
+            # Groupes de mots ayant le même caractère à la position depth
+            groups = []
+            start = lo
+            while start < hi:
+                word = words[start]
+                char = word[depth]
+                end = _prefix_end(words, word[:depth + 1], start + 1, hi)
+                groups.append((char, start, end))
+                start = end
+
+            # ABR équilibré sur les groupes : la racine est le groupe qui contient le mot médian
+            ranges = [(0, len(groups), parent, link)]
+            while ranges:
+                g_lo, g_hi, g_parent, g_link = ranges.pop()
+                if g_lo >= g_hi:
+                    continue
+                mid = cls._median_group(groups, g_lo, g_hi)
+                char, start, end = groups[mid]
+                node = HybridTrieNode(char)
+                node.size = g_hi - g_lo
+                if g_parent is None:
+                    trie.root = node
+                else:
+                    setattr(g_parent, g_link, node)
 
-        return root
+                # Les mots étant triés, le mot qui s'arrête ici est le premier du groupe
+                if len(words[start]) == depth + 1:
+                    node.is_end_of_word = True
+                    start += 1
+                if start < end:
+                    tasks.append((start, end, depth + 1, node, "middle"))
 
-    def _build_tree_from_word(self, word):
-        """Construire une sous-arbre en chaîne à partir d'un mot"""
-        if not word:
-            return None
-        root = HybridTrieNode(word[0])
-        root.is_end_of_word = len(word) == 1
-        root.middle = self._build_tree_from_word(word[1:])
+                ranges.append((g_lo, mid, node, "left"))
+                ranges.append((mid + 1, g_hi, node, "right"))
+
+        return trie
+
+    @classmethod
+    def from_words_parallel(cls, words, workers=None):
+        """
+        Construire le Trie sur plusieurs processus. Les mots triés sont coupés en
+        tranches de premiers caractères (une par processus, de tailles voisines) ;
+        chaque processus construit son Trie avec from_words et le renvoie aplati.
+        Les nœuds du premier niveau de toutes les tranches, déjà dans l'ordre, sont
+        reliés en un seul ABR avec la règle de from_words (médiane pondérée par le
+        nombre de mots) ; leurs sous-arbres middle sont repris tels quels. Le Trie
+        obtenu est identique à celui de from_words.
+        """
+        workers = workers or os.cpu_count() or 1
+        words = sorted(set(word for word in words if word))
+        shards = _shards_by_initial(words, workers)
+        if len(shards) <= 1:
+            return cls.from_words(words)
+
+        level = []
+        with _process_pool(len(shards)) as executor:
+            for chars, flags in executor.map(_build_shard, shards):
+                level.extend(cls._flatten_level(_decode_preorder(chars, flags)))
+
+        # Groupes de mots du premier niveau (caractère, début, fin), comme dans from_words
+        groups = []
+        start = 0
+        for node in level:
+            end = _prefix_end(words, node.char, start + 1, len(words))
+            groups.append((node.char, start, end))
+            start = end
+
+        trie = cls()
+        ranges = [(0, len(level), None, None)]
+        while ranges:
+            g_lo, g_hi, parent, link = ranges.pop()
+            if g_lo >= g_hi:
+                if parent is not None:
+                    setattr(parent, link, None)
+                continue
+            mid = cls._median_group(groups, g_lo, g_hi)
+            node = level[mid]
+            node.size = g_hi - g_lo
+            if parent is None:
+                trie.root = node
+            else:
+                setattr(parent, link, node)
+            ranges.append((g_lo, mid, node, "left"))
+            ranges.append((mid + 1, g_hi, node, "right"))
+        # Les size des niveaux inférieurs ne sont pas transmis
+        trie._sizes_valid = False
+        return trie
+
+    def insert_with_balance(self, word, depth_threshold=None, balance_threshold=None, *, alpha=0.7):
+        """
+        Insérer un mot en gardant équilibré chaque ABR de frères (arbre de bouc
+        émissaire / à poids borné) : après l'ajout d'un nœud à gauche ou à droite,
+        le plus haut ancêtre du même niveau tel que size(enfant) > alpha * size(nœud)
+        est reconstruit en ABR parfaitement équilibré. Coût amorti O(log n) par
+        niveau de caractère, même pour une liste de mots triée.
+        depth_threshold et balance_threshold (ancienne signature, rééquilibrage global
+        décidé par is_unbalanced) sont acceptés mais ignorés : le critère alpha, local
+        à chaque niveau, les remplace. alpha ne se passe que par mot-clé.
+        Si les statistiques sont activées, une reconstruction coûte en plus la taille
+        de tout le sous-arbre reconstruit, descendants middle compris (voir
+        _rebalance_level) : la borne amortie ne vaut alors que sans statistiques.
+        """
+        if not self._sizes_valid:
+            self._compute_sizes()
+
+        stats = self.stats
+        node = self.root
+        if node is None:
+            node = self.root = HybridTrieNode(word[0])
+            if stats is not None:
+                self._count_node(0, 1)
+        parent, link = None, None
+        level = []  # chemin (nœud, parent, lien, profondeur) dans l'ABR de frères courant
+        created = False
+        index = 0
+        last = len(word) - 1
+        depth = 0
+        comparisons = 0
+
+        while True:
+            char = word[index]
+            if char != node.char:
+                comparisons += 1
+                level.append((node, parent, link, depth))
+                link = "left" if char < node.char else "right"
+                depth += 1
+                child = getattr(node, link)
+                if child is None:
+                    child = HybridTrieNode(char)
+                    setattr(node, link, child)
+                    created = True
+                    if stats is not None:
+                        self._count_node(depth, 1)
+                parent, node = node, child
+                continue
+
+            if created:
+                depth = self._rebalance_level(level, alpha, node, depth)
+            level = []
+            created = False
+            if index == last:
+                if stats is not None and not node.is_end_of_word:
+                    self._count_word(depth, 1)
+                    self._add_word_count(word, 1)
+                node.is_end_of_word = True
+                break
+            index += 1
+            depth += 1
+            if node.middle is None:
+                node.middle = HybridTrieNode(word[index])
+                if stats is not None:
+                    self._count_node(depth, 1)
+            parent, link, node = node, "middle", node.middle
+
+        self.operation_count["insert_comparisons"] += comparisons
+
+    def _rebalance_level(self, level, alpha, node, depth):
+        """
+        Mettre à jour size le long du chemin et reconstruire le bouc émissaire éventuel.
+        Retourne la nouvelle profondeur de node (le nœud courant du niveau).
+        Sans statistiques, le coût est celui du niveau reconstruit (ses champs size).
+        Avec statistiques, la reconstruction change la profondeur de chaque nœud du
+        niveau et de tous ses descendants middle ; depth_counts (nombre de nœuds par
+        profondeur) ne peut être corrigé qu'en les recomptant tous : coût en
+        O(taille du sous-arbre reconstruit, tous niveaux confondus).
+        """
+        for ancestor, _, _, _ in level:
+            ancestor.size += 1
+        for ancestor, parent, link, ancestor_depth in level:
+            left_size = ancestor.left.size if ancestor.left else 0
+            right_size = ancestor.right.size if ancestor.right else 0
+            if max(left_size, right_size) > alpha * ancestor.size:
+                if self.stats is not None:
+                    self._count_subtree(ancestor, ancestor_depth, -1)
+                subtree = self._build_balanced_level(self._flatten_level(ancestor))
+                if parent is None:
+                    self.root = subtree
+                else:
+                    setattr(parent, link, subtree)
+                if self.stats is not None:
+                    self._count_subtree(subtree, ancestor_depth, 1)
+                # Retrouver la profondeur de node dans l'ABR reconstruit
+                depth = ancestor_depth
+                current = subtree
+                while current is not node:
+                    current = current.left if node.char < current.char else current.right
+                    depth += 1
+                return depth
+        return depth
+
+    @staticmethod
+    def _flatten_level(node):
+        """Nœuds d'un ABR de frères dans l'ordre (parcours infixe par left/right)"""
+        nodes = []
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        return nodes
+
+    @staticmethod
+    def _median_group(groups, g_lo, g_hi):
+        """
+        Racine de l'ABR des groupes groups[g_lo:g_hi] ((caractère, début, fin) dans la
+        liste triée des mots) : le groupe qui contient le mot médian
+        """
+        total = groups[g_hi - 1][2] - groups[g_lo][1]
+        half = groups[g_lo][1] + total // 2
+        mid = g_lo
+        while mid + 1 < g_hi and groups[mid][2] <= half:
+            mid += 1
+        return mid
+
+    @staticmethod
+    def _build_balanced_level(nodes):
+        """Relier les nœuds (triés) en ABR parfaitement équilibré ; middle est conservé"""
+        mid = len(nodes) // 2
+        root = nodes[mid]
+        created = []
+        ranges = [(0, len(nodes), None, None)]
+        while ranges:
+            lo, hi, parent, link = ranges.pop()
+            if lo >= hi:
+                if parent is not None:
+                    setattr(parent, link, None)
+                continue
+            mid = (lo + hi) // 2
+            node = nodes[mid]
+            node.size = hi - lo
+            if parent is not None:
+                setattr(parent, link, node)
+            created.append(node)
+            ranges.append((lo, mid, node, "left"))
+            ranges.append((mid + 1, hi, node, "right"))
+        # Les enfants sont créés après leur parent : recalculer words à l'envers
+        for node in reversed(created):
+            HybridTrie._refresh_words(node)
         return root
 
-    def insert_with_balance(self, word, depth_threshold=3, balance_threshold=2):
-        """Insérer un mot et vérifier si un rééquilibrage est nécessaire"""
-        if word not in self.liste_mots():  # Éviter les insertions répétées
-            self.insert(word)
-        if self.is_unbalanced(depth_threshold, balance_threshold):
-            self.rebalance()
+    def _compute_sizes(self):
+        """Recalculer tous les champs size (après insert ou un chargement JSON)"""
+        order = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for child in (node.left, node.middle, node.right):
+                if child is not None:
+                    stack.append(child)
+        # Les enfants apparaissent après leur parent : parcourir à l'envers
+        for node in reversed(order):
+            node.size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+        self._sizes_valid = True
 
 
 
 
+def _prefix_end(words, prefix, lo, hi):
+    """
+    Premier indice de words[lo:hi] (triés, tous ceux d'avant commençant par prefix)
+    qui ne commence plus par prefix. Recherche dichotomique sur startswith : pas de
+    borne calculée par chr(ord(c) + 1), impossible après U+10FFFF.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if words[mid].startswith(prefix):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _shards_by_initial(words, parts):
+    """
+    Couper une liste triée de mots non vides en au plus parts tranches de tailles
+    voisines, sans jamais séparer deux mots de même premier caractère.
+    """
+    shards = []
+    start = 0
+    while start < len(words):
+        end = min(len(words), start + max(1, (len(words) - start) // (parts - len(shards))))
+        if len(shards) == parts - 1:
+            end = len(words)
+        elif end < len(words):
+            # Aller jusqu'au bout du groupe du premier caractère de words[end - 1]
+            end = _prefix_end(words, words[end - 1][0], end, len(words))
+        shards.append(words[start:end])
+        start = end
+    return shards
+
+def _build_shard(words):
+    """Tâche d'un processus : Trie de words, aplati par _encode_preorder"""
+    return _encode_preorder(HybridTrie.from_words(words).root)
+
+def _process_pool(workers):
+    """
+    Pool de processus pour les constructions et chargements parallèles. Méthode fork
+    quand elle existe : les scripts trie_*.py n'ont pas de garde __main__, les
+    processus ne doivent donc pas réimporter le script appelant. Ailleurs, méthode
+    par défaut de la plateforme.
+    """
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+def _load_shard(path):
+    """Tâche d'un processus : Trie du fichier path lu par from_binary, aplati par _encode_preorder"""
+    return _encode_preorder(HybridTrie.from_binary(path).root)
+
+def _write_manifest(directory, manifest):
+    """Écrire le manifeste d'un instantané partagé, puis retirer les fichiers d'autres générations"""
+    temp_path = os.path.join(directory, SHARD_MANIFEST + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(temp_path, os.path.join(directory, SHARD_MANIFEST))
+    current = {shard["file"] for shard in manifest["shards"]}
+    for file_name in os.listdir(directory):
+        if file_name.startswith("shard_") and file_name not in current:
+            os.remove(os.path.join(directory, file_name))
+
+def _read_manifest(directory, expected_format):
+    """Manifeste d'un instantané partagé ; ValueError s'il n'est pas du format attendu"""
+    with open(os.path.join(directory, SHARD_MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict) or manifest.get("format") != expected_format:
+        raise ValueError(f"{directory}: not a sharded {expected_format} snapshot")
+    if manifest.get("version") != SHARD_VERSION:
+        raise ValueError(f"{directory}: unsupported version {manifest.get('version')}")
+    return manifest
+
+def _encode_preorder(node):
+    """
+    Aplatir un arbre en ordre préfixe (nœud, gauche, milieu, droite) :
+    (caractères, drapeaux BINARY_END / LEFT / MIDDLE / RIGHT), comme to_binary
+    """
+    chars = []
+    flags = bytearray()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        chars.append(node.char)
+        flags.append(
+            (BINARY_END if node.is_end_of_word else 0)
+            | (BINARY_LEFT if node.left is not None else 0)
+            | (BINARY_MIDDLE if node.middle is not None else 0)
+            | (BINARY_RIGHT if node.right is not None else 0)
+        )
+        for child in (node.right, node.middle, node.left):
+            if child is not None:
+                stack.append(child)
+    return "".join(chars), bytes(flags)
+
+def _decode_preorder(chars, flags):
+    """Reconstruire l'arbre aplati par _encode_preorder (sans récursion)"""
+    root = None
+    slots = [(None, None)]
+    for char, flag in zip(chars, flags):
+        node = HybridTrieNode(char, bool(flag & BINARY_END))
+        parent, link = slots.pop()
+        if parent is None:
+            root = node
+        else:
+            setattr(parent, link, node)
+        if flag & BINARY_RIGHT:
+            slots.append((node, "right"))
+        if flag & BINARY_MIDDLE:
+            slots.append((node, "middle"))
+        if flag & BINARY_LEFT:
+            slots.append((node, "left"))
+    return root
+
+
 
 if __name__ == "__main__":
     # Exemple de phrase
@@ -0,0 +1,296 @@
+import json
+from array import array
+
+NIL = 0  # l'indice 0 est réservé : il joue le rôle de None
+
+
+class CompactHybridTrie:
+    """
+    Trie hybride dont les nœuds sont des indices dans des tableaux parallèles
+    (structure de tableaux) au lieu d'objets Python :
+    - chars : code du caractère de chaque nœud
+    - flags : 1 si le nœud est la fin d'un mot
+    - left / middle / right : indices des enfants (NIL = pas d'enfant)
+    Même API que HybridTrie ; self.root est un indice.
+    """
+    def __init__(self):
+        self.chars = array("I", [0])
+        self.flags = array("B", [0])
+        self.left = array("I", [NIL])
+        self.middle = array("I", [NIL])
+        self.right = array("I", [NIL])
+        self.free = []  # indices libérés par la suppression, réutilisés par l'insertion
+        self.root = NIL
+        self.operation_count = {
+            "insert_comparisons": 0,
+            "search_comparisons": 0,
+            "delete_comparisons": 0
+        }
+
+    def _new_node(self, code):
+        """Allouer un nœud (en réutilisant un indice libre si possible)"""
+        if self.free:
+            node = self.free.pop()
+            self.chars[node] = code
+            self.flags[node] = 0
+            self.left[node] = self.middle[node] = self.right[node] = NIL
+            return node
+        self.chars.append(code)
+        self.flags.append(0)
+        self.left.append(NIL)
+        self.middle.append(NIL)
+        self.right.append(NIL)
+        return len(self.chars) - 1
+
+    def __len__(self):
+        """Nombre de nœuds vivants"""
+        return len(self.chars) - 1 - len(self.free)
+
+    def insert(self, word):
+        """Insérer un mot"""
+        chars, left, middle, right = self.chars, self.left, self.middle, self.right
+        node = self.root
+        if node == NIL:
+            node = self.root = self._new_node(ord(word[0]))
+        index = 0
+        last = len(word) - 1
+        comparisons = 0
+
+        while True:
+            code = ord(word[index])
+            if code < chars[node]:
+                comparisons += 1
+                if left[node] == NIL:
+                    left[node] = self._new_node(code)
+                node = left[node]
+            elif code > chars[node]:
+                comparisons += 1
+                if right[node] == NIL:
+                    right[node] = self._new_node(code)
+                node = right[node]
+            else:
+                if index == last:
+                    self.flags[node] = 1
+                    break
+                index += 1
+                if middle[node] == NIL:
+                    middle[node] = self._new_node(ord(word[index]))
+                node = middle[node]
+
+        self.operation_count["insert_comparisons"] += comparisons
+
+    def suppression(self, word):
+        """Supprimer un mot ; les nœuds élagués sont remis dans la liste libre"""
+        chars, flags = self.chars, self.flags
+        path = []
+        parent, link = NIL, None
+        node = self.root
+        index = 0
+        comparisons = 0
+
+        while node != NIL:
+            comparisons += 1
+            path.append((node, parent, link))
+            code = ord(word[index])
+            if code < chars[node]:
+                parent, link, node = node, self.left, self.left[node]
+            elif code > chars[node]:
+                parent, link, node = node, self.right, self.right[node]
+            elif index + 1 == len(word):
+                flags[node] = 0
+                break
+            else:
+                index += 1
+                parent, link, node = node, self.middle, self.middle[node]
+
+        self.operation_count["delete_comparisons"] += comparisons
+
+        for node, parent, link in reversed(path):
+            if (
+                not flags[node]
+                and self.left[node] == NIL
+                and self.middle[node] == NIL
+                and self.right[node] == NIL
+            ):
+                if parent == NIL:
+                    self.root = NIL
+                else:
+                    link[parent] = NIL
+                self.free.append(node)
+
+    def is_empty(self):
+        """Vérifier si le Trie est complètement vide."""
+        return self.root == NIL
+
+    def recherche(self, word):
+        """Rechercher si un mot existe"""
+        chars = self.chars
+        node = self.root
+        index = 0
+        last = len(word) - 1
+        comparisons = 0
+        found = False
+
+        while node != NIL:
+            code = ord(word[index])
+            comparisons += 1
+            if code < chars[node]:
+                node = self.left[node]
+            elif code > chars[node]:
+                node = self.right[node]
+            elif index == last:
+                found = bool(self.flags[node])
+                break
+            else:
+                index += 1
+                node = self.middle[node]
+
+        self.operation_count["search_comparisons"] += comparisons
+        return found
+
+    def _nodes(self, node):
+        """Parcourir (sans récursion) tous les nœuds du sous-arbre de racine node"""
+        stack = [node] if node != NIL else []
+        while stack:
+            node = stack.pop()
+            yield node
+            for child in (self.left[node], self.middle[node], self.right[node]):
+                if child != NIL:
+                    stack.append(child)
+
+    def comptageMots(self, node):
+        """Compter le nombre de mots dans le sous-arbre de racine node"""
+        flags = self.flags
+        return sum(flags[n] for n in self._nodes(node))
+
+    def liste_mots(self):
+        """Lister tous les mots dans l'ordre lexicographique"""
+        result = []
+        # Chaque entrée : (nœud, longueur du préfixe) ; ~nœud signifie « gauche déjà traitée »
+        prefix = []
+        stack = [(self.root, 0)] if self.root != NIL else []
+        while stack:
+            node, depth = stack.pop()
+            if node < 0:
+                # Retour de la branche gauche : traiter le nœud lui-même puis milieu et droite
+                node = ~node
+                del prefix[depth:]
+                prefix.append(chr(self.chars[node]))
+                if self.flags[node]:
+                    result.append("".join(prefix))
+                if self.right[node] != NIL:
+                    stack.append((self.right[node], depth))
+                if self.middle[node] != NIL:
+                    stack.append((self.middle[node], depth + 1))
+                continue
+            stack.append((~node, depth))
+            if self.left[node] != NIL:
+                stack.append((self.left[node], depth))
+        return result
+
+    def comptage_nil(self):
+        """Compter le nombre de pointeurs NULL"""
+        count = 0
+        for node in self._nodes(self.root):
+            count += (self.left[node] == NIL) + (self.middle[node] == NIL) + (self.right[node] == NIL)
+        return count
+
+    def hauteur(self):
+        """Calculer la hauteur de l'arbre"""
+        best = 0
+        stack = [(self.root, 1)] if self.root != NIL else []
+        while stack:
+            node, height = stack.pop()
+            if height > best:
+                best = height
+            for child in (self.left[node], self.middle[node], self.right[node]):
+                if child != NIL:
+                    stack.append((child, height + 1))
+        return best
+
+    def profondeur_moyenne(self):
+        """Calculer la profondeur moyenne des fins de mots dans l'arbre"""
+        total_depth = 0
+        leaf_count = 0
+        stack = [(self.root, 0)] if self.root != NIL else []
+        while stack:
+            node, depth = stack.pop()
+            if self.flags[node]:
+                total_depth += depth
+                leaf_count += 1
+            for child in (self.left[node], self.middle[node], self.right[node]):
+                if child != NIL:
+                    stack.append((child, depth + 1))
+        if leaf_count == 0:
+            return 0
+        return total_depth / leaf_count
+
+    def prefixe(self, prefix):
+        """Compter le nombre de mots commençant par un préfixe donné"""
+        if not prefix:
+            return self.comptageMots(self.root)
+        chars = self.chars
+        node = self.root
+        index = 0
+        while node != NIL:
+            code = ord(prefix[index])
+            if code < chars[node]:
+                node = self.left[node]
+            elif code > chars[node]:
+                node = self.right[node]
+            elif index + 1 == len(prefix):
+                return self.comptageMots(self.middle[node])
+            else:
+                index += 1
+                node = self.middle[node]
+        return 0
+
+    # Conversion vers / depuis le format dictionnaire de HybridTrie
+    def to_dict(self):
+        """Convertir le Trie en format dictionnaire (même schéma que HybridTrie)"""
+        if self.root == NIL:
+            return {}
+        result = {}
+        stack = [(self.root, result)]
+        while stack:
+            node, data = stack.pop()
+            data["char"] = chr(self.chars[node])
+            data["is_end_of_word"] = bool(self.flags[node])
+            for key, links in (("left", self.left), ("middle", self.middle), ("right", self.right)):
+                child = links[node]
+                if child == NIL:
+                    data[key] = None
+                else:
+                    data[key] = {}
+                    stack.append((child, data[key]))
+        return result
+
+    def to_json(self, file_path):
+        """Sauvegarder le Trie sous forme de fichier JSON"""
+        with open(file_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Charger un Trie à partir d'un dictionnaire produit par HybridTrie.to_dict"""
+        trie = cls()
+        if not data:
+            return trie
+        trie.root = trie._new_node(ord(data["char"]))
+        stack = [(trie.root, data)]
+        while stack:
+            node, node_data = stack.pop()
+            trie.flags[node] = 1 if node_data["is_end_of_word"] else 0
+            for key, links in (("left", trie.left), ("middle", trie.middle), ("right", trie.right)):
+                child_data = node_data.get(key)
+                if child_data:
+                    child = trie._new_node(ord(child_data["char"]))
+                    links[node] = child
+                    stack.append((child, child_data))
+        return trie
+
+    @classmethod
+    def from_json(cls, file_path):
+        """Charger un Trie depuis un fichier JSON"""
+        with open(file_path, "r") as f:
+            return cls.from_dict(json.load(f))
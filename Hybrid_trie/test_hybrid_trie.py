@@ -0,0 +1,346 @@
+import os
+import sys
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+from hybrid_trie import HybridTrie, HybridTrieNode, _encode_preorder
+from hybrid_trie_compact import CompactHybridTrie
+
+# Tests de comportement du Trie hybride : python test_hybrid_trie.py (ou pytest)
+# Contrairement à hb_test.py, chaque test vérifie ses résultats (assert) et
+# n'écrit aucun fichier dans le dossier courant.
+
+
+def mots_aleatoires(n, seed=0, alphabet="abcd", longueur=6):
+    """n mots aléatoires (doublons et préfixes communs fréquents)"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, longueur))) for _ in range(n)]
+
+
+# Version récursive d'origine de insert / suppression : forme de référence
+def _insert_reference(node, word, index):
+    char = word[index]
+    if node is None:
+        node = HybridTrieNode(char)
+    if char < node.char:
+        node.left = _insert_reference(node.left, word, index)
+    elif char > node.char:
+        node.right = _insert_reference(node.right, word, index)
+    elif index + 1 == len(word):
+        node.is_end_of_word = True
+    else:
+        node.middle = _insert_reference(node.middle, word, index + 1)
+    return node
+
+def _suppression_reference(node, word, index):
+    if node is None:
+        return None
+    char = word[index]
+    if char < node.char:
+        node.left = _suppression_reference(node.left, word, index)
+    elif char > node.char:
+        node.right = _suppression_reference(node.right, word, index)
+    elif index + 1 == len(word):
+        node.is_end_of_word = False
+    else:
+        node.middle = _suppression_reference(node.middle, word, index + 1)
+    if not node.is_end_of_word and node.left is None and node.middle is None and node.right is None:
+        return None
+    return node
+
+
+def _stats_et_tailles(trie):
+    """
+    Copie des statistiques et, pour chaque nœud (ordre préfixe), de words et de
+    size (seulement si les champs size sont tenus à jour)
+    """
+    stats = {key: list(value) if isinstance(value, list) else value for key, value in trie.stats.items()}
+    nodes = []
+    stack = [trie.root] if trie.root else []
+    while stack:
+        node = stack.pop()
+        nodes.append((node.char, node.words, node.size if trie._sizes_valid else None))
+        stack.extend(child for child in (node.right, node.middle, node.left) if child is not None)
+    return stats, nodes
+
+def _verifier_recomptage(trie):
+    """Les statistiques (et les champs size valides) doivent égaler un recomptage complet"""
+    before = _stats_et_tailles(trie)
+    sizes_valid = trie._sizes_valid
+    trie.enable_stats()
+    if sizes_valid:
+        trie._compute_sizes()
+    assert _stats_et_tailles(trie) == before
+
+
+def test_insert_suppression_forme_reference():
+    words = mots_aleatoires(400)
+    trie = HybridTrie()
+    reference = None
+    for word in words:
+        trie.insert(word)
+        reference = _insert_reference(reference, word, 0)
+    assert trie.to_dict() == reference.to_dict()
+    assert trie.liste_mots() == sorted(set(words))
+
+    for word in mots_aleatoires(300, seed=1):
+        trie.suppression(word)
+        reference = _suppression_reference(reference, word, 0)
+        assert trie.to_dict() == (reference.to_dict() if reference else {})
+
+def test_recherche():
+    words = mots_aleatoires(300)
+    trie = HybridTrie()
+    for word in words:
+        trie.insert(word)
+    for word in mots_aleatoires(300, seed=2):
+        assert trie.recherche(word) == (word in words)
+
+def test_mot_long_sans_recursion():
+    # Un seul mot plus long que la limite de récursion
+    word = "ab" * 3000
+    trie = HybridTrie()
+    trie.insert(word)
+    assert trie.recherche(word)
+    assert not trie.recherche(word[:-1])
+    trie.suppression(word)
+    assert trie.root is None
+
+def test_iter_words():
+    words = mots_aleatoires(400) + ["ab", "abc"]
+    trie = HybridTrie()
+    for word in words:
+        trie.insert(word)
+    all_words = trie.liste_mots()
+    assert all_words == sorted(set(words))
+    # « ab » est lui-même un mot, « x » et « abx » sont absents
+    for prefix in ("a", "ab", "abc", "dd", "x", "abx", None):
+        expected = [word for word in all_words if prefix is None or word.startswith(prefix)]
+        for limit in (None, 0, 1, 3, 1000):
+            result = list(trie.iter_words(prefix, limit))
+            assert result == (expected if limit is None else expected[:limit])
+    assert list(HybridTrie().iter_words("a")) == []
+
+def _lire_binaire_invalide(path):
+    """Message de la ValueError levée par from_binary"""
+    try:
+        HybridTrie.from_binary(path)
+    except ValueError as e:
+        return str(e)
+    assert False, f"{path} aurait dû être refusé"
+
+def test_binaire_aller_retour():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "trie.bin")
+        # Mot plus long que la limite de récursion et caractères larges (BINARY_WIDE)
+        long_word = "ab" * 3000
+        trie = HybridTrie()
+        for word in mots_aleatoires(300) + [long_word, long_word + "c", "é", "aé€"]:
+            trie.insert(word)
+        trie.to_binary(path)
+        loaded = HybridTrie.from_binary(path)
+        assert _encode_preorder(loaded.root) == _encode_preorder(trie.root)
+        assert loaded.recherche(long_word) and loaded.recherche("aé€")
+
+        # Trie vide
+        HybridTrie().to_binary(path)
+        assert HybridTrie.from_binary(path).root is None
+
+        # Fichier tronqué (en-tête ou nœuds) et mauvais identifiant
+        trie.to_binary(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        for size, message in ((5, "truncated header"), (len(data) - 3, "truncated node records")):
+            with open(path, "wb") as f:
+                f.write(data[:size])
+            assert message in _lire_binaire_invalide(path)
+        with open(path, "wb") as f:
+            f.write(b"XXXX" + data[4:])
+        assert "not a HybridTrie binary snapshot" in _lire_binaire_invalide(path)
+
+def test_compact_meme_trie():
+    trie = HybridTrie()
+    compact = CompactHybridTrie()
+    for word in mots_aleatoires(400):
+        trie.insert(word)
+        compact.insert(word)
+    for word in mots_aleatoires(150, seed=1):
+        trie.suppression(word)
+        compact.suppression(word)
+    assert compact.to_dict() == trie.to_dict()
+    assert compact.liste_mots() == trie.liste_mots()
+    assert compact.hauteur() == trie.hauteur()
+    assert compact.profondeur_moyenne() == trie.profondeur_moyenne()
+    assert compact.comptage_nil() == trie.comptage_nil()
+    for prefix in ("a", "ab", "dc", "x"):
+        assert compact.prefixe(prefix) == trie.prefixe(prefix)
+    for word in mots_aleatoires(200, seed=2):
+        assert compact.recherche(word) == trie.recherche(word)
+    # Aller-retour par to_dict / from_dict
+    assert CompactHybridTrie.from_dict(trie.to_dict()).to_dict() == trie.to_dict()
+
+def test_recherche_many():
+    trie = HybridTrie()
+    for word in mots_aleatoires(300):
+        trie.insert(word)
+    queries = mots_aleatoires(300, seed=2) + ["a", "abcdabcd"]
+    expected = [trie.recherche(word) for word in queries]
+    assert trie.recherche_many(queries) == expected
+    # Un générateur n'est lu qu'une fois
+    assert trie.recherche_many(word for word in queries) == expected
+
+def _hauteur_freres(node):
+    """Plus grande hauteur d'un ABR de frères (arêtes left / right seulement)"""
+    def niveau(node):
+        if node is None:
+            return 0, 0
+        left, left_max = niveau(node.left)
+        right, right_max = niveau(node.right)
+        return 1 + max(left, right), max(left_max, right_max, _hauteur_freres(node.middle))
+    height, inner = niveau(node)
+    return max(height, inner)
+
+def test_insert_with_balance():
+    # Liste triée : insert ferait du premier niveau une chaîne de 16 frères
+    words = sorted(set(mots_aleatoires(500, alphabet="abcdefghijklmnop")))
+    trie = HybridTrie(stats=True)
+    for word in words:
+        trie.insert_with_balance(word)
+    assert trie.liste_mots() == words
+    assert _hauteur_freres(trie.root) <= 6
+    # Statistiques maintenues égales à un recomptage complet
+    stats = {key: list(value) if isinstance(value, list) else value for key, value in trie.stats.items()}
+    trie.enable_stats()
+    assert trie.stats == stats
+    # Ancienne signature (depth_threshold, balance_threshold) acceptée et sans effet
+    old = HybridTrie()
+    for word in words:
+        old.insert_with_balance(word, 3, 2)
+    assert old.to_dict() == trie.to_dict()
+
+def test_shards_aller_retour():
+    trie = HybridTrie()
+    for word in mots_aleatoires(400, alphabet="abcdefgh") + ["é", "ab" * 2500]:
+        trie.insert(word)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trie.to_shards(tmp_dir)
+        # Réécriture : nouvelle génération, les anciens fichiers sont retirés
+        trie.to_shards(tmp_dir)
+        assert len(os.listdir(tmp_dir)) == 1 + 9
+        for workers in (1, 2):
+            # Comparaison sans récursion (to_dict ne supporte pas le mot long)
+            loaded = HybridTrie.from_shards(tmp_dir, workers=workers)
+            assert _encode_preorder(loaded.root) == _encode_preorder(trie.root)
+        # Lecture de la seule branche du préfixe (prefixe est récursif : pas la branche du mot long)
+        partial = HybridTrie.from_shards(tmp_dir, prefix="cd")
+        assert partial.prefixe("cd") == trie.prefixe("cd")
+        assert partial.liste_mots() == [word for word in trie.liste_mots() if word.startswith("c")]
+        assert HybridTrie.from_shards(tmp_dir, prefix="z").root is None
+
+def test_statistiques_insert_suppression():
+    # insert / suppression simples sur un Trie avec statistiques, comparé à un Trie sans
+    words = mots_aleatoires(500)
+    deleted = mots_aleatoires(250, seed=1) + ["absent", "abcdabcd"]
+    trie = HybridTrie(stats=True)
+    plain = HybridTrie()
+    for word in words:
+        trie.insert(word)
+        plain.insert(word)
+    for word in deleted:
+        trie.suppression(word)
+        plain.suppression(word)
+    _verifier_recomptage(trie)
+    assert trie.comptageMots(trie.root) == plain.comptageMots(plain.root) == len(set(words) - set(deleted))
+    assert trie.comptage_noeuds() == plain.comptage_noeuds()
+    assert trie.hauteur() == plain.hauteur()
+    assert trie.comptage_nil() == plain.comptage_nil()
+    assert trie.profondeur_moyenne() == plain.profondeur_moyenne()
+    # prefixe en O(|prefix|) : comptage brut, sans le préfixe lui-même (comme trie_prefixe.py)
+    remaining = set(words) - set(deleted)
+    for prefix in ("a", "ab", "abc", "dcb", "x") + tuple(mots_aleatoires(50, seed=2)):
+        expected = sum(1 for word in remaining if word.startswith(prefix) and word != prefix)
+        assert trie.prefixe(prefix) == plain.prefixe(prefix) == expected
+    # Tout supprimer : statistiques à zéro
+    for word in words:
+        trie.suppression(word)
+    assert trie.root is None and trie.stats["words"] == 0 and trie.stats["nodes"] == 0
+    assert trie.hauteur() == 0 and trie.comptage_nil() == 0
+
+def test_fusion():
+    # Mots préfixes les uns des autres, caractères communs et absents à chaque niveau
+    first = mots_aleatoires(300) + ["ab", "abc", "abcd", "x"]
+    second = mots_aleatoires(300, seed=1) + ["a", "abcde", "abd", "y"]
+    for first_stats, second_stats in ((False, False), (True, False), (True, True)):
+        trie = HybridTrie(stats=first_stats)
+        other = HybridTrie(stats=second_stats)
+        reference = HybridTrie()
+        for word in first:
+            trie.insert(word)
+            reference.insert(word)
+        for word in second:
+            other.insert(word)
+        for word in second:
+            reference.insert(word)
+        # Même forme que l'insertion des mots de second après ceux de first
+        assert trie.fusion(other).to_dict() == reference.to_dict()
+        if first_stats:
+            _verifier_recomptage(trie)
+        # Les nœuds de other sont repris : other est vidé
+        assert other.root is None and other.liste_mots() == []
+        if second_stats:
+            assert other.stats["words"] == 0 and other.stats["nodes"] == 0
+
+    # Tries construits par insert_with_balance : champs size valides, maintenus par la fusion
+    trie = HybridTrie(stats=True)
+    other = HybridTrie(stats=True)
+    for word in first:
+        trie.insert_with_balance(word)
+    for word in second:
+        other.insert_with_balance(word)
+    trie.fusion(other)
+    assert trie._sizes_valid
+    assert trie.liste_mots() == sorted(set(first + second))
+    _verifier_recomptage(trie)
+
+    # Un côté vide
+    words = mots_aleatoires(100)
+    trie = HybridTrie()
+    for word in words:
+        trie.insert(word)
+    expected = trie.to_dict()
+    assert trie.fusion(HybridTrie()).to_dict() == expected
+    assert HybridTrie().fusion(trie).to_dict() == expected
+    assert trie.root is None
+
+def test_from_words():
+    # Entrée non triée, avec doublons et mot vide : mêmes mots qu'avec insert
+    words = mots_aleatoires(800, alphabet="abcdefghijklmnop")
+    trie = HybridTrie.from_words(words + [""])
+    reference = HybridTrie()
+    for word in words:
+        reference.insert(word)
+    assert trie.liste_mots() == reference.liste_mots() == sorted(set(words))
+    # Chaque niveau de frères est un ABR équilibré (16 lettres : hauteur 5 au plus)
+    assert _hauteur_freres(trie.root) <= 5
+    # Caractère U+10FFFF au milieu d'un groupe
+    words = ["c", "c\U0010ffff", "c\U0010ffffa", "c\U0010ffff\U0010ffff", "cz", "\U0010ffff"]
+    trie = HybridTrie.from_words(words)
+    assert trie.liste_mots() == sorted(words)
+    assert all(trie.recherche(word) for word in words)
+    assert HybridTrie.from_words_parallel(words, workers=3).to_dict() == trie.to_dict()
+
+def test_from_words_parallel():
+    words = mots_aleatoires(600, alphabet="abcdefgh") + ["é"]
+    expected = HybridTrie.from_words(words).to_dict()
+    for workers in (1, 2, 3):
+        assert HybridTrie.from_words_parallel(words, workers=workers).to_dict() == expected
+    assert HybridTrie.from_words_parallel([], workers=2).root is None
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -1,7 +1,7 @@
 import sys
-import json
 import os
-from hybrid_trie import HybridTrie
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 # 检查参数数量
 if len(sys.argv) < 3:
@@ -20,42 +20,23 @@ file1_path = os.path.join(result_dir, file1)
 file2_path = os.path.join(result_dir, file2)
 output_file = os.path.join(result_dir, "trie.json")  # 合并后的结果文件
 
-# 加载两棵树
+# 加载两棵树（快照加日志）
 try:
-    with open(file1_path, "r") as f1:
-        trie1 = HybridTrie.from_dict(json.load(f1))
+    trie1 = journal.charger(1, file1_path)
 except FileNotFoundError:
     print(f"Error: {file1_path} not found.")
     sys.exit(1)
 
 try:
-    with open(file2_path, "r") as f2:
-        trie2 = HybridTrie.from_dict(json.load(f2))
+    trie2 = journal.charger(1, file2_path)
 except FileNotFoundError:
     print(f"Error: {file2_path} not found.")
     sys.exit(1)
 
-# 融合两棵树
-all_words = set(trie1.liste_mots() + trie2.liste_mots())  # 合并去重的单词列表
-fused_trie = HybridTrie()
-for word in all_words:
-    fused_trie.insert(word)
+# 融合两棵树：trie2 的节点直接并入 trie1，代价取决于 trie2 而非整棵 trie1
+fused_trie = trie1.fusion(trie2)
 
-# 保存融合后的树到 result 文件夹
-fused_trie.to_json(output_file)
+# 保存融合后的树到 result 文件夹（同时清空旧日志）
+journal.sauvegarder(output_file, fused_trie)
 print(f"Fusion of {file1} and {file2} saved to {output_file}")
-
-# 打印两棵树的单词列表
-words1 = trie1.liste_mots()
-words2 = trie2.liste_mots()
-fused_words = fused_trie.liste_mots()
-
-print(f"Words in {file1}: {words1}")
-print(f"Words in {file2}: {words2}")
-print(f"Words in the fused trie: {fused_words}")
-
-# 验证融合是否正确
-if set(fused_words) == set(words1 + words2):
-    print("Fusion is correct: All words from both tries are present.")
-else:
-    print("Fusion is incorrect: Missing or duplicate words detected.")
+print(f"Words in the fused trie: {fused_trie.comptageMots(fused_trie.root)}")
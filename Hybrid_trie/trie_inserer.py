@@ -1,7 +1,9 @@
 import os
 import sys
-import json
-from hybrid_trie import HybridTrie
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Corpus"))
+import journal
+import corpus
 
 # Vérifier le nombre de paramètres
 if len(sys.argv) < 3:
@@ -21,26 +23,23 @@ output_file = os.path.join(output_folder, "trie.json")
 # S'assurer que le dossier de sortie existe
 os.makedirs(output_folder, exist_ok=True)
 
-# Charger un arbre existant ou en créer un nouveau
-try:
-    with open(output_file, "r") as f:
-        data = json.load(f)
-        trie = HybridTrie.from_dict(data)
-except FileNotFoundError:
+# Charger un arbre existant (instantané puis journal) ou en créer un nouveau
+if not os.path.exists(output_file) and not os.path.exists(journal.log_path(output_file)):
     print(f"File {output_file} not found. Creating a new Trie.")
-    trie = HybridTrie()
+trie = journal.charger(1, output_file, missing_ok=True)
 
-# Insérer les mots
+# Lire les mots
 try:
-    with open(file_name, "r") as f:
-        for line in f:
-            word = line.strip()
-            print(f"Inserting word: {word}")  # Afficher le mot inséré
-            trie.insert(word)
+    words = corpus.mots(file_name, lower=False)
 except FileNotFoundError:
     print(f"Error: {file_name} not found.")
     sys.exit(1)
-
-# Sauvegarder l'arbre dans un fichier JSON
-trie.to_json(output_file)
-print(f"Inserted words from {file_name} and saved to {output_file}")
+for word in words:
+    print(f"Inserting word: {word}")  # Afficher le mot inséré
+
+# Insérer les mots : seules les insertions sont écrites (journal),
+# l'arbre n'est réécrit dans le fichier JSON qu'à la compaction
+if journal.journaliser(1, output_file, trie, journal.INSERT, words):
+    print(f"Inserted words from {file_name} and saved to {output_file}")
+else:
+    print(f"Inserted words from {file_name} and logged to {journal.log_path(output_file)}")
@@ -1,7 +1,7 @@
 import os
 import sys
-import json
-from hybrid_trie import HybridTrie
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 if len(sys.argv) < 1:
     print("Usage: python trie_listeMots.py <file.json>")
@@ -22,8 +22,7 @@ os.makedirs(output_folder, exist_ok=True)
 
 # Charger l'arbre
 try:
-    with open(input_path, "r") as f:
-        trie = HybridTrie.from_dict(json.load(f))
+    trie = journal.charger(1, input_path)
 except FileNotFoundError:
     print(f"Error: {input_path} not found.")
     sys.exit(1)
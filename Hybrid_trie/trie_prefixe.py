@@ -1,7 +1,10 @@
 import os
 import sys
-import json
-from hybrid_trie import HybridTrie
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Frozen_trie"))
+from frozen_trie import FrozenTrie
 
 # Vérifier le nombre de paramètres
 if len(sys.argv) < 3:
@@ -18,17 +21,21 @@ output_file = os.path.join(output_folder, "prefixe.txt")  # Sauvegarder les rés
 # S'assurer que le dossier de sortie existe
 os.makedirs(output_folder, exist_ok=True)
 
-# Charger l'arbre
+# Charger l'arbre (un trie gelé est interrogé directement via mmap)
 try:
-    with open(input_file, "r") as f:
-        trie = HybridTrie.from_dict(json.load(f))
+    if FrozenTrie.is_frozen(input_file):
+        with FrozenTrie(input_file) as frozen:
+            # Même convention que HybridTrie.prefixe : le préfixe lui-même n'est pas compté
+            prefix_count = frozen.prefixe(prefix) - frozen.recherche(prefix)
+    else:
+        # Instantané partagé : seule la branche du préfixe est lue
+        trie = journal.charger(1, input_file, prefix=prefix)
+        # Calculer le nombre de mots avec le préfixe
+        prefix_count = trie.prefixe(prefix)
 except FileNotFoundError:
     print(f"Error: {input_file} not found.")
     sys.exit(1)
 
-# Calculer le nombre de mots avec le préfixe
-prefix_count = trie.prefixe(prefix)
-
 # Sauvegarder les résultats dans un fichier
 try:
     with open(output_file, "w") as f:
@@ -1,7 +1,7 @@
 import os
-import json
 import sys
-from hybrid_trie import HybridTrie  
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 if len(sys.argv) < 2:
     print("Usage: python trie_listeMots.py <file.json>")
     sys.exit(1)
@@ -20,9 +20,7 @@ os.makedirs(output_folder, exist_ok=True)
 
 # Charger l'arbre
 try:
-    with open(input_file, "r") as f:
-        data = json.load(f)
-        trie = HybridTrie.from_dict(data)
+    trie = journal.charger(1, input_file)
 except FileNotFoundError:
     print(f"Error: {input_file} not found.")
     exit(1)
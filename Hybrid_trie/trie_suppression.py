@@ -1,7 +1,7 @@
 import sys
-import json
 import os  
-from hybrid_trie import HybridTrie
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 # Vérifier le nombre de paramètres
 if len(sys.argv) < 3:
@@ -20,32 +20,32 @@ input_file = os.path.join(result_dir, "trie.json")
 output_file = os.path.join(result_dir, "trie.json")
 
 
-# Charger un arbre existant ou en créer un nouveau
+# Charger un arbre existant (instantané puis journal) ou en créer un nouveau
 try:
-    with open(input_file, "r") as f:
-        data = json.load(f)
-        trie = HybridTrie.from_dict(data)
-        print(f"Loaded tree from {input_file}.")
-        print("Initial words in the tree:", trie.liste_mots())
+    trie = journal.charger(1, input_file)
+    print(f"Loaded tree from {input_file}.")
+    print("Initial words in the tree:", trie.liste_mots())
 except FileNotFoundError:
     print(f"File {input_file} not found. Creating a new Trie.")
-    trie = HybridTrie()
+    trie = journal.charger(1, input_file, missing_ok=True)
 
 
 # Supprimer des mots
 try:
     with open(words_file, "r") as f:
-        for line in f:
-            word = line.strip()
-            print(f"Attempting to delete word: '{word}'")
-            if trie.recherche(word):  # Vérifier si le mot existe
-                trie.suppression(word)
-                print(f"Successfully deleted '{word}'.")
-            else:
-                print(f"Word '{word}' not found in the tree. No action taken.")
+        words = [line.strip() for line in f]
 except FileNotFoundError:
     print(f"Error: {words_file} not found.")
     sys.exit(1)
+deleted = set()
+for word in words:
+    print(f"Attempting to delete word: '{word}'")
+    if word and word not in deleted and trie.recherche(word):  # Vérifier si le mot existe
+        deleted.add(word)
+        print(f"Successfully deleted '{word}'.")
+    else:
+        print(f"Word '{word}' not found in the tree. No action taken.")
+compacted = journal.journaliser(1, output_file, trie, journal.DELETE, words)
 
 # Vérifier si l'arbre est vide
 if trie.is_empty():
@@ -53,7 +53,8 @@ if trie.is_empty():
 else:
     print("The tree still contains nodes.")
 
-# Sauvegarder l'arbre modifié dans le dossier result
-with open(output_file, "w") as f:
-    json.dump(trie.to_dict(), f, indent=4)
-print(f"Modified tree saved to {output_file}.")
+# Seules les suppressions sont écrites (journal) ; l'arbre est réécrit à la compaction
+if compacted:
+    print(f"Modified tree saved to {output_file}.")
+else:
+    print(f"Deletions logged to {journal.log_path(output_file)}.")
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+from patricia import PatriciaTrie, suppression_many
+from hybrid_trie import HybridTrie
+
+# Journal des modifications d'un instantané (pat.json, trie.json...) :
+# un fichier <instantané>.log à côté, une ligne par opération, ajoutée en fin de fichier :
+#   +mot   insertion
+#   -mot   suppression
+# Au chargement, l'instantané est lu puis le journal rejoué. Quand le journal dépasse
+# COMPACTION_THRESHOLD octets, il est replié dans un nouvel instantané puis vidé.
+# Rejouer un journal sur un instantané qui le contient déjà donne le même trie
+# (pour chaque mot, seule la dernière opération compte) : une compaction
+# interrompue entre l'écriture de l'instantané et la troncature du journal est sans danger.
+LOG_SUFFIX = ".log"
+COMPACTION_THRESHOLD = 1 << 20
+INSERT, DELETE = "+", "-"
+
+
+def log_path(path):
+    return path + LOG_SUFFIX
+
+def _nouveau(x):
+    return PatriciaTrie() if x == 0 else HybridTrie()
+
+def appliquer(x, trie, op, words):
+    """Appliquer en mémoire une opération sur une liste de mots"""
+    if op == INSERT:
+        if x == 0:
+            trie.inserer_many(words)
+        else:
+            # L'ordre d'insertion fixe la forme du trie hybride : pas de tri
+            for word in words:
+                trie.insert(word)
+    elif x == 0:
+        suppression_many(trie, words)
+    else:
+        for word in words:
+            if trie.recherche(word):
+                trie.suppression(word)
+
+
+def charger(x, path, missing_ok=False, prefix=None):
+    """
+    Charger l'instantané path (0 = Patricia, 1 = hybride) et rejouer son journal.
+    path peut être un fichier JSON ou le dossier d'un instantané partagé (to_shards) ;
+    dans ce cas, avec prefix, seules les branches utiles à ce préfixe sont lues.
+    Sans instantané, le trie part vide si missing_ok ou si un journal existe ;
+    sinon FileNotFoundError. Une dernière ligne incomplète (écriture interrompue)
+    est ignorée. Lève json.JSONDecodeError si l'instantané est illisible.
+    """
+    try:
+        if os.path.isdir(path):
+            trie = (PatriciaTrie if x == 0 else HybridTrie).from_shards(path, prefix)
+        elif x == 0:
+            trie = PatriciaTrie.from_json(path)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                trie = HybridTrie.from_dict(json.load(f))
+    except FileNotFoundError:
+        if not (missing_ok or os.path.exists(log_path(path))):
+            raise
+        trie = _nouveau(x)
+
+    try:
+        with open(log_path(path), "r", encoding="utf-8") as f:
+            # Regrouper les opérations consécutives de même sens (suppression_many)
+            op, words = None, []
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                if line[0] != op:
+                    if words:
+                        appliquer(x, trie, op, words)
+                    op, words = line[0], []
+                words.append(line[1:-1])
+            if words:
+                appliquer(x, trie, op, words)
+    except FileNotFoundError:
+        pass
+    return trie
+
+def journaliser(x, path, trie, op, words, threshold=COMPACTION_THRESHOLD):
+    """
+    Ajouter l'opération op (INSERT ou DELETE) sur words au journal de path, puis
+    l'appliquer à trie (déjà chargé par charger). Coût disque O(len(words)) ;
+    compacte si le journal dépasse threshold octets. Retourne True si compacté.
+    """
+    words = [word for word in words if word and "\n" not in word]
+    if op not in (INSERT, DELETE):
+        raise ValueError(f"unknown log operation {op!r}")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    _retirer_ligne_incomplete(log_path(path))
+    with open(log_path(path), "a", encoding="utf-8") as f:
+        f.write("".join(op + word + "\n" for word in words))
+    appliquer(x, trie, op, words)
+    if os.path.getsize(log_path(path)) > threshold:
+        sauvegarder(path, trie)
+        return True
+    return False
+
+def _retirer_ligne_incomplete(log):
+    """Tronquer le journal après sa dernière ligne complète (écriture interrompue)"""
+    try:
+        f = open(log, "rb+")
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            block = f.read(position - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+
+def sauvegarder(path, trie):
+    """
+    Écrire trie comme instantané complet de path (fichier temporaire puis
+    remplacement atomique, ou to_shards si path est un instantané partagé) et
+    supprimer le journal, désormais contenu dedans : c'est la compaction, et
+    aussi l'écriture d'un trie remplacé en entier.
+    """
+    if os.path.isdir(path):
+        trie.to_shards(path)
+    else:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = path + ".tmp"
+        trie.to_json(temp_path)
+        os.replace(temp_path, path)
+    try:
+        os.remove(log_path(path))
+    except FileNotFoundError:
+        pass
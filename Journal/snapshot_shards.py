@@ -0,0 +1,38 @@
+import os
+import sys
+import json
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+import journal
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python snapshot_shards.py <x> <arbre.json> [output_directory]")
+        sys.exit(1)
+
+    x = int(sys.argv[1])  # 0 = Patricia, 1 = Trie hybride
+    input_file = sys.argv[2]
+    output_dir = sys.argv[3] if len(sys.argv) > 3 else os.path.splitext(input_file)[0] + ".shards"
+
+    # L'instantané et son journal sont lus ; le trie obtenu est écrit en un fichier
+    # par branche du premier niveau, plus le manifeste
+    try:
+        trie = journal.charger(x, input_file)
+    except FileNotFoundError:
+        print(f"Error: File {input_file} not found.")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error decoding JSON from {input_file}: {e}")
+        sys.exit(1)
+
+    try:
+        trie.to_shards(output_dir)
+        print(f"Sharded snapshot has been saved to {output_dir}")
+    except IOError as e:
+        print(f"Error saving sharded snapshot to {output_dir}: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+import journal
+from patricia import liste_mots
+
+# Tests du journal d'opérations : python test_journal.py (ou pytest)
+# Chaque test travaille dans un dossier temporaire.
+
+
+def mots_aleatoires(n, seed=0, alphabet="abcd", longueur=6):
+    """n mots aléatoires (doublons et préfixes communs fréquents)"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, longueur))) for _ in range(n)]
+
+def mots_de(x, trie):
+    return liste_mots(trie) if x == 0 else trie.liste_mots()
+
+
+def test_rejouer_journal():
+    # Instantané, puis insertions et suppressions journalisées : charger doit
+    # redonner le trie modifié en mémoire (même forme pour le trie hybride)
+    for x in (0, 1):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trie.json")
+            trie = journal._nouveau(x)
+            journal.appliquer(x, trie, journal.INSERT, mots_aleatoires(200))
+            journal.sauvegarder(path, trie)
+
+            assert not journal.journaliser(x, path, trie, journal.INSERT, mots_aleatoires(100, seed=1))
+            assert not journal.journaliser(x, path, trie, journal.DELETE, mots_aleatoires(100, seed=2))
+            assert not journal.journaliser(x, path, trie, journal.INSERT, mots_aleatoires(50, seed=3))
+            assert os.path.exists(journal.log_path(path))
+
+            loaded = journal.charger(x, path)
+            assert mots_de(x, loaded) == mots_de(x, trie)
+            assert loaded.to_dict() == trie.to_dict()
+
+def test_compaction():
+    for x in (0, 1):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Le dossier de l'instantané n'existe pas encore
+            path = os.path.join(tmp_dir, "result", "trie.json")
+            trie = journal.charger(x, path, missing_ok=True)
+            assert not journal.journaliser(x, path, trie, journal.INSERT, ["abc", "abd"], threshold=12)
+            # Le journal dépasse le seuil : repli dans l'instantané, journal supprimé
+            assert journal.journaliser(x, path, trie, journal.INSERT, ["bcd", "bce"], threshold=12)
+            assert not os.path.exists(journal.log_path(path))
+            assert mots_de(x, journal.charger(x, path)) == ["abc", "abd", "bcd", "bce"]
+
+def test_ligne_incomplete():
+    for x in (0, 1):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trie.json")
+            trie = journal.charger(x, path, missing_ok=True)
+            journal.journaliser(x, path, trie, journal.INSERT, ["abc"])
+            # Écriture interrompue : la dernière ligne n'a pas de fin de ligne
+            with open(journal.log_path(path), "a", encoding="utf-8") as f:
+                f.write("+ab")
+            assert mots_de(x, journal.charger(x, path)) == ["abc"]
+            # L'opération suivante retire la ligne incomplète avant d'écrire
+            journal.journaliser(x, path, trie, journal.DELETE, ["abc"])
+            journal.journaliser(x, path, trie, journal.INSERT, ["bd"])
+            with open(journal.log_path(path), "r", encoding="utf-8") as f:
+                assert f.read() == "+abc\n-abc\n+bd\n"
+            assert mots_de(x, journal.charger(x, path)) == ["bd"]
+
+def test_instantane_absent():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "trie.json")
+        try:
+            journal.charger(0, path)
+        except FileNotFoundError:
+            pass
+        else:
+            assert False, "charger doit lever FileNotFoundError sans instantané ni journal"
+        assert liste_mots(journal.charger(0, path, missing_ok=True)) == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
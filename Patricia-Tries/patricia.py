@@ -1,16 +1,148 @@
 import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+
+# Au-delà de ce nombre d'enfants, un nœud range ses enfants dans un dictionnaire
+SMALL_FANOUT = 4
+# Table d'enfants vide partagée par toutes les feuilles (lecture seule)
+EMPTY_CHILDREN = MappingProxyType({})
+# Taille des blocs lus ou écrits par to_json / from_json
+JSON_CHUNK = 1 << 16
+# Instantané partagé (to_shards / from_shards) : un dossier avec un fichier JSON par
+# enfant de la racine et un manifeste qui les liste
+SHARD_MANIFEST = "manifest.json"
+SHARD_VERSION = 1
+# Un lexème JSON précédé de blancs : chaîne, ponctuation, littéral / nombre, tout
+# autre caractère (erreur ou chaîne coupée en fin de bloc) ou la fin du bloc. Chaque
+# correspondance de finditer commence ainsi exactement où la précédente s'arrête.
+JSON_TOKEN = re.compile(
+    r'\s*(?:("(?:[^"\\\x00-\x1f]|\\.)*")|([{}\[\]:,])|(true|false|null|-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?)|(\S)|\Z)'
+)
 
 
 class PatriciaTrieNode:
+    """
+    Nœud de Patricia-Trie sans __dict__. Les enfants sont rangés selon leur nombre :
+    - aucun enfant : None (children renvoie la table vide partagée EMPTY_CHILDREN)
+    - jusqu'à SMALL_FANOUT enfants : tuple trié (clé1, enfant1, clé2, enfant2, ...)
+    - au-delà : dictionnaire clé -> enfant
+    Dans les deux derniers cas, chercher un enfant coûte O(1).
+    words, leaves, depth_sum, height et size ne sont renseignés qu'avec les
+    statistiques (voir PatriciaTrie.enable_stats).
+    """
+    __slots__ = ("label", "_children", "words", "leaves", "depth_sum", "height", "size")
+
     def __init__(self, label=""):
         self.label = label
-        self.children = {} #dictionnaire
+        self._children = None
+
+    def get_child(self, key):
+        """Enfant de clé key, ou None"""
+        children = self._children
+        if children is None:
+            return None
+        if children.__class__ is dict:
+            return children.get(key)
+        # Un nœud n'est jamais égal à une chaîne : key ne peut être trouvée qu'à une position paire
+        if key in children:
+            return children[children.index(key) + 1]
+        return None
+
+    def set_child(self, key, child):
+        """Ajouter ou remplacer l'enfant de clé key"""
+        children = self._children
+        if children is None:
+            self._children = (key, child)
+        elif children.__class__ is dict:
+            children[key] = child
+        elif key in children:
+            i = children.index(key)
+            self._children = children[:i + 1] + (child,) + children[i + 2:]
+        else:
+            i = 0
+            while i < len(children) and children[i] < key:
+                i += 2
+            children = children[:i] + (key, child) + children[i:]
+            if len(children) > 2 * SMALL_FANOUT:
+                children = dict(zip(children[::2], children[1::2]))
+            self._children = children
+
+    def remove_child(self, key):
+        """Retirer l'enfant de clé key (KeyError s'il n'existe pas)"""
+        children = self._children
+        if children is None:
+            raise KeyError(key)
+        if children.__class__ is dict:
+            del children[key]
+            if len(children) <= SMALL_FANOUT:
+                self._children = tuple(item for pair in sorted(children.items()) for item in pair)
+            return
+        if key not in children:
+            raise KeyError(key)
+        i = children.index(key)
+        self._children = children[:i] + children[i + 2:] or None
+
+    def take_children(self, other):
+        """Reprendre les enfants de other (sans copie)"""
+        self._children = other._children
+
+    def is_leaf(self):
+        return self._children is None
+
+    def child_count(self):
+        children = self._children
+        if children is None:
+            return 0
+        if children.__class__ is dict:
+            return len(children)
+        return len(children) // 2
+
+    def child_nodes(self):
+        """Les enfants, dans un ordre quelconque"""
+        children = self._children
+        if children is None:
+            return ()
+        if children.__class__ is dict:
+            return children.values()
+        return children[1::2]
+
+    def child_items(self):
+        """Les couples (clé, enfant), triés par clé"""
+        children = self._children
+        if children is None:
+            return ()
+        if children.__class__ is dict:
+            return sorted(children.items())
+        return zip(children[::2], children[1::2])
+
+    @property
+    def children(self):
+        """
+        Vue de compatibilité en lecture seule des enfants (clé -> nœud).
+        Pour un nœud à tuple, chaque accès copie les enfants dans un dict : le code
+        interne passe par get_child, child_nodes, child_items ou child_count.
+        """
+        children = self._children
+        if children is None:
+            return EMPTY_CHILDREN
+        if children.__class__ is dict:
+            return MappingProxyType(children)
+        return MappingProxyType(dict(zip(children[::2], children[1::2])))
+
+    @children.setter
+    def children(self, mapping):
+        self._children = None
+        for key, child in mapping.items():
+            self.set_child(key, child)
 
 
 class PatriciaTrie:
     end_marker = chr(0x00)  # 结束标记符
 
-    def __init__(self):
+    def __init__(self, stats=False):
         self.root = PatriciaTrieNode()
         #les cpt
         self.operation_count = {
@@ -18,43 +150,165 @@ class PatriciaTrie:
             "search_comparisons": 0,
             "delete_comparisons": 0
         }
+        # Statistiques maintenues à chaque modification (voir enable_stats)
+        self.stats = False
+        if stats:
+            self.enable_stats()
+
+    def enable_stats(self):
+        """
+        Activer le maintien incrémental des statistiques. Chaque nœud garde les
+        agrégats de son sous-arbre, recalculés le long du chemin modifié :
+        - words : nombre de mots (labels terminés par end_marker)
+        - leaves : nombre de feuilles (pointeurs nuls)
+        - depth_sum : somme des profondeurs des feuilles, relative au nœud
+        - height : hauteur du sous-arbre
+        - size : nombre de nœuds
+        """
+        self.stats = True
+        order = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.child_nodes())
+        # Les enfants apparaissent après leur parent : parcourir à l'envers
+        for node in reversed(order):
+            self._refresh(node)
+
+    def _refresh(self, node):
+        """Recalculer les agrégats d'un nœud à partir de ceux de ses enfants"""
+        node.words = 1 if node.label.endswith(self.end_marker) else 0
+        node.leaves = 0
+        node.depth_sum = 0
+        node.height = 0
+        node.size = 1
+        if node.is_leaf():
+            node.leaves = 1
+            return
+        for child in node.child_nodes():
+            node.words += child.words
+            node.leaves += child.leaves
+            node.depth_sum += child.depth_sum + child.leaves
+            node.size += child.size
+            if child.height >= node.height:
+                node.height = child.height + 1
 
     def inserer(self, mot):
         mot += self.end_marker
         node = self.root
-
-        while mot:
-
-            self.operation_count["insert_comparisons"] += 1 #查找mot【0】
-            if mot[0] in node.children:
-                child = node.children[mot[0]]
-                # prefix = find_mots_prefix(mot, child.label)
-                prefix = find_mots_prefix(
-                    mot,
-                    child.label,
-                    counter_dict=self.operation_count,
-                    counter_key="insert_comparisons"
-                )
-                #self.operation_count["insert_comparisons"] += len(prefix)
-
-                if prefix == child.label:
+        path = []
+        # Position courante dans mot : la clé n'est jamais recopiée pendant la descente
+        pos = 0
+        comparisons = 0
+
+        while pos < len(mot):
+            if self.stats:
+                path.append(node)
+
+            comparisons += 1 #查找mot【pos】
+            child = node.get_child(mot[pos])
+            if child is not None:
+                common, compared = prefixe_commun(mot, pos, child.label)
+                comparisons += compared
+
+                if common == len(child.label):
                     # Correspondance parfaite, passer au nœud suivant.
                     node = child
-                    mot = mot[len(prefix):]
                 else:
                     # Correspondance partielle, diviser le nœud.
-                    rest = child.label[len(prefix):]
-                    new_node = PatriciaTrieNode(prefix)
-                    new_node.children[rest[0]] = child
+                    rest = child.label[common:]
+                    new_node = PatriciaTrieNode(child.label[:common])
+                    new_node.set_child(rest[0], child)
                     child.label = rest
-                    node.children[prefix[0]] = new_node
+                    node.set_child(mot[pos], new_node)
                     node = new_node
-                    mot = mot[len(prefix):]
+                pos += common
             else:
                 # Aucun préfixe commun, insérer directement.
-                new_node = PatriciaTrieNode(mot)
-                node.children[mot[0]] = new_node
-                return
+                new_node = PatriciaTrieNode(mot[pos:])
+                node.set_child(mot[pos], new_node)
+                if self.stats:
+                    # Le nœud coupé garde son sous-arbre : seuls le chemin et la feuille changent
+                    self._refresh(new_node)
+                    for path_node in reversed(path):
+                        self._refresh(path_node)
+                break
+
+        self.operation_count["insert_comparisons"] += comparisons
+
+    def inserer_many(self, mots):
+        """
+        Insérer plusieurs mots en une fois. Sur un trie vide, l'arbre est construit
+        en une passe par from_sorted ; sinon les mots sont dédoublonnés puis insérés
+        dans l'ordre trié, les descentes successives suivant des chemins voisins.
+        Le trie obtenu ne dépend pas de l'ordre d'insertion.
+        """
+        if self.root.is_leaf():
+            self.root = self.from_sorted(mots).root
+            if self.stats:
+                self.enable_stats()
+            return
+        for mot in sorted(set(mots)):
+            self.inserer(mot)
+
+    @classmethod
+    def from_sorted(cls, words):
+        """
+        Construire le Patricia-Trie en une passe à partir d'un vocabulaire trié.
+        Les mots sont dédoublonnés et triés (quasi linéaire sur une entrée déjà
+        triée). Entre deux mots voisins, la longueur du plus long préfixe commun
+        indique où accrocher la nouvelle feuille sur la branche droite de l'arbre,
+        gardée dans une pile : aucune descente depuis la racine n'est répétée.
+        Le trie obtenu est identique à celui construit par inserer.
+        """
+        trie = cls()
+        # Branche droite : (nœud, nombre de caractères à la fin de son label)
+        stack = [(trie.root, 0)]
+        previous = ""
+        for mot in sorted(set(words)):
+            key = mot + trie.end_marker
+            common = prefixe_commun(key, 0, previous)[0]
+            # Aucun mot n'est préfixe d'un autre (end_marker), donc common < len(key)
+            popped = None
+            while stack[-1][1] > common:
+                popped = stack.pop()[0]
+            node, depth = stack[-1]
+            if depth < common:
+                # Le préfixe commun s'arrête au milieu du label du dernier nœud retiré
+                split = PatriciaTrieNode(popped.label[:common - depth])
+                popped.label = popped.label[common - depth:]
+                split.set_child(popped.label[0], popped)
+                node.set_child(split.label[0], split)
+                stack.append((split, common))
+                node = split
+            leaf = PatriciaTrieNode(key[common:])
+            node.set_child(key[common], leaf)
+            stack.append((leaf, len(key)))
+            previous = key
+        return trie
+
+    @classmethod
+    def from_words_parallel(cls, words, workers=None):
+        """
+        Construire le Patricia-Trie sur plusieurs processus. Le vocabulaire trié est
+        coupé en tranches de premiers caractères (une par processus, de tailles
+        voisines) ; chaque processus construit son sous-trie avec from_sorted et le
+        renvoie sous forme aplatie. Les enfants de la racine ayant des clés
+        distinctes d'une tranche à l'autre, il suffit de les accrocher à une racine
+        commune. Le trie obtenu est identique à celui de from_sorted.
+        """
+        workers = workers or os.cpu_count() or 1
+        shards = _shards_by_initial(sorted(set(words)), workers)
+        if len(shards) <= 1:
+            return cls.from_sorted(shards[0] if shards else ())
+
+        trie = cls()
+        with _process_pool(len(shards)) as executor:
+            for labels, counts in executor.map(_build_shard, shards):
+                for key, child in _decode_preorder(labels, counts).child_items():
+                    trie.root.set_child(key, child)
+        return trie
 
     #les fonctions auxiliaires
     def to_dict(self, node=None):
@@ -69,13 +323,13 @@ class PatriciaTrie:
         }
         if node.label.endswith(self.end_marker):
             result["is_end_of_word"] = True
-        elif self.end_marker in node.children:
+        elif node.get_child(self.end_marker) is not None:
             result["is_end_of_word"] = True
 
 
         filtered_children = {
             key: self.to_dict(child)
-            for key, child in sorted(node.children.items())
+            for key, child in node.child_items()
             if key != self.end_marker
         }
         if filtered_children:
@@ -90,6 +344,230 @@ class PatriciaTrie:
         trie_dict = self.to_dict()
         print(json.dumps(trie_dict, indent=4))
 
+    def to_json(self, file_path):
+        """
+        Écrire le trie dans file_path au format de to_dict (json.dump avec indent=4,
+        octet pour octet), nœud par nœud : ni dictionnaire intermédiaire ni
+        récursion, le texte part dans le fichier par blocs de JSON_CHUNK caractères.
+        """
+        end_marker = self.end_marker
+        with open(file_path, "w", encoding="utf-8") as f:
+            pieces = ["{"]
+            size = 0
+            node, pad = self.root, ""
+            # Pile des nœuds ouverts : [enfants restants, indentation des enfants,
+            # indentation des champs, indentation du nœud, premier enfant ?]
+            stack = []
+            while True:
+                if node is not None:
+                    inner = pad + "    "
+                    is_end = node.label.endswith(end_marker) or node.get_child(end_marker) is not None
+                    head = (
+                        "\n" + inner + '"label": ' + json.dumps(node.label.rstrip(end_marker))
+                        + ",\n" + inner + '"is_end_of_word": ' + ("true" if is_end else "false")
+                        + ",\n" + inner + '"children": '
+                    )
+                    pieces.append(head)
+                    size += len(head)
+                    children = [item for item in node.child_items() if item[0] != end_marker]
+                    if children:
+                        pieces.append("{")
+                        stack.append([iter(children), inner + "    ", inner, pad, True])
+                    else:
+                        pieces.append("{}\n" + pad + "}")
+                    node = None
+                    if size >= JSON_CHUNK:
+                        f.write("".join(pieces))
+                        pieces.clear()
+                        size = 0
+                if not stack:
+                    break
+                top = stack[-1]
+                item = next(top[0], None)
+                if item is None:
+                    stack.pop()
+                    pieces.append("\n" + top[2] + "}\n" + top[3] + "}")
+                    continue
+                key, node = item
+                pieces.append(("\n" if top[4] else ",\n") + top[1] + json.dumps(key) + ": {")
+                top[4] = False
+                pad = top[1]
+            f.write("".join(pieces))
+
+    @classmethod
+    def from_json(cls, file_path):
+        """
+        Lire un trie écrit par to_json (ou tout JSON du même schéma) en flux : le
+        fichier est découpé en lexèmes bloc par bloc et les nœuds sont créés au fil
+        de la lecture, avec une pile à la place de la récursion. La mémoire de pointe
+        est celle du trie, plus un bloc et la pile.
+        Lève json.JSONDecodeError si le fichier n'est pas un JSON du bon schéma.
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            tokens = _json_tokens(f)
+            trie = cls()
+            trie.root = _read_node(tokens, next(tokens, None))
+            if next(tokens, None) is not None:
+                raise json.JSONDecodeError("Extra data", "", 0)
+        return trie
+
+    def to_shards(self, directory):
+        """
+        Écrire le trie en instantané partagé dans directory : un fichier par enfant
+        de la racine (au format de to_json, chacun lisible seul par from_json) et le
+        manifeste SHARD_MANIFEST (clé de chaque enfant -> fichier), écrit en dernier
+        par remplacement atomique. Les fichiers portent le numéro de génération du
+        manifeste : une écriture interrompue laisse l'ancien instantané intact.
+        """
+        os.makedirs(directory, exist_ok=True)
+        try:
+            generation = _read_manifest(directory, "patricia")["generation"] + 1
+        except (OSError, ValueError, KeyError):
+            generation = 0
+        shards = []
+        for i, (key, child) in enumerate(self.root.child_items()):
+            shard = PatriciaTrie()
+            shard.root.set_child(key, child)
+            file_name = f"shard_{generation}_{i}.json"
+            shard.to_json(os.path.join(directory, file_name))
+            shards.append({"key": key, "file": file_name})
+        _write_manifest(directory, {
+            "format": "patricia", "version": SHARD_VERSION,
+            "generation": generation, "shards": shards,
+        })
+
+    @classmethod
+    def from_shards(cls, directory, prefix=None, workers=None):
+        """
+        Lire un instantané écrit par to_shards. Avec prefix, seul le fichier de la
+        branche de prefix[0] est lu : le trie obtenu ne contient que les mots
+        commençant par ce caractère (assez pour prefixe et recherche sur prefix).
+        Les fichiers sont lus en parallèle sur workers processus (os.cpu_count()
+        par défaut), renvoyés aplatis et accrochés à une racine commune.
+        Lève ValueError si directory n'est pas un instantané partagé Patricia.
+        """
+        shards = _read_manifest(directory, "patricia")["shards"]
+        if prefix:
+            shards = [shard for shard in shards if shard["key"] == prefix[0]]
+        paths = [os.path.join(directory, shard["file"]) for shard in shards]
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+
+        trie = cls()
+        if workers <= 1:
+            for path in paths:
+                for key, child in cls.from_json(path).root.child_items():
+                    trie.root.set_child(key, child)
+            return trie
+        with _process_pool(workers) as executor:
+            for labels, counts in executor.map(_load_shard, paths):
+                for key, child in _decode_preorder(labels, counts).child_items():
+                    trie.root.set_child(key, child)
+        return trie
+
+
+def _process_pool(workers):
+    """
+    Pool de processus pour les constructions et chargements parallèles, comme dans
+    hybrid_trie : méthode fork quand elle existe, les processus héritent des modules
+    déjà chargés au lieu de réimporter le script appelant (qui peut ne pas avoir de
+    garde __main__). Ailleurs, méthode par défaut de la plateforme.
+    """
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+def _write_manifest(directory, manifest):
+    """Écrire le manifeste d'un instantané partagé, puis retirer les fichiers d'autres générations"""
+    temp_path = os.path.join(directory, SHARD_MANIFEST + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(temp_path, os.path.join(directory, SHARD_MANIFEST))
+    current = {shard["file"] for shard in manifest["shards"]}
+    for file_name in os.listdir(directory):
+        if file_name.startswith("shard_") and file_name not in current:
+            os.remove(os.path.join(directory, file_name))
+
+def _read_manifest(directory, expected_format):
+    """Manifeste d'un instantané partagé ; ValueError s'il n'est pas du format attendu"""
+    with open(os.path.join(directory, SHARD_MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict) or manifest.get("format") != expected_format:
+        raise ValueError(f"{directory}: not a sharded {expected_format} snapshot")
+    if manifest.get("version") != SHARD_VERSION:
+        raise ValueError(f"{directory}: unsupported version {manifest.get('version')}")
+    return manifest
+
+def _load_shard(path):
+    """Tâche d'un processus : racine du fichier path lu par from_json, aplatie par _encode_preorder"""
+    return _encode_preorder(PatriciaTrie.from_json(path).root)
+
+
+def _prefix_end(words, prefix, lo, hi):
+    """
+    Premier indice de words[lo:hi] (triés, tous ceux d'avant commençant par prefix)
+    qui ne commence plus par prefix. Recherche dichotomique sur startswith : pas de
+    borne calculée par chr(ord(c) + 1), impossible après U+10FFFF.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if words[mid].startswith(prefix):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _shards_by_initial(words, parts):
+    """
+    Couper une liste triée de mots en au plus parts tranches de tailles voisines,
+    sans jamais séparer deux mots de même premier caractère.
+    """
+    shards = []
+    start = 0
+    while start < len(words):
+        end = min(len(words), start + max(1, (len(words) - start) // (parts - len(shards))))
+        if len(shards) == parts - 1:
+            end = len(words)
+        elif end < len(words) and words[end - 1]:
+            # Aller jusqu'au bout du groupe du premier caractère de words[end - 1]
+            end = _prefix_end(words, words[end - 1][0], end, len(words))
+        shards.append(words[start:end])
+        start = end
+    return shards
+
+def _build_shard(words):
+    """Tâche d'un processus : sous-trie de words (triés), aplati par _encode_preorder"""
+    return _encode_preorder(PatriciaTrie.from_sorted(words).root)
+
+def _encode_preorder(node):
+    """Aplatir un sous-arbre en ordre préfixe : (labels, nombres d'enfants)"""
+    labels = []
+    counts = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        labels.append(node.label)
+        counts.append(node.child_count())
+        # Empiler à l'envers pour visiter les enfants dans l'ordre des clés
+        stack.extend(child for _, child in reversed(list(node.child_items())))
+    return labels, counts
+
+def _decode_preorder(labels, counts):
+    """Reconstruire le sous-arbre aplati par _encode_preorder (sans récursion)"""
+    root = PatriciaTrieNode(labels[0])
+    # Nœuds dont il reste des enfants à lire : [nœud, enfants restants]
+    stack = [[root, counts[0]]]
+    for label, count in zip(labels[1:], counts[1:]):
+        while not stack[-1][1]:
+            stack.pop()
+        parent = stack[-1]
+        parent[1] -= 1
+        node = PatriciaTrieNode(label)
+        parent[0].set_child(label[0], node)
+        if count:
+            stack.append([node, count])
+    return root
+
 
 # def find_mots_prefix(str1, str2):
 #     min_len = min(len(str1), len(str2))
@@ -110,123 +588,380 @@ def find_mots_prefix(str1, str2, counter_dict=None, counter_key=None):
 
     return str1[:min_len]
 
-def json_to_patricia_trie(data):
-    """Construire un Patricia-Trie à partir de données JSON"""
-
-    def _dict_to_node(node_data):
-        """Convertir récursivement les données JSON en nœuds de Patricia-Trie"""
-        node = PatriciaTrieNode(node_data["label"])
-
-        for key, child_data in node_data.get("children", {}).items():
-            node.children[key] = _dict_to_node(child_data)
-
-        if node_data.get("is_end_of_word", False):
-            if node.children:
-                # Si le nœud actuel a d'autres sous-nœuds, stocker le marqueur de fin sous forme de sous-nœuds
-                if PatriciaTrie.end_marker not in node.children:
-                    end_marker_node = PatriciaTrieNode(PatriciaTrie.end_marker)
-                    node.children[PatriciaTrie.end_marker] = end_marker_node
-            else:
-                # S'il n'y a pas de sous-nœuds, ajouter directement le marqueur de fin dans le label
-                node.label += PatriciaTrie.end_marker
+def prefixe_commun(mot, pos, label):
+    """
+    Longueur du préfixe commun entre mot[pos:] et label, sans recopier mot.
+    La comparaison se fait en bloc (str.startswith) ; en cas de divergence, le point
+    de divergence est cherché caractère par caractère sur un label court, par
+    dichotomie sur des morceaux de label sinon.
+    Retourne (longueur, comparaisons) où comparaisons est le nombre de caractères
+    que find_mots_prefix aurait comparés.
+    """
+    min_len = min(len(label), len(mot) - pos)
+    if mot.startswith(label, pos):
+        return min_len, min_len
+    low, high = 0, min_len
+    if min_len <= 16:
+        while low < min_len and mot[pos + low] == label[low]:
+            low += 1
+        high = low
+    while low < high:
+        middle = (low + high + 1) // 2
+        if mot.startswith(label[low:middle], pos + low):
+            low = middle
+        else:
+            high = middle - 1
+    if low < min_len:
+        return low, low + 1
+    return low, low
 
-        return node
+def json_to_patricia_trie(data):
+    """Construire un Patricia-Trie à partir de données JSON (sans récursion)"""
+    root = PatriciaTrieNode(data["label"])
+    # Pile : (nœud, données, enfants restants, clé dans le parent, parent)
+    stack = [(root, data, iter(data.get("children", {}).items()), None, None)]
+    while stack:
+        node, node_data, children, key, parent = stack[-1]
+        item = next(children, None)
+        if item is not None:
+            child_key, child_data = item
+            child = PatriciaTrieNode(child_data["label"])
+            stack.append((child, child_data, iter(child_data.get("children", {}).items()), child_key, node))
+            continue
+        stack.pop()
+        _finish_node(node, node_data.get("is_end_of_word", False))
+        if parent is not None:
+            parent.set_child(key, node)
 
     trie = PatriciaTrie()
-    trie.root = _dict_to_node(data)
+    trie.root = root
     return trie
 
+def _finish_node(node, is_end_of_word):
+    """Placer le marqueur de fin d'un nœud lu, une fois ses enfants accrochés"""
+    if is_end_of_word:
+        if not node.is_leaf():
+            # Si le nœud actuel a d'autres sous-nœuds, stocker le marqueur de fin sous forme de sous-nœuds
+            if node.get_child(PatriciaTrie.end_marker) is None:
+                end_marker_node = PatriciaTrieNode(PatriciaTrie.end_marker)
+                node.set_child(PatriciaTrie.end_marker, end_marker_node)
+        else:
+            # S'il n'y a pas de sous-nœuds, ajouter directement le marqueur de fin dans le label
+            node.label += PatriciaTrie.end_marker
+
+def _json_tokens(f):
+    """
+    Générer les lexèmes d'un fichier JSON lu par blocs de JSON_CHUNK caractères :
+    ponctuation et littéraux tels quels, chaînes décodées sous la forme ("string", valeur),
+    nombres sous la forme ("number", texte).
+    """
+    data = ""
+    pos = 0
+    eof = False
+    while True:
+        for match in JSON_TOKEN.finditer(data, pos):
+            end = match.end()
+            text, punctuation, literal, other = match.groups()
+            # Un lexème peut être coupé en fin de bloc : lire la suite avant de le prendre
+            if not eof and (other is not None or len(data) - end < 64):
+                break
+            if other is not None:
+                raise json.JSONDecodeError("Unexpected character", data, end - 1)
+            pos = end
+            if end == len(data) and text is punctuation is literal is None:
+                return
+            if punctuation is not None:
+                yield punctuation
+            elif text is not None:
+                yield ("string", json.loads(text) if "\\" in text else text[1:-1])
+            elif literal[0] == "-" or literal[0].isdigit():
+                yield ("number", literal)
+            else:
+                yield literal
+        chunk = f.read(JSON_CHUNK)
+        data = data[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+def _expect(tokens, expected):
+    token = next(tokens, None)
+    if token != expected:
+        raise json.JSONDecodeError(f"Expecting {expected!r}, got {token!r}", "", 0)
+
+def _skip_value(tokens, token):
+    """Ignorer une valeur JSON quelconque (champ inconnu du schéma)"""
+    depth = 0
+    while True:
+        if token in ("{", "["):
+            depth += 1
+        elif token in ("}", "]"):
+            depth -= 1
+        elif token is None:
+            raise json.JSONDecodeError("Unexpected end of data", "", 0)
+        if depth == 0:
+            return
+        token = next(tokens, None)
+
+def _next_field(tokens):
+    """Après une valeur de champ : le nom du champ suivant, ou "}" en fin d'objet"""
+    token = next(tokens, None)
+    if token == ",":
+        token = next(tokens, None)
+        if token == "}":
+            raise json.JSONDecodeError("Trailing comma in object", "", 0)
+    elif token != "}":
+        raise json.JSONDecodeError(f"Expecting ',' or '}}', got {token!r}", "", 0)
+    return token
+
+def _read_node(tokens, token):
+    """
+    Construire le sous-arbre dont l'objet JSON commence par token, sans récursion.
+    Chaque niveau ouvert garde (nœud, fin de mot ?, clé dans le parent).
+    """
+    stack = []
+    key = None
+    while True:
+        # token ouvre un nœud
+        if token != "{":
+            raise json.JSONDecodeError(f"Expecting a node object, got {token!r}", "", 0)
+        node = PatriciaTrieNode()
+        stack.append([node, False, key])
+        token = next(tokens, None)
+        descend = False
+        while not descend:
+            # Champs du nœud au sommet de la pile
+            if token == "}":
+                node, is_end_of_word, key = stack.pop()
+                _finish_node(node, is_end_of_word)
+                if not stack:
+                    return node
+                stack[-1][0].set_child(key, node)
+                # Retour dans la table children du parent : enfant suivant ou fin de table
+                token = next(tokens, None)
+                if token == ",":
+                    token = next(tokens, None)
+                    key = token[1] if token.__class__ is tuple and token[0] == "string" else None
+                    if key is None:
+                        raise json.JSONDecodeError(f"Expecting a child key, got {token!r}", "", 0)
+                    _expect(tokens, ":")
+                    token = next(tokens, None)
+                    descend = True
+                    continue
+                if token != "}":
+                    raise json.JSONDecodeError(f"Expecting ',' or '}}', got {token!r}", "", 0)
+                # Fin de children : continuer les champs du parent
+                token = _next_field(tokens)
+                continue
+            if token.__class__ is not tuple or token[0] != "string":
+                raise json.JSONDecodeError(f"Expecting a field name, got {token!r}", "", 0)
+            field = token[1]
+            _expect(tokens, ":")
+            value = next(tokens, None)
+            if field == "children":
+                if value != "{":
+                    raise json.JSONDecodeError(f"Expecting children object, got {value!r}", "", 0)
+                token = next(tokens, None)
+                if token != "}":
+                    key = token[1] if token.__class__ is tuple and token[0] == "string" else None
+                    if key is None:
+                        raise json.JSONDecodeError(f"Expecting a child key, got {token!r}", "", 0)
+                    _expect(tokens, ":")
+                    token = next(tokens, None)
+                    descend = True
+                    continue
+            elif field == "label" and value.__class__ is tuple and value[0] == "string":
+                stack[-1][0].label = value[1]
+            elif field == "is_end_of_word" and value in ("true", "false"):
+                stack[-1][1] = value == "true"
+            else:
+                _skip_value(tokens, value)
+            token = _next_field(tokens)
+
 #Question2
 def recherche(arbre, m):
     """une fonction de recherche d’un mot dans un dictionnaire"""
     m += arbre.end_marker
     node = arbre.root
-    while m:
-
-        arbre.operation_count["search_comparisons"] += 1
-        if m[0] not in node.children:
-            return False
-
-        child = node.children[m[0]]
-        prefix = find_mots_prefix(
-            m,
-            child.label,
-            counter_dict=arbre.operation_count,
-            counter_key="search_comparisons"
-        )
-
-        if len(prefix) != len(child.label):
-            return False
+    pos = 0
+    comparisons = 0
+    found = False
+    while True:
+        comparisons += 1
+        child = node.get_child(m[pos])
+        if child is None:
+            break
+
+        common, compared = prefixe_commun(m, pos, child.label)
+        comparisons += compared
+        if common != len(child.label):
+            break
 
         node = child
-        m = m[len(child.label):]
+        pos += common
+        if pos == len(m):
+            found = arbre.end_marker in node.label
+            break
+
+    arbre.operation_count["search_comparisons"] += comparisons
+    return found
+
+def recherche_many(arbre, mots):
+    """
+    Rechercher plusieurs mots en une passe : les requêtes sont triées et chaque
+    requête reprend la descente au dernier nœud du chemin commun avec la précédente.
+    Retourne la liste des résultats dans l'ordre des mots donnés.
+    mots peut être un itérable quelconque (il est lu deux fois, d'où la copie).
+    """
+    mots = list(mots)
+    results = {}
+    # Chemin de la requête précédente : (nœud, nombre de caractères consommés)
+    path = [(arbre.root, 0)]
+    previous = ""
+    comparisons = 0
+
+    for mot in sorted(set(mots)):
+        key = mot + arbre.end_marker
+        common = 0
+        limit = min(len(key), len(previous))
+        while common < limit and key[common] == previous[common]:
+            common += 1
+        while path[-1][1] > common:
+            path.pop()
+        previous = key
+
+        node, pos = path[-1]
+        found = False
+        while True:
+            comparisons += 1
+            child = node.get_child(key[pos])
+            if child is None:
+                break
+            comparisons += len(child.label)
+            if not key.startswith(child.label, pos):
+                break
+            node = child
+            pos += len(child.label)
+            if pos == len(key):
+                found = True
+                break
+            path.append((node, pos))
+        results[mot] = found
 
-    return arbre.end_marker in node.label
+    arbre.operation_count["search_comparisons"] += comparisons
+    return [results[mot] for mot in mots]
 
 def comptage_mots(arbre):
     """une fonction qui compte les mots présents dans le dictionnaire :"""
+    if arbre.stats:
+        return arbre.root.words
+
     def _nbmots(node):
         cpt = 0
         if node.label.endswith(arbre.end_marker):
             cpt+=1
-        for child in node.children.values():
+        for child in node.child_nodes():
             cpt += _nbmots(child)
         return cpt
     return _nbmots(arbre.root)
 
 def liste_mots(arbre):
     """Extraire tous les mots du Patricia-Trie et retourner une liste triée"""
-    words = []
-
-    def _aux(node, current_word):
-        if node.label.endswith(arbre.end_marker):
-            words.append(current_word + node.label.rstrip(arbre.end_marker))
+    return list(iter_words(arbre))
+
+def iter_words(arbre, prefix=None, limit=None):
+    """
+    Générer paresseusement, dans l'ordre lexicographique, les mots qui commencent
+    par prefix (tous si prefix est None), au plus limit mots.
+    Les labels du chemin courant sont empilés dans un seul tampon, et seuls les
+    enfants des nœuds réellement visités sont triés.
+    """
+    if limit is not None and limit <= 0:
+        return
+    end_marker = arbre.end_marker
+    node = arbre.root
+    buffer = [node.label]
 
-        for key, child in sorted(node.children.items()):
-            _aux(child, current_word + node.label)
+    # Descendre jusqu'au nœud qui couvre le préfixe (il peut finir au milieu d'un label)
+    mot = prefix or ""
+    while mot:
+        child = node.get_child(mot[0])
+        if child is None:
+            return
+        common = len(find_mots_prefix(mot, child.label))
+        if common < len(mot) and common < len(child.label):
+            return
+        buffer.append(child.label.rstrip(end_marker))
+        node = child
+        mot = mot[common:]
 
+    count = 0
+    if node.label.endswith(end_marker):
+        yield "".join(buffer)
+        count += 1
+        if count == limit:
+            return
 
-    _aux(arbre.root, "")
-    return words
+    stack = [iter(node.child_items())]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            buffer.pop()
+            continue
+        child = item[1]
+        buffer.append(child.label.rstrip(end_marker))
+        if child.label.endswith(end_marker):
+            yield "".join(buffer)
+            count += 1
+            if count == limit:
+                return
+        stack.append(iter(child.child_items()))
 
 def comptage_nil(arbre):
+    if arbre.stats:
+        return arbre.root.leaves
+
     def _count_nil(node):
-        if not node.children:
+        if node.is_leaf():
             return 1
-        return sum(_count_nil(child) for child in node.children.values())
+        return sum(_count_nil(child) for child in node.child_nodes())
 
     return _count_nil(arbre.root)
 
 def comptage_nil_exclude_endmarker(arbre):
     """Calculer le nombre de pointeurs nuls correspondant aux marqueurs non finaux dans le Patricia-Trie"""
     def _count_nil1(node):
-        if not node.children:
+        if node.is_leaf():
             return 1
 
-        return sum(_count_nil1(child) for key, child in node.children.items() if key != arbre.end_marker)
+        return sum(_count_nil1(child) for key, child in node.child_items() if key != arbre.end_marker)
     return _count_nil1(arbre.root)
 
 
 def hauteur(arbre):
     """Calculer la hauteur de l'arbre du Patricia-Trie"""
+    if arbre.stats:
+        return arbre.root.height
 
     def _height(node):
-        if not node.children:
+        if node.is_leaf():
             return 0
-        return 1 + max(_height(child) for child in node.children.values())
+        return 1 + max(_height(child) for child in node.child_nodes())
 
     return _height(arbre.root)
 
 
 def profondeurMoyenne(arbre):
     """Calculer la profondeur moyenne """
+    if arbre.stats:
+        return arbre.root.depth_sum / arbre.root.leaves
 
     def _aux(node, depth):
-        if not node.children:
+        if node.is_leaf():
             return depth, 1
         total_depth = 0
         total_leaves = 0
-        for child in node.children.values():
+        for child in node.child_nodes():
             depth_sum, leaf_count = _aux(child, depth + 1)
             total_depth += depth_sum
             total_leaves += leaf_count
@@ -238,12 +973,27 @@ def profondeurMoyenne(arbre):
     return total_depth / total_leaves
 
 
+def comptage_noeuds(arbre):
+    """Compter le nombre de nœuds du Patricia-Trie"""
+    if arbre.stats:
+        return arbre.root.size
+
+    count = 0
+    stack = [arbre.root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.child_nodes())
+    return count
+
+
 def prefixe(arbre, mot):
+    """Compter les mots qui commencent par mot (O(|mot|) avec les statistiques activées)"""
     node = arbre.root
     while mot:
-        if mot[0] not in node.children:
+        child = node.get_child(mot[0])
+        if child is None:
             return 0  # 如果前缀不在树中
-        child = node.children[mot[0]]
         common_prefix = find_mots_prefix(mot, child.label)
         if not common_prefix:
             # 没有公共前缀，直接失败
@@ -254,117 +1004,168 @@ def prefixe(arbre, mot):
             mot = mot[len(common_prefix):]
         else:
             if len(common_prefix) == len(mot):
-                new_arbre = PatriciaTrie()
-                new_arbre.root = child
-                return comptage_mots(new_arbre)
+                node = child
+                break
             else:
                 return 0
     # 匹配成功，从当前节点开始统计单词数量
+    if arbre.stats:
+        # Chaque nœud connaît le nombre de mots de son sous-arbre
+        return node.words
     new_arbre = PatriciaTrie()
     new_arbre.root = node
     return comptage_mots(new_arbre)
 
 def suppression(arbre, mot):
     """une fonction qui prend un mot en argument et qui le supprime de l’arbre s’il y figure"""
-
-    def _merge_if_needed(node):
-        """Fusionner les nœuds"""
-        if node is arbre.root:
-            return
-        if len(node.children) == 1 and not node.label.endswith(arbre.end_marker):
-            only_child_key, only_child = list(node.children.items())[0]
+    return suppression_many(arbre, [mot])
+
+def suppression_many(arbre, mots):
+    """
+    Supprimer plusieurs mots en une passe, sans récursion. Les mots sont triés et
+    chaque suppression reprend la descente au dernier nœud encore valide du chemin
+    de la précédente. Pour chaque mot trouvé :
+    - la feuille du mot (label terminé par end_marker) est retirée de son parent
+    - les nœuds devenus vides sont élagués en remontant le chemin
+    - le premier nœud restant, s'il n'a plus qu'un enfant, est fusionné avec lui
+    Les statistiques des nœuds du chemin sont recalculées une seule fois à la fin.
+    """
+    end_marker = arbre.end_marker
+    # Chemin courant : (nœud, nombre de caractères consommés à la fin de son label)
+    path = [(arbre.root, 0)]
+    # Nœuds dont le sous-arbre a changé, chaque nœud apparaissant avant ses descendants
+    touched = []
+    previous = ""
+    comparisons = 0
+
+    for mot in sorted(set(mots)):
+        key = mot + end_marker
+        common = 0
+        limit = min(len(key), len(previous))
+        while common < limit and key[common] == previous[common]:
+            common += 1
+        while path[-1][1] > common:
+            path.pop()
+        previous = key
+
+        node, pos = path[-1]
+        leaf = None
+        while True:
+            comparisons += 1
+            child = node.get_child(key[pos])
+            if child is None:
+                break
+            matched, compared = prefixe_commun(key, pos, child.label)
+            comparisons += compared
+            if matched != len(child.label):
+                break
+            if pos + matched == len(key):
+                leaf = child
+                break
+            node = child
+            pos += matched
+            path.append((node, pos))
+        if leaf is None:
+            continue
+
+        touched.extend(path_node for path_node, _ in path)
+        node.remove_child(leaf.label[0])
+
+        # Élaguer les nœuds vides, puis fusionner le premier nœud restant avec son enfant unique
+        i = len(path) - 1
+        while i > 0 and node.is_leaf() and not node.label.endswith(end_marker):
+            i -= 1
+            path[i][0].remove_child(node.label[0])
+            node = path[i][0]
+        if i > 0 and node.child_count() == 1 and not node.label.endswith(end_marker):
+            only_child, = node.child_nodes()
             node.label += only_child.label
-            node.children = only_child.children
-
-    def _delete(node, m):
-        if not m:
-            if arbre.end_marker in node.children:
-                del node.children[arbre.end_marker]
-            if not node.children:
-                return None
-            _merge_if_needed(node)
-            return node
-
-        t = m[0]
-        arbre.operation_count["delete_comparisons"] += 1
-        if t not in node.children:
-            return node
-
-        child = node.children[t]
-        #prefix = find_mots_prefix(child.label, m)
-        prefix = find_mots_prefix(
-            child.label,
-            m,
-            counter_dict=arbre.operation_count,
-            counter_key="delete_comparisons"
-        )
-
-        if prefix == child.label and len(prefix) == len(m):  # le nœud correspondant complete
-            # D'abord, essayer de supprimer le marqueur de fin des sous-nœuds
-            if arbre.end_marker in child.children:
-                del child.children[arbre.end_marker]
-            # Si les sous-nœuds ne contiennent pas de marqueur de fin, mais que le label contient le marqueur de fin, alors le retirer du label
-            elif child.label.endswith(arbre.end_marker):
-                child.label = child.label[:-1]
-
-            # Si, après suppression, ce nœud ne possède plus de sous-nœuds et ne représente pas un mot (n'a plus de marqueur de fin)
-            if not child.children and not child.label.endswith(arbre.end_marker):
-                del node.children[t]
-                if not node.children:
-                    return None
-
-            _merge_if_needed(child)
-            return node
-
-        if prefix:
-            result = _delete(child, m[len(prefix):])
-            if result is None:
-                del node.children[t]
-                if not node.children:
-                    return None
-
-        _merge_if_needed(node)
-        return node
-
-    arbre.root = _delete(arbre.root, mot)or PatriciaTrieNode()
+            node.take_children(only_child)
+        # Le label de path[i] a pu changer : la suite du chemin n'est plus valide
+        del path[max(i, 1):]
+
+    if arbre.stats:
+        for node in reversed(touched):
+            arbre._refresh(node)
+    arbre.operation_count["delete_comparisons"] += comparisons
     return arbre
 
 def fusion(a, b):
-    """fusion deux Patricia-Tries """
-    def _aux(node_a, node_b):
-        for key_b, child_b in node_b.children.items():
-            if key_b in node_a.children:  # si a meme cle
-                child_a = node_a.children[key_b]
-                prefix = find_mots_prefix(child_a.label, child_b.label)
-
-                if prefix == child_a.label and prefix == child_b.label:
-                    _aux(child_a, child_b)
-                elif prefix:
-                    rest_a = child_a.label[len(prefix):]
-                    rest_b = child_b.label[len(prefix):]
-
-                    new_a = PatriciaTrieNode(rest_a)
-                    new_a.children = child_a.children
-                    new_b = PatriciaTrieNode(rest_b)
-                    new_b.children = child_b.children
-
-                    # mise a jour de A
-                    node_a.children[key_b] = PatriciaTrieNode(prefix)
-                    node_a.children[key_b].children = {}
-
-                    # fusion newA et B
-                    merged_child = _aux(new_a, new_b)
-                    if merged_child:
-                        node_a.children[key_b].children[key_b] = merged_child
-                else:
-                    # impossible
-                    raise ValueError("Invalid state: overlapping keys with no common prefix")
+    """
+    Fusionner le Patricia-Trie b dans a et retourner a.
+    Chaque arête de b est rangée sous le nœud de a correspondant :
+    - pas d'arête de même clé : l'arête de b est greffée telle quelle
+    - labels égaux : on fusionne les enfants des deux nœuds
+    - un label préfixe de l'autre : le reste du plus long descend d'un niveau
+    - divergence au milieu : un nouveau nœud porte le préfixe commun
+    Un mot est une feuille dont le label se termine par end_marker, donc les
+    marqueurs de fin se fusionnent comme des arêtes ordinaires. Les nœuds
+    parcourus sont ensuite recompressés (un seul enfant et pas de fin de mot)
+    puis leurs statistiques recalculées, du bas vers le haut.
+    Chaque caractère de label est comparé au plus une fois : le coût est linéaire
+    en la taille des parties fusionnées. Les nœuds de b sont réutilisés, b est vidé.
+    """
+    if a is b:
+        return a
+    if a.stats and not b.stats:
+        # Les sous-arbres greffés doivent porter leurs agrégats
+        b.enable_stats()
+
+    # Nœuds de a modifiés, chaque nœud apparaissant avant ses descendants
+    touched = [a.root]
+    # Chaque tâche : (nœud de a, arête de b à ranger parmi ses enfants)
+    stack = [(a.root, child_b) for child_b in b.root.child_nodes()]
+    while stack:
+        node, child_b = stack.pop()
+        key = child_b.label[0]
+        child_a = node.get_child(key)
+        if child_a is None:
+            node.set_child(key, child_b)
+            continue
+
+        label_a = child_a.label
+        label_b = child_b.label
+        common, _ = prefixe_commun(label_b, 0, label_a)
+        if common == len(label_a):
+            touched.append(child_a)
+            if common == len(label_b):
+                # Même label : fusionner les enfants
+                stack.extend((child_a, grandchild) for grandchild in child_b.child_nodes())
             else:
-                node_a.children[key_b] = child_b
-
-        return node_a
+                # label_a préfixe strict de label_b : le reste de child_b descend sous child_a
+                child_b.label = label_b[common:]
+                stack.append((child_a, child_b))
+        elif common == len(label_b):
+            # label_b préfixe strict de label_a : child_b prend la place de child_a
+            child_a.label = label_a[common:]
+            node.set_child(key, child_b)
+            touched.append(child_b)
+            stack.append((child_b, child_a))
+        else:
+            # Divergence au milieu des deux labels : couper
+            split = PatriciaTrieNode(label_a[:common])
+            child_a.label = label_a[common:]
+            child_b.label = label_b[common:]
+            split.set_child(child_a.label[0], child_a)
+            split.set_child(child_b.label[0], child_b)
+            node.set_child(key, split)
+            touched.append(split)
+
+    for node in reversed(touched):
+        if (
+            node is not a.root
+            and node.child_count() == 1
+            and not node.label.endswith(a.end_marker)
+        ):
+            only_child, = node.child_nodes()
+            node.label += only_child.label
+            node.take_children(only_child)
+        if a.stats:
+            a._refresh(node)
 
-    _aux(a.root, b.root)
+    b.root = PatriciaTrieNode()
+    if b.stats:
+        b._refresh(b.root)
     return a
 
 
@@ -425,12 +1226,11 @@ if __name__ == "__main__":
         def _dfs(node, path):
             current_word = "".join(path + [node.label.rstrip(trie.end_marker)])
 
-            if trie.end_marker in node.children:
-                child = node.children[trie.end_marker]
-                if not child.children:
-                    result.append(current_word)
+            child = node.get_child(trie.end_marker)
+            if child is not None and child.is_leaf():
+                result.append(current_word)
 
-            for key, child in sorted(node.children.items()):
+            for key, child in node.child_items():
                 _dfs(child, path + [node.label])
 
 
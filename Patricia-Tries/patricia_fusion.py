@@ -1,6 +1,10 @@
+import os
 import sys
 import json
-from patricia import PatriciaTrie, json_to_patricia_trie, fusion, liste_mots
+from patricia import fusion, liste_mots
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 
 def main():
@@ -15,11 +19,9 @@ def main():
 
     # first json to patricia tries
     try:
-        with open(input_dir1, "r", encoding="utf-8") as f:
-            trie_data1 = json.load(f)
-            trie1 = json_to_patricia_trie(trie_data1)
-            list1=liste_mots(trie1)
-            print(f"trie 1 is {list1} ")
+        trie1 = journal.charger(0, input_dir1)
+        list1=liste_mots(trie1)
+        print(f"trie 1 is {list1} ")
     except FileNotFoundError:
         print(f"Error: File {input_dir1} not found.")
         sys.exit(1)
@@ -29,11 +31,9 @@ def main():
 
     # second to Patricia Trie
     try:
-        with open(input_dir2, "r", encoding="utf-8") as f:
-            trie_data2 = json.load(f)
-            trie2 = json_to_patricia_trie(trie_data2)
-            list2 = liste_mots(trie2)
-            print(f"trie 2 is {list2} ")
+        trie2 = journal.charger(0, input_dir2)
+        list2 = liste_mots(trie2)
+        print(f"trie 2 is {list2} ")
     except FileNotFoundError:
         print(f"Error: File {input_dir2} not found.")
         sys.exit(1)
@@ -53,8 +53,7 @@ def main():
 
     #  Patricia Trie to JSON file
     try:
-        with open(output_dir, "w", encoding="utf-8") as f:
-            json.dump(merged_trie.to_dict(), f, indent=4)
+        journal.sauvegarder(output_dir, merged_trie)
         print(f"Fused Patricia Trie has been saved to {output_dir}")
     except IOError as e:
         print(f"Error saving fused Patricia Trie to {output_dir}: {e}")
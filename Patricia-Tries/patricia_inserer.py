@@ -1,7 +1,12 @@
+import os
 import sys
-import json
 from patricia import PatriciaTrie
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Corpus"))
+import journal
+import corpus
+
 def main():
 
     if len(sys.argv) < 3:
@@ -13,21 +18,18 @@ def main():
 
     trie = PatriciaTrie()
 
-    # insert les mots
+    # insert les mots (fichier projeté en mémoire, insertion groupée)
     try:
-        with open(input_dir, "r", encoding="utf-8") as f:
-            for line in f:
-                word = line.strip()
-                if word:
-                    trie.inserer(word)
+        corpus.remplir(trie, input_dir, lower=False)
     except FileNotFoundError:
         print(f"Error: File {input_dir} not found.")
         sys.exit(1)
 
-    #  Patricia Trie to JSON
+    #  Patricia Trie to JSON (le nouvel arbre remplace l'instantané et son journal).
+    # Pas de journal ici : les mots de l'ancien instantané ne sont pas conservés,
+    # journaliser reviendrait à écrire plus de lignes que l'instantané lui-même.
     try:
-        with open(output_dir, "w", encoding="utf-8") as f:
-            json.dump(trie.to_dict(), f, indent=4)
+        journal.sauvegarder(output_dir, trie)
         print(f"Patricia Trie has been saved to {output_dir}")
     except IOError as e:
         print(f"Error saving Patricia Trie to {output_dir}: {e}")
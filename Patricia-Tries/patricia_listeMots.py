@@ -1,6 +1,10 @@
+import os
 import sys
 import json
-from patricia import PatriciaTrie, json_to_patricia_trie, liste_mots
+from patricia import liste_mots
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 def main():
     if len(sys.argv) < 2:
@@ -12,10 +16,8 @@ def main():
     output_dir = "Patricia-Tries/result/mot.txt"
 #list mots
     try:
-        with open(input_dir, "r", encoding="utf-8") as f:
-            trie_data = json.load(f)
-            trie = json_to_patricia_trie(trie_data)
-            words = liste_mots(trie)
+        trie = journal.charger(0, input_dir)
+        words = liste_mots(trie)
     except FileNotFoundError:
         print(f"Error: File {input_dir} not found.")
         sys.exit(1)
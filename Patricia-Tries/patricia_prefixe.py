@@ -1,6 +1,12 @@
+import os
 import sys
 import json
-from patricia import PatriciaTrie, json_to_patricia_trie, prefixe
+from patricia import prefixe
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Frozen_trie"))
+from frozen_trie import FrozenTrie
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 def main():
 
@@ -15,9 +21,14 @@ def main():
 
 
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            trie_data = json.load(f)
-            trie = json_to_patricia_trie(trie_data)
+        if FrozenTrie.is_frozen(input_file):
+            # Trie gelé : requête directe sur le fichier mappé, sans chargement
+            with FrozenTrie(input_file) as trie:
+                prefix_count = trie.prefixe(prefix)
+        else:
+            # Instantané partagé : seule la branche du préfixe est lue
+            trie = journal.charger(0, input_file, prefix=prefix)
+            prefix_count = None
     except FileNotFoundError:
         print(f"Error: File {input_file} not found.")
         sys.exit(1)
@@ -26,7 +37,8 @@ def main():
         sys.exit(1)
 
     try:
-        prefix_count = prefixe(trie, prefix)
+        if prefix_count is None:
+            prefix_count = prefixe(trie, prefix)
     except Exception as e:
         print(f"Error calculating prefix count: {e}")
         sys.exit(1)
@@ -1,6 +1,10 @@
+import os
 import sys
 import json
-from patricia import PatriciaTrie, json_to_patricia_trie, profondeurMoyenne
+from patricia import profondeurMoyenne
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 def main():
     if len(sys.argv) < 2:
@@ -12,9 +16,7 @@ def main():
     output_file = "Patricia-Tries/result/profondeur.txt"
 
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            trie_data = json.load(f)
-            trie = json_to_patricia_trie(trie_data)
+        trie = journal.charger(0, input_file)
     except FileNotFoundError:
         print(f"Error: File {input_file} not found.")
         sys.exit(1)
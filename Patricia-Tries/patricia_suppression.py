@@ -1,6 +1,9 @@
+import os
 import sys
 import json
-from patricia import PatriciaTrie, json_to_patricia_trie, suppression
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../Journal"))
+import journal
 
 
 def main():
@@ -13,9 +16,7 @@ def main():
     output_dir = "Patricia-Tries/result/pat.json"
 
     try:
-        with open(output_dir, "r", encoding="utf-8") as f:
-            trie_data = json.load(f)
-            trie = json_to_patricia_trie(trie_data)
+        trie = journal.charger(0, output_dir)
     except FileNotFoundError:
         print(f"Error: File {output_dir} not found.")
         sys.exit(1)
@@ -25,18 +26,17 @@ def main():
 
     try:
         with open(input_dir, "r", encoding="utf-8") as f:
-            for line in f:
-                word = line.strip()
-                if word:
-                    trie = suppression(trie, word)
+            words = [line.strip() for line in f if line.strip()]
     except FileNotFoundError:
         print(f"Error: File {input_dir} not found.")
         sys.exit(1)
 
+    # Seules les suppressions sont écrites (journal), l'arbre n'est réécrit qu'à la compaction
     try:
-        with open(output_dir, "w", encoding="utf-8") as f:
-            json.dump(trie.to_dict(), f, indent=4)
-        print(f"Updated Patricia Trie has been saved to {output_dir}")
+        if journal.journaliser(0, output_dir, trie, journal.DELETE, words):
+            print(f"Updated Patricia Trie has been saved to {output_dir}")
+        else:
+            print(f"Deletions have been logged to {journal.log_path(output_dir)}")
     except IOError as e:
         print(f"Error saving Patricia Trie to {output_dir}: {e}")
         sys.exit(1)
@@ -0,0 +1,187 @@
+import os
+import sys
+import json
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+from patricia import (PatriciaTrie, recherche, recherche_many, liste_mots, comptage_mots, prefixe, iter_words, suppression, suppression_many, fusion,
+                     comptage_noeuds, comptage_nil, hauteur, profondeurMoyenne)
+
+# Tests de comportement du Patricia-Trie : python test_patricia.py (ou pytest)
+# Le trie construit mot par mot avec inserer sert de référence : sa forme ne
+# dépend pas de l'ordre d'insertion, to_dict() permet donc de comparer deux tries.
+
+
+def mots_aleatoires(n, seed=0, alphabet="abcd", longueur=6):
+    """n mots aléatoires (doublons et préfixes communs fréquents)"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, longueur))) for _ in range(n)]
+
+def construire(words):
+    trie = PatriciaTrie()
+    for word in words:
+        trie.inserer(word)
+    return trie
+
+def _noeuds(trie):
+    """Tous les nœuds, dans un ordre fixe"""
+    nodes = []
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(child for _, child in node.child_items())
+    return nodes
+
+
+def test_inserer_recherche():
+    words = mots_aleatoires(300)
+    trie = construire(words)
+    assert liste_mots(trie) == sorted(set(words))
+    assert comptage_mots(trie) == len(set(words))
+    for word in mots_aleatoires(300, seed=1):
+        assert recherche(trie, word) == (word in words)
+    assert prefixe(trie, "ab") == sum(1 for word in set(words) if word.startswith("ab"))
+
+def test_ordre_insertion_sans_effet():
+    words = mots_aleatoires(300)
+    shuffled = list(words)
+    random.Random(1).shuffle(shuffled)
+    assert construire(shuffled).to_dict() == construire(words).to_dict()
+
+def test_recherche_many():
+    trie = construire(mots_aleatoires(300))
+    queries = mots_aleatoires(300, seed=2) + ["", "a", "abcdabcd"]
+    expected = [recherche(trie, word) for word in queries]
+    assert recherche_many(trie, queries) == expected
+    # Un générateur n'est lu qu'une fois
+    assert recherche_many(trie, (word for word in queries)) == expected
+
+def test_iter_words():
+    words = mots_aleatoires(400) + ["ab", "abc", ""]
+    trie = construire(words)
+    all_words = liste_mots(trie)
+    # « ab » est lui-même un mot, « abca » coupe un label, « x » et « abx » sont absents
+    for prefix in ("", "a", "ab", "abc", "abca", "dd", "x", "abx", None):
+        expected = [word for word in all_words if word.startswith(prefix or "")]
+        for limit in (None, 0, 1, 3, 1000):
+            result = list(iter_words(trie, prefix, limit))
+            assert result == (expected if limit is None else expected[:limit])
+    assert list(iter_words(PatriciaTrie(), "a")) == []
+
+def test_vue_children():
+    trie = construire(mots_aleatoires(300))
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        # Vue copiée en lecture seule, identique aux accès internes
+        assert dict(node.children) == dict(node.child_items())
+        assert len(node.children) == node.child_count()
+        stack.extend(node.child_nodes())
+    try:
+        trie.root.children["x"] = trie.root
+    except TypeError:
+        pass
+    else:
+        assert False, "children doit être en lecture seule"
+
+def test_shards_aller_retour():
+    trie = construire(mots_aleatoires(400, alphabet="abcdefgh") + ["é", "ab" * 2500])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trie.to_shards(tmp_dir)
+        trie.to_shards(tmp_dir)
+        for workers in (1, 2):
+            assert PatriciaTrie.from_shards(tmp_dir, workers=workers).to_dict() == trie.to_dict()
+        partial = PatriciaTrie.from_shards(tmp_dir, prefix="cd")
+        assert prefixe(partial, "cd") == prefixe(trie, "cd")
+        assert liste_mots(partial) == [word for word in liste_mots(trie) if word.startswith("c")]
+
+def test_from_sorted():
+    # Entrée non triée, doublons, mot vide, mots préfixes les uns des autres
+    words = mots_aleatoires(400) + ["", "abcd", "abc", "ab"]
+    assert PatriciaTrie.from_sorted(words).to_dict() == construire(words).to_dict()
+    assert PatriciaTrie.from_sorted(sorted(set(words))).to_dict() == construire(words).to_dict()
+    assert liste_mots(PatriciaTrie.from_sorted([])) == []
+
+def test_suppression_many():
+    words = mots_aleatoires(400) + ["abcd", "abc", "ab"]
+    deleted = mots_aleatoires(250, seed=1) + ["abc", "zz"]
+    expected = construire(set(words) - set(deleted)).to_dict()
+    # En une passe, puis mot par mot : même forme que le trie reconstruit
+    trie = construire(words)
+    suppression_many(trie, iter(deleted))
+    assert trie.to_dict() == expected
+    trie = construire(words)
+    for word in deleted:
+        suppression(trie, word)
+    assert trie.to_dict() == expected
+    # Statistiques recalculées sur le chemin : égales à un recomptage complet
+    trie = PatriciaTrie(stats=True)
+    trie.inserer_many(words)
+    suppression_many(trie, deleted)
+    aggregates = [(node.words, node.leaves, node.depth_sum, node.height, node.size) for node in _noeuds(trie)]
+    trie.enable_stats()
+    assert aggregates == [(node.words, node.leaves, node.depth_sum, node.height, node.size) for node in _noeuds(trie)]
+
+def test_statistiques_inserer_suppression():
+    # inserer / suppression simples avec statistiques, comparé à un trie sans
+    words = mots_aleatoires(500)
+    deleted = mots_aleatoires(250, seed=1) + ["absent", ""]
+    trie = PatriciaTrie(stats=True)
+    plain = PatriciaTrie()
+    for word in words:
+        trie.inserer(word)
+        plain.inserer(word)
+    for word in deleted:
+        suppression(trie, word)
+        suppression(plain, word)
+    aggregates = [(node.words, node.leaves, node.depth_sum, node.height, node.size) for node in _noeuds(trie)]
+    trie.enable_stats()
+    assert aggregates == [(node.words, node.leaves, node.depth_sum, node.height, node.size) for node in _noeuds(trie)]
+    for query in (comptage_mots, comptage_noeuds, comptage_nil, hauteur, profondeurMoyenne):
+        assert query(trie) == query(plain)
+    assert comptage_mots(trie) == len(set(words) - set(deleted))
+    # prefixe en O(|mot|) : comptage brut, préfixe lui-même compris
+    remaining = set(words) - set(deleted)
+    for prefix in ("", "a", "ab", "abc", "dcb", "x") + tuple(mots_aleatoires(50, seed=2)):
+        expected = sum(1 for word in remaining if word.startswith(prefix))
+        assert prefixe(trie, prefix) == prefixe(plain, prefix) == expected
+
+def test_fusion():
+    # Labels égaux, préfixes l'un de l'autre, divergences au milieu d'un label
+    first = mots_aleatoires(300) + ["abcd", "romane", "rom"]
+    second = mots_aleatoires(300, seed=1) + ["abce", "romanus", "romulus", "x"]
+    merged = fusion(construire(first), construire(second))
+    assert merged.to_dict() == construire(first + second).to_dict()
+    assert fusion(construire(first), PatriciaTrie()).to_dict() == construire(first).to_dict()
+    assert fusion(PatriciaTrie(), construire(second)).to_dict() == construire(second).to_dict()
+
+def test_to_json_comme_json_dump():
+    # Caractères à échapper et non ASCII ; le mot long ne fait qu'un label
+    for words in (mots_aleatoires(400) + ['a"b', "a\\b", "été", "\t", "ab" * 2500], []):
+        trie = construire(words)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "pat.json")
+            trie.to_json(path)
+            with open(path, "r", encoding="utf-8") as f:
+                assert f.read() == json.dumps(trie.to_dict(), indent=4)
+            assert PatriciaTrie.from_json(path).to_dict() == trie.to_dict()
+
+def test_from_words_parallel():
+    words = mots_aleatoires(600, alphabet="abcdefgh") + ["é"]
+    expected = construire(words).to_dict()
+    for workers in (1, 2, 3):
+        assert PatriciaTrie.from_words_parallel(words, workers=workers).to_dict() == expected
+    assert liste_mots(PatriciaTrie.from_words_parallel([], workers=2)) == []
+    # Les mots d'un même premier caractère restent dans la même tranche, même après U+10FFFF
+    words = ["a", "b", "c", "c\U0010ffff", "cz", "d"]
+    assert PatriciaTrie.from_words_parallel(words, workers=3).to_dict() == construire(words).to_dict()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,221 @@
+import os
+import sys
+import json
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+sys.path.append(os.path.join(current_dir, "../Frozen_trie"))
+sys.path.append(os.path.join(current_dir, "../Journal"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, fusion, liste_mots, profondeurMoyenne, prefixe
+from frozen_trie import FrozenTrie
+import journal
+import corpus
+
+# Commandes de script.sh exécutées sur des tries gardés en mémoire.
+# Les chemins sont relatifs au dossier de l'appelant (cwd), comme pour les scripts :
+# mêmes fichiers lus, mêmes fichiers de résultat écrits.
+PATRICIA_SNAPSHOT = "Patricia-Tries/result/pat.json"
+HYBRID_SNAPSHOT = "Hybrid_trie/result/trie.json"
+RESULT_DIRS = {0: "Patricia-Tries/result", 1: "Hybrid_trie/result"}
+USAGE = "Commands: inserer, suppression, fusionPat, listeMots, profondeurMoyenne, prefixe, freeze, shard"
+
+
+class CommandError(Exception):
+    """Commande invalide ou impossible (fichier absent, JSON illisible...)"""
+
+
+class TrieStore:
+    """
+    Tries chargés, indexés par le chemin absolu de leur instantané JSON.
+    Un trie n'est relu que si son instantané ou son journal (voir Journal/journal.py)
+    a changé depuis le dernier chargement ou la dernière écriture (date et taille).
+    Si write_through, chaque modification est ajoutée au journal (un trie remplacé
+    en entier est réécrit) ; sinon le trie est marqué « sale » et son instantané
+    réécrit au prochain flush().
+    """
+    def __init__(self, write_through=True):
+        self.write_through = write_through
+        # chemin -> [x, trie, signature des fichiers, sale ?]
+        self._entries = {}
+
+    @staticmethod
+    def _signature(path):
+        signature = []
+        for file_path in (path, journal.log_path(path)):
+            try:
+                stat = os.stat(file_path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def get(self, x, path, missing_ok=False):
+        """Le trie de l'instantané path (0 = Patricia, 1 = hybride), journal rejoué"""
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == x and (entry[3] or entry[2] == self._signature(path)):
+            return entry[1]
+        try:
+            trie = journal.charger(x, path, missing_ok)
+        except FileNotFoundError:
+            raise CommandError(f"File {path} not found.")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise CommandError(f"Error decoding JSON from {path}: {e}")
+        self._entries[path] = [x, trie, self._signature(path), False]
+        return trie
+
+    def modify(self, x, path, op, words, missing_ok=False):
+        """Appliquer l'opération op (journal.INSERT / DELETE) sur words au trie de path"""
+        trie = self.get(x, path, missing_ok)
+        entry = self._entries[path]
+        if self.write_through and not entry[3]:
+            journal.journaliser(x, path, trie, op, words)
+            entry[2] = self._signature(path)
+        else:
+            journal.appliquer(x, trie, op, words)
+            entry[3] = True
+        return trie
+
+    def put(self, x, path, trie):
+        """Remplacer (ou créer) le trie de l'instantané path"""
+        self._entries[path] = [x, trie, None, True]
+        if self.write_through:
+            self._write(path)
+
+    def forget(self, path):
+        """Oublier le trie de path (après une fusion qui l'a vidé)"""
+        self._entries.pop(path, None)
+
+    def _write(self, path):
+        journal.sauvegarder(path, self._entries[path][1])
+        self._entries[path][2:] = [self._signature(path), False]
+
+    def flush(self):
+        """Écrire les instantanés modifiés (journaux repliés) ; retourne leurs chemins"""
+        dirty = [path for path, entry in self._entries.items() if entry[3]]
+        for path in dirty:
+            self._write(path)
+        return dirty
+
+    def loaded(self):
+        """Couples (chemin, x) des tries en mémoire"""
+        return [(path, entry[0]) for path, entry in self._entries.items()]
+
+
+def _read_words(path):
+    # Un fichier de mots déjà lu (même date, même taille) vient du cache de corpus
+    try:
+        return corpus.mots(path, lower=False)
+    except FileNotFoundError:
+        raise CommandError(f"Error: File {path} not found.")
+
+def _write_result(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _saved(store, output):
+    if store.write_through:
+        return f"saved to {output}"
+    return f"kept in memory for {output} (written at the next flush)"
+
+
+def executer(store, cwd, args):
+    """
+    Exécuter une commande de script.sh (args = ses arguments) dans le dossier cwd.
+    Retourne les lignes à afficher ; lève CommandError en cas d'erreur.
+    """
+    if len(args) < 3:
+        raise CommandError("Usage: <command> <x> <file> [additional_args...]\n" + USAGE)
+    command = args[0]
+
+    def here(path):
+        return os.path.normpath(os.path.join(cwd, path))
+
+    if command == "fusionPat":
+        first, second = here(args[1]), here(args[2])
+        output = here(PATRICIA_SNAPSHOT)
+        trie1 = store.get(0, first)
+        trie2 = store.get(0, second)
+        # La fusion modifie trie1 et vide trie2 : leurs fichiers ne les décrivent plus
+        store.flush()
+        merged = fusion(trie1, trie2)
+        store.forget(first)
+        store.forget(second)
+        store.put(0, output, merged)
+        return [f"Merged trie holds {len(liste_mots(merged))} words", f"Fused Patricia Trie {_saved(store, output)}"]
+
+    if args[1] not in ("0", "1"):
+        raise CommandError("Error: x must be 0 or 1")
+    x = int(args[1])
+    file = here(args[2])
+    result_dir = here(RESULT_DIRS[x])
+
+    if command == "inserer":
+        words = _read_words(file)
+        if x == 0:
+            # Comme patricia_inserer.py : le trie est reconstruit à partir du fichier
+            trie = PatriciaTrie()
+            trie.inserer_many(words)
+            output = here(PATRICIA_SNAPSHOT)
+            store.put(0, output, trie)
+        else:
+            # Comme trie_inserer.py : les mots s'ajoutent au trie existant
+            output = here(HYBRID_SNAPSHOT)
+            store.modify(1, output, journal.INSERT, words, missing_ok=True)
+        return [f"Inserted {len(words)} words from {file}; trie {_saved(store, output)}"]
+
+    if command == "suppression":
+        words = _read_words(file)
+        output = here(PATRICIA_SNAPSHOT if x == 0 else HYBRID_SNAPSHOT)
+        store.modify(x, output, journal.DELETE, words, missing_ok=x == 1)
+        return [f"Deleted words from {file}; updated trie {_saved(store, output)}"]
+
+    if command == "listeMots":
+        trie = store.get(x, file)
+        words = liste_mots(trie) if x == 0 else trie.liste_mots()
+        output = os.path.join(result_dir, "mot.txt")
+        _write_result(output, "".join(word + "\n" for word in words))
+        return [f"Word list has been saved to {output}"]
+
+    if command == "profondeurMoyenne":
+        trie = store.get(x, file)
+        if x == 0:
+            average_depth, text = profondeurMoyenne(trie), "{}"
+        else:
+            average_depth, text = trie.profondeur_moyenne(), "{}\n"
+        output = os.path.join(result_dir, "profondeur.txt")
+        _write_result(output, text.format(average_depth))
+        return [f"Average depth ({average_depth}) has been saved to {output}"]
+
+    if command == "prefixe":
+        if len(args) < 4:
+            raise CommandError("Usage: prefixe <x> <file.json> <prefix>")
+        prefix = args[3]
+        if FrozenTrie.is_frozen(file):
+            with FrozenTrie(file) as frozen:
+                prefix_count = frozen.prefixe(prefix)
+                if x == 1:
+                    # Même convention que HybridTrie.prefixe : le préfixe lui-même n'est pas compté
+                    prefix_count -= frozen.recherche(prefix)
+        else:
+            trie = store.get(x, file)
+            prefix_count = prefixe(trie, prefix) if x == 0 else trie.prefixe(prefix)
+        output = os.path.join(result_dir, "prefixe.txt")
+        _write_result(output, f"{prefix_count}" if x == 0 else f"{prefix_count}\n")
+        return [f"Prefix count ({prefix_count}) has been saved to {output}"]
+
+    if command == "freeze":
+        output = here(args[3]) if len(args) > 3 else os.path.splitext(file)[0] + ".frz"
+        FrozenTrie.compile(store.get(x, file), output)
+        return [f"Frozen trie has been saved to {output}"]
+
+    if command == "shard":
+        output = here(args[3]) if len(args) > 3 else os.path.splitext(file)[0] + ".shards"
+        store.get(x, file).to_shards(output)
+        return [f"Sharded snapshot has been saved to {output}"]
+
+    raise CommandError(f"Error: Unknown command {command}\n" + USAGE)
@@ -0,0 +1,144 @@
+import os
+import sys
+import socket
+import tempfile
+import threading
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+from commandes import TrieStore, CommandError, executer, PATRICIA_SNAPSHOT, HYBRID_SNAPSHOT
+from trie_server import TrieServer
+import journal
+from patricia import PatriciaTrie
+
+# Tests des commandes du serveur résident : python test_commandes.py (ou pytest)
+# Chaque test travaille dans un dossier temporaire qui tient lieu de racine du dépôt.
+
+WORDS = ["car", "cart", "carte", "cat", "dog", "do", "zebra"]
+
+
+def ecrire(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def lire(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def executer_ok(store, cwd, *args):
+    return executer(store, cwd, list(args))
+
+def executer_erreur(store, cwd, *args):
+    """Message de la CommandError levée par la commande"""
+    try:
+        executer(store, cwd, list(args))
+    except CommandError as e:
+        return str(e)
+    assert False, f"{args} aurait dû échouer"
+
+
+def test_inserer_puis_prefixe():
+    with tempfile.TemporaryDirectory() as cwd:
+        ecrire(os.path.join(cwd, "words.txt"), "\n".join(WORDS))
+        store = TrieStore()
+        for x, snapshot, expected in ((0, PATRICIA_SNAPSHOT, "3"), (1, HYBRID_SNAPSHOT, "2\n")):
+            executer_ok(store, cwd, "inserer", str(x), "words.txt")
+            # Écriture immédiate (write_through) : instantané pour Patricia, journal pour l'hybride
+            assert os.path.exists(os.path.join(cwd, snapshot)) or os.path.exists(
+                journal.log_path(os.path.join(cwd, snapshot)))
+            executer_ok(store, cwd, "prefixe", str(x), snapshot, "car")
+            # Patricia compte le préfixe lui-même, HybridTrie.prefixe non
+            result_dir = "Patricia-Tries/result" if x == 0 else "Hybrid_trie/result"
+            assert lire(os.path.join(cwd, result_dir, "prefixe.txt")) == expected
+            executer_ok(store, cwd, "listeMots", str(x), snapshot)
+            assert lire(os.path.join(cwd, result_dir, "mot.txt")).split() == sorted(WORDS)
+
+def test_rechargement_apres_modification_externe():
+    with tempfile.TemporaryDirectory() as cwd:
+        ecrire(os.path.join(cwd, "words.txt"), "\n".join(WORDS))
+        store = TrieStore()
+        executer_ok(store, cwd, "inserer", "0", "words.txt")
+        snapshot = os.path.join(cwd, PATRICIA_SNAPSHOT)
+        result = os.path.join(cwd, "Patricia-Tries/result/prefixe.txt")
+
+        # Instantané réécrit par un autre processus
+        other = PatriciaTrie()
+        other.inserer_many(["cab", "cabin", "cable"])
+        journal.sauvegarder(snapshot, other)
+        executer_ok(store, cwd, "prefixe", "0", PATRICIA_SNAPSHOT, "ca")
+        assert lire(result) == "3"
+
+        # Journal complété par un autre processus
+        with open(journal.log_path(snapshot), "a", encoding="utf-8") as f:
+            f.write("+cat\n-cab\n+dog\n")
+        executer_ok(store, cwd, "prefixe", "0", PATRICIA_SNAPSHOT, "ca")
+        assert lire(result) == "3"
+        executer_ok(store, cwd, "listeMots", "0", PATRICIA_SNAPSHOT)
+        assert lire(os.path.join(cwd, "Patricia-Tries/result/mot.txt")).split() == ["cabin", "cable", "cat", "dog"]
+
+def test_commande_inconnue_et_fichier_absent():
+    with tempfile.TemporaryDirectory() as cwd:
+        store = TrieStore()
+        assert executer_erreur(store, cwd, "trier", "0", "pat.json").startswith("Error: Unknown command trier")
+        assert executer_erreur(store, cwd, "listeMots", "2", "pat.json") == "Error: x must be 0 or 1"
+        assert executer_erreur(store, cwd, "listeMots", "0").startswith("Usage:")
+        assert "absent.json not found" in executer_erreur(store, cwd, "listeMots", "0", "absent.json")
+        assert "absent.txt not found" in executer_erreur(store, cwd, "inserer", "1", "absent.txt")
+        ecrire(os.path.join(cwd, "bad.json"), "{")
+        assert executer_erreur(store, cwd, "listeMots", "0", "bad.json").startswith("Error decoding JSON")
+        # Aucun trie gardé en mémoire après une erreur
+        assert store.loaded() == []
+
+def test_mode_lazy_flush():
+    with tempfile.TemporaryDirectory() as cwd:
+        ecrire(os.path.join(cwd, "words.txt"), "\n".join(WORDS))
+        ecrire(os.path.join(cwd, "delete.txt"), "cart\ndog")
+        store = TrieStore(write_through=False)
+        executer_ok(store, cwd, "inserer", "1", "words.txt")
+        executer_ok(store, cwd, "suppression", "1", "delete.txt")
+        snapshot = os.path.join(cwd, HYBRID_SNAPSHOT)
+        assert not os.path.exists(snapshot) and not os.path.exists(journal.log_path(snapshot))
+        assert store.flush() == [snapshot]
+        assert store.flush() == []
+        assert journal.charger(1, snapshot).liste_mots() == sorted(set(WORDS) - {"cart", "dog"})
+
+def test_reponses_du_serveur():
+    with tempfile.TemporaryDirectory() as cwd:
+        ecrire(os.path.join(cwd, "words.txt"), "\n".join(WORDS))
+        socket_path = os.path.join(cwd, "trie.sock")
+        server = TrieServer(socket_path)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+
+        def requete(*args):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(socket_path)
+                client.sendall(("\t".join((cwd,) + args) + "\n").encode("utf-8"))
+                client.shutdown(socket.SHUT_WR)
+                data = b""
+                while True:
+                    chunk = client.recv(4096)
+                    if not chunk:
+                        return data.decode("utf-8").splitlines()
+                    data += chunk
+
+        try:
+            reply = requete("inserer", "0", "words.txt")
+            assert reply[-1] == "ok" and reply[0].startswith("out Inserted 7 words")
+            assert requete("status") == ["out 0 " + os.path.join(cwd, PATRICIA_SNAPSHOT), "ok"]
+            reply = requete("trier", "0", "pat.json")
+            assert len(reply) == 1 and reply[0].startswith("err Error: Unknown command trier | Commands:")
+            assert requete("listeMots", "0", "absent.json") == [
+                "err File " + os.path.join(cwd, "absent.json") + " not found."]
+            assert requete("shutdown")[-2:] == ["out Server stopped", "ok"]
+        finally:
+            thread.join(5)
+            server.server_close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
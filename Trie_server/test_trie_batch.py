@@ -0,0 +1,128 @@
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+from commandes import TrieStore, PATRICIA_SNAPSHOT, HYBRID_SNAPSHOT
+from trie_batch import lire_commandes, executer_lot, main
+import journal
+from patricia import liste_mots
+
+# Tests du lanceur de commandes groupées : python test_trie_batch.py (ou pytest)
+
+WORDS = ["car", "cart", "carte", "cat", "dog", "do", "zebra"]
+
+
+def ecrire(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def preparer(cwd):
+    ecrire(os.path.join(cwd, "words.txt"), "\n".join(WORDS))
+    ecrire(os.path.join(cwd, "delete.txt"), "cart\ndog")
+
+
+class CountingStore(TrieStore):
+    """TrieStore qui compte les écritures d'instantanés"""
+    def __init__(self, write_through=True):
+        super().__init__(write_through)
+        self.writes = []
+
+    def _write(self, path):
+        self.writes.append(path)
+        super()._write(path)
+
+
+def test_lire_commandes():
+    lines = [
+        "# nightly\n",
+        "\n",
+        "./script.sh inserer 0 words.txt\n",
+        "   \n",
+        "script.sh prefixe 0 'Patricia-Tries/result/pat.json' c  # compter\n",
+        "listeMots 0 pat.json\n",
+        "./script.sh\n",
+    ]
+    assert lire_commandes(lines) == [
+        (3, ["inserer", "0", "words.txt"]),
+        (5, ["prefixe", "0", "Patricia-Tries/result/pat.json", "c"]),
+        (6, ["listeMots", "0", "pat.json"]),
+    ]
+
+def test_keep_going():
+    with tempfile.TemporaryDirectory() as cwd:
+        preparer(cwd)
+        commands = lire_commandes([
+            "inserer 0 words.txt",
+            "suppression 0 absent.txt",
+            "trier 0 pat.json",
+            "prefixe 0 Patricia-Tries/result/pat.json ca",
+        ])
+        with redirect_stdout(io.StringIO()) as out:
+            assert executer_lot(TrieStore(write_through=False), cwd, commands) == 1
+        assert "Error (line 2)" in out.getvalue() and "line 3" not in out.getvalue()
+        assert not os.path.exists(os.path.join(cwd, "Patricia-Tries/result/prefixe.txt"))
+
+        with redirect_stdout(io.StringIO()) as out:
+            assert executer_lot(TrieStore(write_through=False), cwd, commands, keep_going=True) == 2
+        assert "Error (line 2)" in out.getvalue() and "Error (line 3)" in out.getvalue()
+        with open(os.path.join(cwd, "Patricia-Tries/result/prefixe.txt"), encoding="utf-8") as f:
+            assert f.read() == "4"
+
+def test_un_seul_flush_a_la_fin():
+    with tempfile.TemporaryDirectory() as cwd:
+        preparer(cwd)
+        commands = lire_commandes([
+            "inserer 0 words.txt",
+            "suppression 0 delete.txt",
+            "inserer 1 words.txt",
+            "suppression 1 delete.txt",
+            "prefixe 0 Patricia-Tries/result/pat.json ca",
+        ])
+        store = CountingStore(write_through=False)
+        with redirect_stdout(io.StringIO()):
+            assert executer_lot(store, cwd, commands) == 0
+        # Rien n'est écrit pendant le lot
+        patricia_path = os.path.join(cwd, PATRICIA_SNAPSHOT)
+        hybrid_path = os.path.join(cwd, HYBRID_SNAPSHOT)
+        assert store.writes == []
+        assert not os.path.exists(patricia_path) and not os.path.exists(hybrid_path)
+
+        store.flush()
+        assert sorted(store.writes) == sorted([patricia_path, hybrid_path])
+        expected = sorted(set(WORDS) - {"cart", "dog"})
+        assert liste_mots(journal.charger(0, patricia_path)) == expected
+        assert journal.charger(1, hybrid_path).liste_mots() == expected
+        assert not os.path.exists(journal.log_path(hybrid_path))
+
+def test_main_ecrit_les_instantanes_meme_apres_une_erreur():
+    with tempfile.TemporaryDirectory() as cwd:
+        preparer(cwd)
+        ecrire(os.path.join(cwd, "batch.txt"), "inserer 1 words.txt\nsuppression 1 absent.txt\nlisteMots 1 x.json\n")
+        previous_dir, previous_argv = os.getcwd(), sys.argv
+        try:
+            os.chdir(cwd)
+            sys.argv = ["trie_batch.py", "batch.txt"]
+            with redirect_stdout(io.StringIO()) as out:
+                try:
+                    main()
+                except SystemExit as e:
+                    assert e.code == 1
+                else:
+                    assert False, "main doit sortir avec le code 1"
+        finally:
+            os.chdir(previous_dir)
+            sys.argv = previous_argv
+        assert out.getvalue().count("Saved ") == 1
+        assert journal.charger(1, os.path.join(cwd, HYBRID_SNAPSHOT)).liste_mots() == sorted(WORDS)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,88 @@
+import os
+import sys
+import shlex
+
+from commandes import TrieStore, CommandError, executer
+
+# Exécuter une suite de commandes de script.sh dans un seul interpréteur.
+# Le fichier de commandes contient une commande par ligne, avec les mêmes arguments
+# que script.sh (« ./script.sh » en tête est accepté) ; lignes vides et commentaires
+# (#) ignorés. Exemple :
+#   inserer 0 Patricia-Tries/test/word.txt
+#   suppression 0 Patricia-Tries/test/words_to_delete.txt
+#   prefixe 0 Patricia-Tries/result/pat.json c
+# Les tries restent en mémoire d'une commande à l'autre : chaque instantané n'est lu
+# qu'une fois, et les instantanés modifiés ne sont écrits qu'une fois, à la fin
+# (ou à une ligne « flush »). Les fichiers de résultat sont ceux de script.sh.
+# Code de sortie : 0 = tout a réussi, 1 = une commande a échoué.
+
+
+def lire_commandes(lines):
+    """Couples (numéro de ligne, arguments) des commandes d'un fichier de commandes"""
+    commands = []
+    for number, line in enumerate(lines, 1):
+        args = shlex.split(line, comments=True)
+        if args and os.path.basename(args[0]) == "script.sh":
+            args = args[1:]
+        if args:
+            commands.append((number, args))
+    return commands
+
+def executer_lot(store, cwd, commands, keep_going=False):
+    """
+    Exécuter les commandes dans l'ordre ; s'arrête à la première erreur sauf si
+    keep_going. Retourne le nombre de commandes en erreur.
+    """
+    failures = 0
+    for number, args in commands:
+        print("Running: " + " ".join(args))
+        try:
+            if args == ["flush"]:
+                lines = [f"Saved {path}" for path in store.flush()]
+            else:
+                lines = executer(store, cwd, args)
+        except CommandError as e:
+            print(f"Error (line {number}): {e}")
+        except Exception as e:
+            print(f"Error (line {number}): {type(e).__name__}: {e}")
+        else:
+            for line in lines:
+                print(line)
+            continue
+        failures += 1
+        if not keep_going:
+            break
+    return failures
+
+
+def main():
+    args = sys.argv[1:]
+    keep_going = "--keep-going" in args
+    args = [arg for arg in args if arg != "--keep-going"]
+    if len(args) != 1:
+        print("Usage: python trie_batch.py <commands.txt | -> [--keep-going]")
+        sys.exit(1)
+
+    try:
+        if args[0] == "-":
+            commands = lire_commandes(sys.stdin)
+        else:
+            with open(args[0], "r", encoding="utf-8") as f:
+                commands = lire_commandes(f)
+    except FileNotFoundError:
+        print(f"Error: File {args[0]} not found.")
+        sys.exit(1)
+    except ValueError as e:
+        # shlex : guillemet non fermé
+        print(f"Error reading {args[0]}: {e}")
+        sys.exit(1)
+
+    store = TrieStore(write_through=False)
+    failures = executer_lot(store, os.getcwd(), commands, keep_going)
+    # Les modifications faites avant une erreur sont écrites, comme avec des appels séparés
+    for path in store.flush():
+        print(f"Saved {path}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import socket
+
+# Client léger du serveur de tries (voir trie_server.py) : envoie ses arguments
+# comme une commande de script.sh et affiche la réponse.
+# Code de sortie : 0 = ok, 1 = erreur de la commande, 3 = aucun serveur joignable.
+DEFAULT_SOCKET = "/tmp/algo_trie.sock"
+UNREACHABLE = 3
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: python trie_client.py <command> [args...]")
+        sys.exit(1)
+    if any("\t" in arg or "\n" in arg for arg in args):
+        print("Error: arguments may not contain tabs or newlines")
+        sys.exit(1)
+    socket_path = os.environ.get("TRIE_SOCKET", DEFAULT_SOCKET)
+
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(socket_path)
+    except OSError:
+        sys.exit(UNREACHABLE)
+
+    with client, client.makefile("rwb") as stream:
+        stream.write(("\t".join([os.getcwd()] + args) + "\n").encode("utf-8"))
+        stream.flush()
+        for raw_line in stream:
+            line = raw_line.decode("utf-8").rstrip("\n")
+            if line.startswith("out "):
+                print(line[4:])
+            elif line == "ok":
+                return
+            else:
+                print("Error: " + line[4:] if line.startswith("err ") else "Error: malformed reply")
+                sys.exit(1)
+    print("Error: connection closed by the server")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import socketserver
+import threading
+
+from commandes import TrieStore, CommandError, executer
+
+# Serveur résident : les tries sont chargés une fois et gardés en mémoire, les
+# commandes de script.sh arrivent par un socket Unix local.
+# Protocole (une requête par connexion, texte UTF-8, champs séparés par des tabulations) :
+#   requête : cwd <TAB> commande <TAB> arg1 <TAB> arg2 ... <LF>
+#   réponse : des lignes « out <texte> », puis « ok » ou « err <message> »
+# Commandes en plus de celles de script.sh : flush (écrire les instantanés modifiés),
+# status (tries en mémoire), shutdown (flush puis arrêt).
+DEFAULT_SOCKET = "/tmp/algo_trie.sock"
+
+
+class TrieRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        fields = self.rfile.readline().decode("utf-8").rstrip("\n").split("\t")
+        try:
+            if len(fields) < 2:
+                raise CommandError("Malformed request")
+            cwd, args = fields[0], fields[1:]
+            lines = self.server.dispatch(cwd, args)
+            for line in lines:
+                for part in str(line).split("\n"):
+                    self.wfile.write(f"out {part}\n".encode("utf-8"))
+            self.wfile.write(b"ok\n")
+        except CommandError as e:
+            self.wfile.write(("err " + str(e).replace("\n", " | ") + "\n").encode("utf-8"))
+        except Exception as e:
+            # Le serveur reste en vie : l'erreur est renvoyée au client
+            self.wfile.write(f"err {type(e).__name__}: {e}\n".encode("utf-8"))
+
+
+class TrieServer(socketserver.UnixStreamServer):
+    """Serveur à un seul fil : les commandes sont exécutées l'une après l'autre"""
+    def __init__(self, socket_path, write_through=True):
+        self.store = TrieStore(write_through)
+        self.socket_path = socket_path
+        super().__init__(socket_path, TrieRequestHandler)
+
+    def dispatch(self, cwd, args):
+        command = args[0]
+        if command == "flush":
+            return [f"Saved {path}" for path in self.store.flush()]
+        if command == "status":
+            return [f"{x} {path}" for path, x in self.store.loaded()]
+        if command == "shutdown":
+            saved = self.store.flush()
+            # shutdown() attend la fin de serve_forever : le lancer depuis un autre fil
+            threading.Thread(target=self.shutdown).start()
+            return [f"Saved {path}" for path in saved] + ["Server stopped"]
+        return executer(self.store, cwd, args)
+
+
+def main():
+    args = sys.argv[1:]
+    write_through = "--lazy" not in args
+    args = [arg for arg in args if arg != "--lazy"]
+    socket_path = args[0] if args else os.environ.get("TRIE_SOCKET", DEFAULT_SOCKET)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = TrieServer(socket_path, write_through)
+    print(f"Trie server listening on {socket_path}" + ("" if write_through else " (lazy snapshots)"))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for path in server.store.flush():
+            print(f"Saved {path}")
+        server.server_close()
+        os.unlink(socket_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import time
+import os
+import json
+import sys
+import random
+
+# Ajouter le chemin du module PatriciaTrie
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, recherche, suppression
+import corpus
+
+# Mesurer inserer / recherche / suppression du Patricia-Trie sur des clés longues
+# (longs préfixes communs) et sur le corpus Shakespeare
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+corpus_words = []
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        corpus_words.extend(corpus.mots(os.path.join(input_folder, filename)))
+
+random.seed(0)
+shared = "".join(random.choice("ab") for _ in range(2000))
+long_keys = [shared + "".join(random.choice("ab") for _ in range(500)) for _ in range(2000)]
+
+
+def measure(words):
+    """Chronométrer les trois opérations et relever les compteurs"""
+    trie = PatriciaTrie()
+
+    start_time = time.time()
+    for word in words:
+        trie.inserer(word)
+    insert_time = time.time() - start_time
+
+    start_time = time.time()
+    for word in words:
+        recherche(trie, word)
+    search_time = time.time() - start_time
+
+    start_time = time.time()
+    for word in words:
+        suppression(trie, word)
+    delete_time = time.time() - start_time
+
+    return {
+        "Word Count": len(words),
+        "Insert Time (seconds)": insert_time,
+        "Search Time (seconds)": search_time,
+        "Delete Time (seconds)": delete_time,
+        "Insert Comparisons": trie.operation_count["insert_comparisons"],
+        "Search Comparisons": trie.operation_count["search_comparisons"],
+        "Delete Comparisons": trie.operation_count["delete_comparisons"],
+    }
+
+
+long_key_results = {}
+for name, words in (("Long Keys", long_keys), ("Shakespeare", corpus_words)):
+    print(f"Measuring {name}...")
+    long_key_results[name] = measure(words)
+
+with open(os.path.join(output_folder, "cles_longues_results.json"), "w") as result_file:
+    json.dump(long_key_results, result_file, indent=4)
+
+print("Long key results saved to result folder.")
@@ -6,7 +6,9 @@ import matplotlib.pyplot as plt
 
 # Ajouter le chemin du module HybridTrie
 sys.path.append("../Hybrid_trie")
+sys.path.append("../Corpus")
 from hybrid_trie import HybridTrie
+import corpus
 
 # Définir les chemins
 input_folder = "./Shakespeare"  # Chemin du dossier contenant les fichiers Shakespeare
@@ -41,60 +43,48 @@ for filename in os.listdir(input_folder):
         file_start_time = time.time()
         word_count = 0
 
-        # Insérer des mots
-        with open(file_path, "r") as file:
-            for line in file:
-                word = line.strip().lower()  # Prétraiter le mot
-                if word:
-                    # Enregistrer le temps d'insertion pour single_patricia
-                    start_time = time.time()
-                    single_trie.insert(word)  # Insérer dans le Patricia Trie pour le fichier actuel
-                    end_time = time.time()
-                    single_patricia_total_time += (end_time - start_time)
-
-                    # Enregistrer le temps d'insertion pour overall_patricia
-                    start_time = time.time()
-                    overall_trie.insert(word)  # Insérer dans le Patricia Trie global
-                    end_time = time.time()
-                    overall_patricia_total_time += (end_time - start_time)
-
-                    word_count += 1
+        # Insérer des mots (fichier lu une seule fois, repris du cache pour la recherche)
+        words = corpus.mots(file_path)
+        for word in words:
+            # Enregistrer le temps d'insertion pour single_patricia
+            start_time = time.time()
+            single_trie.insert(word)  # Insérer dans le Patricia Trie pour le fichier actuel
+            end_time = time.time()
+            single_patricia_total_time += (end_time - start_time)
+
+            # Enregistrer le temps d'insertion pour overall_patricia
+            start_time = time.time()
+            overall_trie.insert(word)  # Insérer dans le Patricia Trie global
+            end_time = time.time()
+            overall_patricia_total_time += (end_time - start_time)
+
+            word_count += 1
         operation_count=single_trie.operation_count
 
         # Test de recherche
-        with open(file_path, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-                    single_trie.recherche(word)
+        for word in words:
+            single_trie.recherche(word)
 
         # Insérer de nouveaux mots et enregistrer le temps
         # Lire les mots de test
-        with open(test_file, "r") as f:
-            test_words = [line.strip().lower() for line in f if line.strip()]
+        test_words = corpus.mots(test_file)
         for word in test_words:
             start_time = time.time()
             single_trie.insert(word)
             end_time = time.time()
             insertion_times= end_time - start_time
         cpt_sup=single_trie.operation_count["delete_comparisons"]
-        with open(test_file, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-                    single_trie.suppression(word)  # Opération de suppression
+        for word in test_words:
+            single_trie.suppression(word)  # Opération de suppression
 
         # Test de suppression avec enregistrement du temps
         single_trie.operation_count["delete_comparisons"]=cpt_sup
         delete_times = []
-        with open(test_file, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-                    start_time = time.time()  # Heure de début
-                    single_trie.suppression(word)  # Opération de suppression
-                    end_time = time.time()  # Heure de fin
-                    delete_times.append(end_time - start_time)  # Enregistrer le temps de suppression
+        for word in test_words:
+            start_time = time.time()  # Heure de début
+            single_trie.suppression(word)  # Opération de suppression
+            end_time = time.time()  # Heure de fin
+            delete_times.append(end_time - start_time)  # Enregistrer le temps de suppression
 
         # Calculer le temps total de suppression
         total_delete_time = sum(delete_times)
@@ -8,6 +8,8 @@ import matplotlib.pyplot as plt
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.join(current_dir, "../Patricia-Tries")
 sys.path.append(parent_dir) #Ajouter le chemin du module
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+import corpus
 
 from patricia import PatriciaTrie, hauteur,recherche, profondeurMoyenne,suppression  # 从 patricia.py 导入所需函数
 
@@ -40,36 +42,30 @@ for filename in os.listdir(input_folder):
         }
         file_start_time = time.time()
         word_count = 0
-#test construire
-        with open(file_path, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-
-                    start_time = time.time()
-                    single_patricia.inserer(word)
-                    end_time = time.time()
-                    single_patricia_total_time += (end_time - start_time)
-
-                    start_time = time.time()
-                    overall_patricia.inserer(word)
-                    end_time = time.time()
-                    overall_patricia_total_time += (end_time - start_time)
-
-                    word_count += 1
+#test construire (mots lus une seule fois, repris du cache pour la recherche)
+        words = corpus.mots(file_path)
+        for word in words:
+
+            start_time = time.time()
+            single_patricia.inserer(word)
+            end_time = time.time()
+            single_patricia_total_time += (end_time - start_time)
+
+            start_time = time.time()
+            overall_patricia.inserer(word)
+            end_time = time.time()
+            overall_patricia_total_time += (end_time - start_time)
+
+            word_count += 1
         operation_count= single_patricia.operation_count
 
         # test recherche
-        with open(file_path, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-                    recherche(single_patricia,word)
+        for word in words:
+            recherche(single_patricia,word)
 
 
         # test insert new word
-        with open(test_file, "r") as f:
-            test_words = [line.strip().lower() for line in f if line.strip()]
+        test_words = corpus.mots(test_file)
 
         for word in test_words:
             start_time = time.time()
@@ -78,22 +74,16 @@ for filename in os.listdir(input_folder):
             insertion_times=end_time - start_time
 
         sup_cpt=single_patricia.operation_count["delete_comparisons"]
-        with open(test_file, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-                    suppression(single_patricia,word)
+        for word in test_words:
+            suppression(single_patricia,word)
         # test suppression
         single_patricia.operation_count["delete_comparisons"]=sup_cpt
         delete_times = []
-        with open(test_file, "r") as file:
-            for line in file:
-                word = line.strip().lower()
-                if word:
-                    start_time = time.time()
-                    suppression(single_patricia, word)
-                    end_time = time.time()
-                    delete_times.append(end_time - start_time)
+        for word in test_words:
+            start_time = time.time()
+            suppression(single_patricia, word)
+            end_time = time.time()
+            delete_times.append(end_time - start_time)
 
         # time of suppression
         total_delete_time = sum(delete_times)
@@ -1,11 +1,12 @@
 import time
 import os
-import json
 import matplotlib.pyplot as plt
 import sys
 import signal
 
 sys.path.append("../Hybrid_trie")  # Remplacer par le chemin réel du fichier hybrid_trie
+sys.path.append("../Corpus")
+import corpus
 from hybrid_trie import HybridTrie
 
 
@@ -30,9 +31,8 @@ def safe_execution(func, *args, timeout=10):
 
 def load_words_from_file(file_path, limit):
     """Charger un nombre spécifié de mots depuis un fichier"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read().split()
-        return content[:limit]
+    # Le fichier est relu pour chaque taille : les mots viennent du cache après la première lecture
+    return corpus.mots(file_path, lower=False)[:limit]
 
 def test_methods(words):
     """Tester toutes les méthodes de Hybrid Trie"""
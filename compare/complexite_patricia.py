@@ -6,6 +6,8 @@ import signal
 
 # Ajouter le chemin du module
 sys.path.append("../Patricia-Tries")
+sys.path.append("../Corpus")
+import corpus
 from patricia import PatriciaTrie, recherche, hauteur, profondeurMoyenne, comptage_mots, liste_mots, comptage_nil, prefixe, suppression
 
 
@@ -28,9 +30,8 @@ def safe_execution(func, *args, timeout=10):
 
 def load_words_from_file(file_path, limit):
     """Lire des mots à partir d'un seul fichier, avec une limite sur le nombre maximal de mots"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read().split()
-        return content[:limit]
+    # Le fichier est relu pour chaque taille : les mots viennent du cache après la première lecture
+    return corpus.mots(file_path, lower=False)[:limit]
 
 def test_methods(words):
     """test tous les methodes"""
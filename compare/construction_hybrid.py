@@ -0,0 +1,61 @@
+import time
+import os
+import json
+import sys
+
+# Ajouter le chemin du module HybridTrie
+sys.path.append("../Hybrid_trie")
+sys.path.append("../Corpus")
+from hybrid_trie import HybridTrie
+import corpus
+
+# Comparer la construction mot par mot (insert), la construction en bloc (from_words)
+# et l'insertion équilibrée (insert_with_balance) d'une liste de mots triée
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+construction_results = {}
+
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        print(f"Processing {filename}...")
+        words = corpus.mots(os.path.join(input_folder, filename))
+
+        # Insertion mot par mot
+        start_time = time.time()
+        inserted_trie = HybridTrie()
+        for word in words:
+            inserted_trie.insert(word)
+        insert_time = time.time() - start_time
+
+        # Construction équilibrée en bloc
+        start_time = time.time()
+        bulk_trie = HybridTrie.from_words(words)
+        bulk_time = time.time() - start_time
+
+        # Insertion équilibrée d'une liste triée (cas défavorable pour insert)
+        sorted_words = sorted(set(words))
+        start_time = time.time()
+        balanced_trie = HybridTrie()
+        for word in sorted_words:
+            balanced_trie.insert_with_balance(word)
+        balanced_time = time.time() - start_time
+
+        construction_results[filename] = {
+            "Word Count": len(words),
+            "Insert Construction Time (seconds)": insert_time,
+            "Bulk Construction Time (seconds)": bulk_time,
+            "Sorted Balanced Insert Time (seconds)": balanced_time,
+            "Insert Height": inserted_trie.hauteur(),
+            "Bulk Height": bulk_trie.hauteur(),
+            "Sorted Balanced Insert Height": balanced_trie.hauteur(),
+            "Insert Average Depth": inserted_trie.profondeur_moyenne(),
+            "Bulk Average Depth": bulk_trie.profondeur_moyenne(),
+            "Sorted Balanced Insert Average Depth": balanced_trie.profondeur_moyenne(),
+        }
+
+with open(os.path.join(output_folder, "construction_results.json"), "w") as result_file:
+    json.dump(construction_results, result_file, indent=4)
+
+print("Construction results saved to result folder.")
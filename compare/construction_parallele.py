@@ -0,0 +1,59 @@
+import time
+import os
+import json
+import sys
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, liste_mots
+from hybrid_trie import HybridTrie
+import corpus
+
+# Comparer la construction du trie global sur un cœur (from_sorted / from_words)
+# et la construction par tranches de premiers caractères sur plusieurs processus
+# (from_words_parallel), pour 1, 2, 4... processus
+input_folder = "./Shakespeare"
+output_folder = "./result"
+
+
+def measure(build, *args):
+    """Construire un trie avec build(*args) et chronométrer"""
+    start_time = time.time()
+    trie = build(*args)
+    return trie, time.time() - start_time
+
+
+# Les processus de ProcessPoolExecutor peuvent réimporter ce script (méthode spawn)
+if __name__ == "__main__":
+    os.makedirs(output_folder, exist_ok=True)
+
+    words = []
+    for filename in sorted(os.listdir(input_folder)):
+        if filename.endswith(".txt"):
+            words.extend(corpus.mots(os.path.join(input_folder, filename)))
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    parallel_results = {"Word Count": len(words), "CPU Count": os.cpu_count()}
+    for name, serial_build, parallel_build, listing in (
+        ("PatriciaTrie", PatriciaTrie.from_sorted, PatriciaTrie.from_words_parallel, liste_mots),
+        ("HybridTrie", HybridTrie.from_words, HybridTrie.from_words_parallel, HybridTrie.liste_mots),
+    ):
+        print(f"Measuring {name}...")
+        serial_trie, serial_time = measure(serial_build, words)
+        expected = listing(serial_trie)
+        results = {"Serial Construction Time (seconds)": serial_time}
+        for workers in worker_counts:
+            parallel_trie, parallel_time = measure(parallel_build, words, workers)
+            if listing(parallel_trie) != expected:
+                print(f"Error: the parallel {name} does not hold the same words.")
+                sys.exit(1)
+            results[f"Parallel Construction Time, {workers} Workers (seconds)"] = parallel_time
+        parallel_results[name] = results
+
+    with open(os.path.join(output_folder, "construction_parallele_results.json"), "w") as result_file:
+        json.dump(parallel_results, result_file, indent=4)
+
+    print("Parallel construction results saved to result folder.")
@@ -0,0 +1,59 @@
+import time
+import os
+import json
+import sys
+
+# Ajouter le chemin du module PatriciaTrie
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie
+import corpus
+
+# Comparer la construction mot par mot (inserer) et la construction en une passe
+# à partir du vocabulaire trié (from_sorted), pièce par pièce puis toutes pièces réunies
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+
+def measure(words):
+    """Construire les deux tries, vérifier qu'ils sont identiques et chronométrer"""
+    start_time = time.time()
+    inserted_trie = PatriciaTrie()
+    for word in words:
+        inserted_trie.inserer(word)
+    insert_time = time.time() - start_time
+
+    start_time = time.time()
+    bulk_trie = PatriciaTrie.from_sorted(words)
+    bulk_time = time.time() - start_time
+
+    if bulk_trie.to_dict() != inserted_trie.to_dict():
+        print("Error: from_sorted does not build the same trie as inserer.")
+        sys.exit(1)
+
+    return {
+        "Word Count": len(words),
+        "Insert Construction Time (seconds)": insert_time,
+        "Bulk Construction Time (seconds)": bulk_time,
+        "Speedup": insert_time / bulk_time if bulk_time else None,
+    }
+
+
+construction_results = {}
+all_words = []
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        print(f"Processing {filename}...")
+        words = corpus.mots(os.path.join(input_folder, filename))
+        all_words.extend(words)
+        construction_results[filename] = measure(words)
+
+print("Processing all plays combined...")
+construction_results["All Plays"] = measure(all_words)
+
+with open(os.path.join(output_folder, "construction_patricia_results.json"), "w") as result_file:
+    json.dump(construction_results, result_file, indent=4)
+
+print("Construction results saved to result folder.")
@@ -0,0 +1,68 @@
+import time
+import os
+import json
+import sys
+
+# Ajouter le chemin du module PatriciaTrie
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, fusion, recherche, comptage_mots, comptage_noeuds
+import corpus
+
+# Fusionner les Patricia-Tries de toutes les pièces en un seul trie global,
+# et comparer avec la construction directe par insertion de tous les mots
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+play_tries = []
+all_words = []
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        file_path = os.path.join(input_folder, filename)
+        trie = PatriciaTrie()
+        corpus.remplir(trie, file_path)
+        play_tries.append(trie)
+        all_words.extend(corpus.mots(file_path))
+play_count = len(play_tries)
+play_nodes = sum(comptage_noeuds(trie) for trie in play_tries)
+
+print(f"Merging {play_count} play tries...")
+start_time = time.time()
+merged_trie = PatriciaTrie()
+for trie in play_tries:
+    fusion(merged_trie, trie)
+fusion_time = time.time() - start_time
+
+print("Inserting all words into one trie...")
+start_time = time.time()
+inserted_trie = PatriciaTrie()
+for word in all_words:
+    inserted_trie.inserer(word)
+insert_time = time.time() - start_time
+
+if merged_trie.to_dict() != inserted_trie.to_dict():
+    print("Error: the merged trie differs from the trie built by insertion.")
+    sys.exit(1)
+
+start_time = time.time()
+missing = sum(1 for word in all_words if not recherche(merged_trie, word))
+search_time = time.time() - start_time
+
+fusion_results = {
+    "Play Count": play_count,
+    "Nodes in Play Tries": play_nodes,
+    "Word Count": len(all_words),
+    "Distinct Words": comptage_mots(merged_trie),
+    "Merged Node Count": comptage_noeuds(merged_trie),
+    "Fusion Time (seconds)": fusion_time,
+    "Insert Construction Time (seconds)": insert_time,
+    "Search Time on Merged Trie (seconds)": search_time,
+    "Words Not Found": missing,
+}
+
+with open(os.path.join(output_folder, "fusion_patricia_results.json"), "w") as result_file:
+    json.dump(fusion_results, result_file, indent=4)
+
+print("Fusion results saved to result folder.")
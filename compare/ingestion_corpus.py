@@ -0,0 +1,88 @@
+import time
+import os
+import json
+import sys
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, liste_mots
+from hybrid_trie import HybridTrie
+import corpus
+
+# Comparer la lecture ligne par ligne (strip().lower() par mot) avec la lecture par
+# blocs projetés en mémoire de corpus.py, puis une seconde passe servie par le cache ;
+# et l'insertion mot par mot avec l'insertion groupée (remplir) dans les deux tries
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+file_paths = [
+    os.path.join(input_folder, filename)
+    for filename in sorted(os.listdir(input_folder))
+    if filename.endswith(".txt")
+]
+
+
+def read_lines(file_path):
+    with open(file_path, "r") as file:
+        return [line.strip().lower() for line in file if line.strip()]
+
+
+print("Reading the corpus...")
+start_time = time.time()
+line_words = [read_lines(file_path) for file_path in file_paths]
+line_time = time.time() - start_time
+
+corpus.oublier()
+start_time = time.time()
+mmap_words = [corpus.mots(file_path) for file_path in file_paths]
+mmap_time = time.time() - start_time
+
+start_time = time.time()
+cached_words = [corpus.mots(file_path) for file_path in file_paths]
+cached_time = time.time() - start_time
+
+if [list(words) for words in mmap_words] != line_words or cached_words != mmap_words:
+    print("Error: corpus.mots does not read the same words as the line reader.")
+    sys.exit(1)
+
+ingestion_results = {
+    "Word Count": sum(len(words) for words in line_words),
+    "Line Read Time (seconds)": line_time,
+    "Mmap Read Time (seconds)": mmap_time,
+    "Cached Read Time (seconds)": cached_time,
+}
+
+for name, trie_class, insert, words_of in (
+    ("Patricia", PatriciaTrie, PatriciaTrie.inserer, liste_mots),
+    ("Hybrid", HybridTrie, HybridTrie.insert, HybridTrie.liste_mots),
+):
+    print(f"Filling {name} Trie...")
+    start_time = time.time()
+    inserted_trie = trie_class()
+    for words in line_words:
+        for word in words:
+            insert(inserted_trie, word)
+    insert_time = time.time() - start_time
+
+    # Lots servis par le cache : seule l'insertion groupée est mesurée
+    start_time = time.time()
+    batched_trie = trie_class()
+    for file_path in file_paths:
+        corpus.remplir(batched_trie, file_path)
+    batch_time = time.time() - start_time
+
+    if words_of(batched_trie) != words_of(inserted_trie):
+        print(f"Error: remplir does not insert the same words into the {name} Trie.")
+        sys.exit(1)
+
+    ingestion_results[f"{name} Insert Time (seconds)"] = insert_time
+    ingestion_results[f"{name} Batched Insert Time (seconds)"] = batch_time
+
+with open(os.path.join(output_folder, "ingestion_results.json"), "w") as result_file:
+    json.dump(ingestion_results, result_file, indent=4)
+
+print("Ingestion results saved to result folder.")
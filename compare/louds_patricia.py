@@ -0,0 +1,120 @@
+import gc
+import os
+import json
+import sys
+import time
+import tracemalloc
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Frozen_trie"))
+sys.path.append(os.path.join(current_dir, "../Dawg"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, recherche, prefixe
+from louds_trie import LoudsTrie
+import dawg
+import corpus
+
+# Comparer le PatriciaTrie, son export succinct (LOUDS) et l'automate minimal (DAWG) :
+# mémoire et temps de requête
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+words = []
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        words.extend(corpus.mots(os.path.join(input_folder, filename)))
+vocabulary = sorted(set(words))
+prefixes = sorted(set(word[:2] for word in vocabulary))
+
+
+def retained_memory(build):
+    """Mémoire retenue par l'objet construit par build()"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+print("Measuring PatriciaTrie...")
+patricia_trie, patricia_memory = retained_memory(lambda: PatriciaTrie.from_sorted(vocabulary))
+print("Measuring LoudsTrie...")
+louds_trie, louds_memory = retained_memory(lambda: LoudsTrie.from_patricia(patricia_trie))
+print("Measuring Dawg...")
+start_time = time.time()
+dawg_automaton, dawg_memory = retained_memory(lambda: dawg.Dawg.from_sorted(vocabulary))
+dawg_build_time = time.time() - start_time
+
+if louds_trie.liste_mots() != vocabulary:
+    print("Error: the LOUDS export does not list the same words.")
+    sys.exit(1)
+if dawg.liste_mots(dawg_automaton) != vocabulary:
+    print("Error: the DAWG does not list the same words.")
+    sys.exit(1)
+
+start_time = time.time()
+for word in vocabulary:
+    recherche(patricia_trie, word)
+patricia_search_time = time.time() - start_time
+
+start_time = time.time()
+for word in vocabulary:
+    louds_trie.recherche(word)
+louds_search_time = time.time() - start_time
+
+start_time = time.time()
+for prefix in prefixes:
+    prefixe(patricia_trie, prefix)
+patricia_prefix_time = time.time() - start_time
+
+start_time = time.time()
+for prefix in prefixes:
+    louds_trie.prefixe(prefix)
+louds_prefix_time = time.time() - start_time
+
+start_time = time.time()
+for word in vocabulary:
+    dawg.recherche(dawg_automaton, word)
+dawg_search_time = time.time() - start_time
+
+start_time = time.time()
+for prefix in prefixes:
+    dawg.prefixe(dawg_automaton, prefix)
+dawg_prefix_time = time.time() - start_time
+
+louds_results = {
+    "Distinct Words": len(vocabulary),
+    "Node Count": louds_trie.node_count,
+    "PatriciaTrie": {
+        "Memory (bytes)": patricia_memory,
+        "Bytes per Word": patricia_memory / len(vocabulary),
+        "Search Time (seconds)": patricia_search_time,
+        "Prefix Count Time (seconds)": patricia_prefix_time,
+    },
+    "LoudsTrie": {
+        "Memory (bytes)": louds_memory,
+        "Encoded Size (bytes)": louds_trie.nbytes(),
+        "Bytes per Word": louds_memory / len(vocabulary),
+        "Search Time (seconds)": louds_search_time,
+        "Prefix Count Time (seconds)": louds_prefix_time,
+    },
+    "Dawg": {
+        "State Count": dawg.comptage_noeuds(dawg_automaton),
+        "Transition Count": dawg.comptage_transitions(dawg_automaton),
+        "Memory (bytes)": dawg_memory,
+        "Bytes per Word": dawg_memory / len(vocabulary),
+        "Build Time (seconds)": dawg_build_time,
+        "Search Time (seconds)": dawg_search_time,
+        "Prefix Count Time (seconds)": dawg_prefix_time,
+    },
+}
+
+with open(os.path.join(output_folder, "louds_results.json"), "w") as result_file:
+    json.dump(louds_results, result_file, indent=4)
+
+print("LOUDS and DAWG results saved to result folder.")
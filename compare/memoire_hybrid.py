@@ -0,0 +1,96 @@
+import os
+import json
+import sys
+import time
+import tracemalloc
+
+# Ajouter le chemin du module HybridTrie
+sys.path.append("../Hybrid_trie")
+sys.path.append("../Corpus")
+from hybrid_trie import HybridTrie
+from hybrid_trie_compact import CompactHybridTrie
+import corpus
+
+# Définir les chemins
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+# Lire tout le vocabulaire
+words = []
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        words.extend(corpus.mots(os.path.join(input_folder, filename)))
+distinct_words = len(set(words))
+
+
+# Disposition d'origine des nœuds (avant __slots__) : la ligne « avant » du tableau
+class BaselineNode:
+    def __init__(self, char=None, is_end_of_word=False):
+        self.char = char
+        self.is_end_of_word = is_end_of_word
+        self.left = None
+        self.middle = None
+        self.right = None
+
+class BaselineHybridTrie:
+    """Même forme que HybridTrie.insert, avec des nœuds à __dict__"""
+    def __init__(self):
+        self.root = None
+
+    def insert(self, word):
+        if not word:
+            return
+        if self.root is None:
+            self.root = BaselineNode(word[0])
+        node = self.root
+        index = 0
+        while True:
+            char = word[index]
+            if char < node.char:
+                if node.left is None:
+                    node.left = BaselineNode(char)
+                node = node.left
+            elif char > node.char:
+                if node.right is None:
+                    node.right = BaselineNode(char)
+                node = node.right
+            elif index + 1 == len(word):
+                node.is_end_of_word = True
+                return
+            else:
+                index += 1
+                if node.middle is None:
+                    node.middle = BaselineNode(word[index])
+                node = node.middle
+
+
+def measure(trie_class):
+    """Construire un trie avec tous les mots et mesurer la mémoire retenue"""
+    tracemalloc.start()
+    start_time = time.time()
+    trie = trie_class()
+    for word in words:
+        trie.insert(word)
+    construction_time = time.time() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "Construction Time (seconds)": construction_time,
+        "Memory (bytes)": current,
+        "Peak Memory (bytes)": peak,
+        "Bytes per Word": current / distinct_words,
+    }
+
+
+memory_results = {"Distinct Words": distinct_words}
+for name, trie_class in (("HybridTrie (baseline layout)", BaselineHybridTrie),
+                         ("HybridTrie", HybridTrie), ("CompactHybridTrie", CompactHybridTrie)):
+    print(f"Measuring {name}...")
+    memory_results[name] = measure(trie_class)
+    print(f"  {memory_results[name]['Bytes per Word']:.1f} bytes per word")
+
+with open(os.path.join(output_folder, "memory_results.json"), "w") as memory_file:
+    json.dump(memory_results, memory_file, indent=4)
+
+print("Memory results saved to result folder.")
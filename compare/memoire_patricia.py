@@ -0,0 +1,104 @@
+import os
+import json
+import gc
+import sys
+import time
+import tracemalloc
+
+# Ajouter le chemin du module PatriciaTrie
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, comptage_noeuds, find_mots_prefix
+import corpus
+
+# Définir les chemins
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+# Lire tout le vocabulaire
+words = []
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        words.extend(corpus.mots(os.path.join(input_folder, filename)))
+distinct_words = len(set(words))
+
+
+# Disposition d'origine des nœuds (avant __slots__) : la ligne « avant » du tableau
+class BaselineNode:
+    def __init__(self, label=""):
+        self.label = label
+        self.children = {}
+
+class BaselinePatriciaTrie:
+    """Insertion d'origine : un nœud à __dict__ et un dict d'enfants par nœud, même pour les feuilles"""
+    end_marker = PatriciaTrie.end_marker
+
+    def __init__(self):
+        self.root = BaselineNode()
+
+    def inserer(self, mot):
+        mot += self.end_marker
+        node = self.root
+        while mot:
+            child = node.children.get(mot[0])
+            if child is None:
+                node.children[mot[0]] = BaselineNode(mot)
+                return
+            prefix = find_mots_prefix(mot, child.label)
+            if prefix != child.label:
+                # Correspondance partielle, diviser le nœud
+                rest = child.label[len(prefix):]
+                new_node = BaselineNode(prefix)
+                new_node.children[rest[0]] = child
+                child.label = rest
+                node.children[prefix[0]] = new_node
+                child = new_node
+            node = child
+            mot = mot[len(prefix):]
+
+def compter_noeuds_baseline(trie):
+    count = 0
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children.values())
+    return count
+
+
+def measure(make_trie, count_nodes):
+    """Construire un Patricia-Trie avec tous les mots et mesurer la mémoire retenue"""
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.time()
+    trie = make_trie()
+    for word in words:
+        trie.inserer(word)
+    construction_time = time.time() - start_time
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "Node Count": count_nodes(trie),
+        "Construction Time (seconds)": construction_time,
+        "Memory (bytes)": current,
+        "Peak Memory (bytes)": peak,
+        "Bytes per Word": current / distinct_words,
+    }
+
+
+memory_results = {"Distinct Words": distinct_words}
+for name, make_trie, count_nodes in (
+        ("PatriciaTrie (baseline layout)", BaselinePatriciaTrie, compter_noeuds_baseline),
+        ("PatriciaTrie", PatriciaTrie, comptage_noeuds),
+        ("PatriciaTrie (stats)", lambda: PatriciaTrie(stats=True), comptage_noeuds)):
+    print(f"Measuring {name}...")
+    memory_results[name] = measure(make_trie, count_nodes)
+    print(f"  {memory_results[name]['Bytes per Word']:.1f} bytes per word")
+
+with open(os.path.join(output_folder, "memory_patricia_results.json"), "w") as memory_file:
+    json.dump(memory_results, memory_file, indent=4)
+
+print("Memory results saved to result folder.")
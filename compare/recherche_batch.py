@@ -0,0 +1,62 @@
+import time
+import os
+import json
+import sys
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from hybrid_trie import HybridTrie
+from patricia import PatriciaTrie, recherche, recherche_many
+import corpus
+
+# Comparer la recherche mot par mot et la recherche groupée (recherche_many)
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+search_results = {}
+
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        print(f"Processing {filename}...")
+        words = corpus.mots(os.path.join(input_folder, filename))
+
+        hybrid_trie = HybridTrie()
+        patricia_trie = PatriciaTrie()
+        for word in words:
+            hybrid_trie.insert(word)
+            patricia_trie.inserer(word)
+
+        start_time = time.time()
+        for word in words:
+            hybrid_trie.recherche(word)
+        hybrid_single_time = time.time() - start_time
+
+        start_time = time.time()
+        hybrid_trie.recherche_many(words)
+        hybrid_batch_time = time.time() - start_time
+
+        start_time = time.time()
+        for word in words:
+            recherche(patricia_trie, word)
+        patricia_single_time = time.time() - start_time
+
+        start_time = time.time()
+        recherche_many(patricia_trie, words)
+        patricia_batch_time = time.time() - start_time
+
+        search_results[filename] = {
+            "Word Count": len(words),
+            "Hybrid Search Time (seconds)": hybrid_single_time,
+            "Hybrid Batch Search Time (seconds)": hybrid_batch_time,
+            "Patricia Search Time (seconds)": patricia_single_time,
+            "Patricia Batch Search Time (seconds)": patricia_batch_time,
+        }
+
+with open(os.path.join(output_folder, "recherche_batch_results.json"), "w") as result_file:
+    json.dump(search_results, result_file, indent=4)
+
+print("Batch search results saved to result folder.")
@@ -0,0 +1,56 @@
+import time
+import os
+import json
+import sys
+import tempfile
+
+# Ajouter le chemin du module HybridTrie
+sys.path.append("../Hybrid_trie")
+sys.path.append("../Corpus")
+from hybrid_trie import HybridTrie
+import corpus
+
+# Comparer les instantanés JSON (to_json / from_json) et binaires (to_binary / from_binary)
+input_folder = "./Shakespeare"
+output_folder = "./result"
+os.makedirs(output_folder, exist_ok=True)
+
+print("Constructing Hybrid Trie...")
+trie = HybridTrie()
+for filename in sorted(os.listdir(input_folder)):
+    if filename.endswith(".txt"):
+        for word in corpus.mots(os.path.join(input_folder, filename)):
+            trie.insert(word)
+word_count = len(trie.liste_mots())
+
+snapshot_results = {"Distinct Words": word_count}
+with tempfile.TemporaryDirectory() as tmp_dir:
+    for name, save, load, file_name in (
+        ("JSON", trie.to_json, HybridTrie.from_json, "trie.json"),
+        ("Binary", trie.to_binary, HybridTrie.from_binary, "trie.bin"),
+    ):
+        print(f"Measuring {name} snapshot...")
+        file_path = os.path.join(tmp_dir, file_name)
+
+        start_time = time.time()
+        save(file_path)
+        save_time = time.time() - start_time
+
+        start_time = time.time()
+        loaded_trie = load(file_path)
+        load_time = time.time() - start_time
+
+        if loaded_trie.liste_mots() != trie.liste_mots():
+            print(f"Error: {name} snapshot does not restore the same words.")
+            sys.exit(1)
+
+        snapshot_results[name] = {
+            "File Size (bytes)": os.path.getsize(file_path),
+            "Save Time (seconds)": save_time,
+            "Load Time (seconds)": load_time,
+        }
+
+with open(os.path.join(output_folder, "snapshot_results.json"), "w") as result_file:
+    json.dump(snapshot_results, result_file, indent=4)
+
+print("Snapshot results saved to result folder.")
@@ -0,0 +1,96 @@
+import time
+import os
+import json
+import sys
+import tempfile
+
+# Ajouter les chemins des modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, "../Patricia-Tries"))
+sys.path.append(os.path.join(current_dir, "../Hybrid_trie"))
+sys.path.append(os.path.join(current_dir, "../Corpus"))
+from patricia import PatriciaTrie, liste_mots, prefixe
+from hybrid_trie import HybridTrie
+import corpus
+
+# Comparer l'instantané JSON d'un seul fichier (to_json / from_json) avec l'instantané
+# partagé (to_shards / from_shards) : chargement complet sur un puis plusieurs
+# processus, et chargement de la seule branche utile à une requête de préfixe
+input_folder = "./Shakespeare"
+output_folder = "./result"
+prefix = "ca"
+os.makedirs(output_folder, exist_ok=True)
+
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+if __name__ == "__main__":
+    words = []
+    for filename in sorted(os.listdir(input_folder)):
+        if filename.endswith(".txt"):
+            words.extend(corpus.mots(os.path.join(input_folder, filename)))
+
+    print("Constructing both tries...")
+    patricia_trie = PatriciaTrie()
+    patricia_trie.inserer_many(words)
+    hybrid_trie = HybridTrie()
+    for word in words:
+        hybrid_trie.insert(word)
+
+    workers = max(2, os.cpu_count() or 1)
+    shard_results = {"Distinct Words": len(set(words)), "CPU Count": os.cpu_count(), "Prefix": prefix}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, trie, trie_class, words_of, count_prefix in (
+            ("Patricia", patricia_trie, PatriciaTrie, liste_mots, prefixe),
+            ("Hybrid", hybrid_trie, HybridTrie, HybridTrie.liste_mots, HybridTrie.prefixe),
+        ):
+            print(f"Measuring {name} snapshots...")
+            file_path = os.path.join(tmp_dir, f"{name}.json")
+            shard_dir = os.path.join(tmp_dir, f"{name}.shards")
+            expected = words_of(trie)
+
+            start_time = time.time()
+            trie.to_json(file_path)
+            save_time = time.time() - start_time
+            start_time = time.time()
+            loaded_trie = trie_class.from_json(file_path)
+            load_time = time.time() - start_time
+
+            start_time = time.time()
+            trie.to_shards(shard_dir)
+            shard_save_time = time.time() - start_time
+
+            shard_load_times = {}
+            for worker_count in (1, workers):
+                start_time = time.time()
+                loaded_trie = trie_class.from_shards(shard_dir, workers=worker_count)
+                shard_load_times[worker_count] = time.time() - start_time
+                if words_of(loaded_trie) != expected:
+                    print(f"Error: sharded {name} snapshot does not restore the same words.")
+                    sys.exit(1)
+
+            start_time = time.time()
+            prefix_trie = trie_class.from_shards(shard_dir, prefix=prefix)
+            prefix_load_time = time.time() - start_time
+            if count_prefix(prefix_trie, prefix) != count_prefix(trie, prefix):
+                print(f"Error: prefix-only load of the {name} snapshot gives another count.")
+                sys.exit(1)
+
+            shard_results[name] = {
+                "Shard Count": len(os.listdir(shard_dir)) - 1,
+                "File Size (bytes)": os.path.getsize(file_path),
+                "Sharded Size (bytes)": directory_size(shard_dir),
+                "Save Time (seconds)": save_time,
+                "Sharded Save Time (seconds)": shard_save_time,
+                "Load Time (seconds)": load_time,
+                "Sharded Load Time, 1 Process (seconds)": shard_load_times[1],
+                f"Sharded Load Time, {workers} Processes (seconds)": shard_load_times[workers],
+                "Prefix-Only Load Time (seconds)": prefix_load_time,
+            }
+
+    with open(os.path.join(output_folder, "snapshot_shards_results.json"), "w") as result_file:
+        json.dump(shard_results, result_file, indent=4)
+
+    print("Sharded snapshot results saved to result folder.")
@@ -14,11 +14,36 @@
 #./script.sh profondeurMoyenne 1 Hybrid_trie/result/annexes.json
 #./script.sh prefixe 1 Hybrid_trie/result/annexes.json ca
 
+# ./script.sh freeze 0 Patricia-Tries/result/pat.json          (-> Patricia-Tries/result/pat.frz)
+# ./script.sh prefixe 0 Patricia-Tries/result/pat.frz c
+# ./script.sh shard 0 Patricia-Tries/result/pat.json           (-> Patricia-Tries/result/pat.shards/，每个顶层分支一个文件)
+# ./script.sh prefixe 0 Patricia-Tries/result/pat.shards c     (只读取前缀所在的分支)
+
+# python3 Trie_server/trie_server.py [socket] [--lazy]   (常驻服务器，之后的命令通过套接字发送)
+# ./script.sh flush / status / shutdown                  (仅在服务器运行时可用)
+# ./script.sh batch commands.txt [--keep-going]          (在同一个 Python 进程中依次执行文件中的命令，结束时统一保存)
+
+
+# 批处理：文件中的所有命令在同一个解释器中执行
+if [ "$1" = "batch" ]; then
+    shift
+    python3 Trie_server/trie_batch.py "$@"
+    exit $?
+fi
+
+# 如果常驻服务器在运行，则把命令发给它（客户端返回 3 表示无法连接，继续按原方式执行）
+if [ -S "${TRIE_SOCKET:-/tmp/algo_trie.sock}" ]; then
+    python3 Trie_server/trie_client.py "$@"
+    status=$?
+    if [ "$status" -ne 3 ]; then
+        exit $status
+    fi
+fi
 
 # 检查参数数量是否正确
 if [ "$#" -lt 3 ]; then
     echo "Usage: $0 <command> <x> <file> [additional_args...]"
-    echo "Commands: inserer, suppression, fusion, listeMots, profondeurMoyenne, prefixe"
+    echo "Commands: inserer, suppression, fusion, listeMots, profondeurMoyenne, prefixe, freeze, shard"
     exit 1
 fi
 command=$1  # 动作名称（如 inserer, suppression, fusion）
@@ -81,9 +106,17 @@ case $command in
         echo "Running: python3 ${script_prefix}_prefixe.py $file $prefix $@"
         python3 "${script_prefix}_prefixe.py" "$file" "$prefix" "$@"
         ;;
+    freeze)
+        echo "Running: python3 Frozen_trie/frozen_compile.py $x $file $@"
+        python3 "Frozen_trie/frozen_compile.py" "$x" "$file" "$@"
+        ;;
+    shard)
+        echo "Running: python3 Journal/snapshot_shards.py $x $file $@"
+        python3 "Journal/snapshot_shards.py" "$x" "$file" "$@"
+        ;;
     *)
         echo "Error: Unknown command $command"
-        echo "Commands: inserer, suppression, fusion, listeMots, profondeurMoyenne, prefixe"
+        echo "Commands: inserer, suppression, fusion, listeMots, profondeurMoyenne, prefixe, freeze, shard"
         exit 1
         ;;
 esac